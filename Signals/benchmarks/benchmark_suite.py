@@ -0,0 +1,404 @@
+"""
+Benchmark suite: wall time, memory and scaling of the reconstruction stack.
+
+Every case is run over a range of problem sizes n. For each (case, n) the
+suite records the best wall time over a few repeats, the tracemalloc peak
+of one extra run, and the peak RSS of the process that ran it (each
+measurement runs in its own forked child unless --no-isolate is given).
+Per case a scaling exponent p is fitted to time ~ n^p by least squares in
+log-log space, and larger sizes are skipped once the fitted curve predicts
+they would exceed --budget seconds.
+
+Factorization caches are cleared before every timed run, so SVD-based
+methods are measured cold; --warm measures them with the SVD cached.
+
+Usage (from Signals/):
+
+    python benchmarks/benchmark_suite.py run --output baseline.json
+    python benchmarks/benchmark_suite.py run --sizes 128 256 512 --cases tikhonov tsvd
+    python benchmarks/benchmark_suite.py compare baseline.json current.json --threshold 0.25
+    python benchmarks/benchmark_suite.py run --output current.json --compare baseline.json
+
+``compare`` exits with status 1 when any shared (case, n) is slower than the
+baseline by more than the threshold. Everything runs offline on the CPU.
+
+    python benchmarks/benchmark_suite.py imports --budget-ms 50
+
+``imports`` guards worker startup: each module in HOT_IMPORTS is imported in
+a fresh interpreter after numpy, and the check fails (status 1) when one
+takes longer than the budget or pulls in a module from HEAVY_MODULES.
+"""
+
+import argparse
+import json
+import math
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'diagnostics'))
+
+from forward_models.blur_operator import blur_convolution, blur_matrix
+from forward_models.test_problems import prescribed_spectrum
+from evaluation.comparison import compare_methods
+from pipeline.dataset import forward
+from reconstruction import pseudoinverse, tikhonov, tsvd, nsit, fnsit, cgls
+from reconstruction.factorization import clear_cache
+from reconstruction.learned import LearnedTikhonov
+from signal_generation.random_signals import random_signals
+from l_curve import l_curve
+from picard_plot import picard_data
+from svd_analysis import condition_number
+
+
+DEFAULT_SIZES = (128, 256, 512, 1024, 2048, 4096, 8192)
+NOISE = 0.01
+
+# Modules a reconstruction worker imports, and what they must not drag in
+HOT_IMPORTS = (
+    'forward_models.blur_operator',
+    'noise_models.noise',
+    'signal_generation.generate_signals',
+    'reconstruction.tikhonov',
+    'reconstruction.tsvd',
+    'reconstruction.nsit',
+    'reconstruction.fnsit',
+    'evaluation.error_metrics',
+    'evaluation.comparison',
+)
+HEAVY_MODULES = ('matplotlib', 'scipy', 'pandas')
+# Import time allowed per hot module, after numpy
+IMPORT_BUDGET_MS = 50.0
+
+
+def _problem(n: int):
+    """Blurred piecewise-smooth signal with 1% Gaussian noise."""
+    t = np.linspace(0.0, 1.0, n)
+    x = np.sin(2 * np.pi * t) + (t > 0.5)
+    A = blur_matrix(n, 2.0)
+    y0 = A @ x
+    rng = np.random.default_rng(0)
+    y = y0 + NOISE * np.linalg.norm(y0) / np.sqrt(n) * rng.standard_normal(n)
+    return A, x, y
+
+
+def _nsit_case(schedule):
+    def setup(n):
+        A, _, y = _problem(n)
+        return lambda: nsit.nsit_with_morozov(A, y, NOISE, schedule_type=schedule, store_every=None)
+    return setup
+
+
+def _setup_blur_matrix(n):
+    return lambda: blur_matrix(n, 2.0)
+
+
+def _setup_pseudoinverse(n):
+    A, _, y = _problem(n)
+    return lambda: pseudoinverse.reconstruct(A, y)
+
+
+def _setup_tikhonov(n):
+    A, _, y = _problem(n)
+    return lambda: tikhonov.reconstruct(A, y, 1e-2)
+
+
+def _setup_tsvd(n):
+    A, _, y = _problem(n)
+    return lambda: tsvd.reconstruct(A, y, max(1, n // 8))
+
+
+def _setup_fnsit(n):
+    A, _, y = _problem(n)
+    return lambda: fnsit.fnsit_reconstruct(A, y, 1.0, 0.8, 50, 1.0, NOISE, inner_solver='cg')
+
+
+def _setup_cgls_path(n):
+    _, _, y = _problem(n)
+    A = blur_convolution(n, 2.0)
+    return lambda: cgls.tikhonov_path(A, y, np.geomspace(1.0, 1e-3, 50))
+
+
+def _setup_factored(n):
+    # Known SVD in fast transforms: no factorization at any n
+    A = prescribed_spectrum(n, condition=1e6, seed=0)
+    x = np.sin(2 * np.pi * np.linspace(0.0, 1.0, n))
+    y = A @ x
+
+    def run():
+        tikhonov.reconstruct(A, y, 'gcv')
+        tsvd.reconstruct(A, y, max(1, n // 8))
+        nsit.nsit_with_morozov(A, y, NOISE, store_every=None)
+    return run
+
+
+def _setup_dataset_chunk(n):
+    # One chunk of 1024 random signals, forward-modeled
+    A = blur_matrix(n, 2.0).astype(np.float32)
+    rng = np.random.default_rng(0)
+    return lambda: forward(A, random_signals(1024, n, rng, np.float32))
+
+
+def _setup_learned_filter(n):
+    # One streaming pass over 4096 training pairs, then the learned filter
+    A = blur_matrix(n, 2.0)
+    rng = np.random.default_rng(0)
+    X = random_signals(4096, n, rng)
+    Y = forward(A, X)
+    Y += NOISE * np.linalg.norm(Y, axis=1, keepdims=True) / np.sqrt(n) * rng.standard_normal(Y.shape)
+    return lambda: LearnedTikhonov(A).fit(X, Y, batch_size=1024).lambdas
+
+
+def _setup_diagnostics(n):
+    A, _, y = _problem(n)
+    lambdas = np.logspace(-4, 0, 50)
+
+    def run():
+        picard_data(A, y)
+        l_curve(A, y, lambdas)
+        condition_number(A)
+    return run
+
+
+def _setup_compare_methods(n):
+    A, x, y = _problem(n)
+    lambdas = np.logspace(-4, 0, 5)
+    ks = np.linspace(1, n // 2, 5).astype(int)
+    return lambda: compare_methods(A, y, x, lambdas, ks, noise_level=NOISE)
+
+
+CASES = {
+    'blur_matrix': _setup_blur_matrix,
+    'pseudoinverse': _setup_pseudoinverse,
+    'tikhonov': _setup_tikhonov,
+    'tsvd': _setup_tsvd,
+    'nsit_sqrt': _nsit_case('sqrt'),
+    'nsit_linear': _nsit_case('linear'),
+    'nsit_exp': _nsit_case('exp'),
+    'nsit_power': _nsit_case('power'),
+    'fnsit': _setup_fnsit,
+    'cgls_path': _setup_cgls_path,
+    'factored': _setup_factored,
+    'dataset_chunk': _setup_dataset_chunk,
+    'learned_filter': _setup_learned_filter,
+    'diagnostics': _setup_diagnostics,
+    'compare_methods': _setup_compare_methods,
+}
+
+
+def measure(case: str, n: int, repeats: int = 3, warm: bool = False) -> dict:
+    """Best-of-``repeats`` wall time, tracemalloc peak and peak RSS of one case."""
+    fn = CASES[case](n)
+    fn()  # untimed first call: page faults, lazy imports
+    times = []
+    for _ in range(repeats):
+        if not warm:
+            clear_cache()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    if not warm:
+        clear_cache()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': min(times),
+        'tracemalloc_peak_mb': peak / 2**20,
+        # ru_maxrss is in kilobytes on Linux
+        'rss_peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _measure_isolated(case: str, n: int, repeats: int, warm: bool) -> dict:
+    with ProcessPoolExecutor(1, mp_context=get_context('fork')) as pool:
+        return pool.submit(measure, case, n, repeats, warm).result()
+
+
+def scaling_exponent(sizes, seconds) -> float:
+    """Least-squares slope of log(time) against log(n); NaN with fewer than two sizes."""
+    if len(sizes) < 2:
+        return math.nan
+    slope, _ = np.polyfit(np.log(sizes), np.log(seconds), 1)
+    return float(slope)
+
+
+def run_suite(cases, sizes, repeats: int = 3, warm: bool = False, budget: float = 60.0,
+              isolate: bool = True, log=print) -> dict:
+    """Run every case over ``sizes``; returns the JSON-ready report."""
+    results = {}
+    exponents = {}
+    for case in cases:
+        results[case] = {}
+        done_n, done_t = [], []
+        for n in sorted(sizes):
+            # Skip sizes the fitted curve says would blow the budget
+            if len(done_n) >= 2:
+                p = scaling_exponent(done_n, done_t)
+                predicted = done_t[-1] * (n / done_n[-1]) ** max(p, 1.0)
+                if predicted > budget:
+                    log(f"{case:<16} n={n:<6} skipped (predicted {predicted:.1f}s > budget)")
+                    continue
+            runner = _measure_isolated if isolate else measure
+            entry = runner(case, n, repeats, warm)
+            results[case][str(n)] = entry
+            done_n.append(n)
+            done_t.append(max(entry['seconds'], 1e-9))
+            log(f"{case:<16} n={n:<6} {entry['seconds']:10.4f}s "
+                f"tracemalloc {entry['tracemalloc_peak_mb']:8.1f} MB  rss {entry['rss_peak_mb']:8.1f} MB")
+        exponents[case] = scaling_exponent(done_n, done_t)
+        log(f"{case:<16} scaling exponent {exponents[case]:.2f}")
+
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'repeats': repeats,
+            'warm': warm,
+        },
+        'results': results,
+        'exponents': exponents,
+    }
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = 0.25) -> list:
+    """
+    Per shared (case, n): baseline and current time and their ratio.
+
+    A row is flagged 'regression' when current > (1 + threshold) * baseline.
+    """
+    rows = []
+    for case, by_size in current['results'].items():
+        for n, entry in by_size.items():
+            old = baseline.get('results', {}).get(case, {}).get(n)
+            if old is None:
+                continue
+            ratio = entry['seconds'] / max(old['seconds'], 1e-12)
+            rows.append({
+                'case': case,
+                'n': int(n),
+                'baseline_seconds': old['seconds'],
+                'current_seconds': entry['seconds'],
+                'ratio': ratio,
+                'regression': ratio > 1.0 + threshold,
+            })
+    return rows
+
+
+def _print_comparison(rows: list, threshold: float) -> bool:
+    regressed = False
+    for row in rows:
+        flag = 'SLOWER' if row['regression'] else ''
+        regressed |= row['regression']
+        print(f"{row['case']:<16} n={row['n']:<6} {row['baseline_seconds']:10.4f}s -> "
+              f"{row['current_seconds']:10.4f}s  x{row['ratio']:.2f} {flag}")
+    print(f"{sum(r['regression'] for r in rows)} of {len(rows)} measurements slower "
+          f"than baseline by more than {threshold:.0%}")
+    return regressed
+
+
+_IMPORT_PROBE = """
+import sys, time, numpy
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(elapsed, ','.join(heavy))
+"""
+
+
+def import_times(modules=HOT_IMPORTS, repeats: int = 5) -> dict:
+    """
+    Best-of-``repeats`` import time (ms) of each module in a fresh interpreter.
+
+    numpy is imported first and not counted: it is the floor every worker
+    pays. Also reports which HEAVY_MODULES the import loaded.
+    """
+    env = {'PYTHONPATH': f"{ROOT / 'src'}:{ROOT / 'diagnostics'}", 'PATH': ''}
+    results = {}
+    for module in modules:
+        code = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        best, heavy = math.inf, ''
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                                 capture_output=True, text=True).stdout.split(' ')
+            best = min(best, float(out[0]) * 1e3)
+            heavy = out[1].strip()
+        results[module] = {'ms': best, 'heavy': heavy.split(',') if heavy else []}
+    return results
+
+
+def _print_import_check(results: dict, budget_ms: float) -> bool:
+    failed = False
+    for module, entry in results.items():
+        slow = entry['ms'] > budget_ms
+        failed |= slow or bool(entry['heavy'])
+        flag = ('SLOW ' if slow else '') + ' '.join(entry['heavy'])
+        print(f"{module:<36} {entry['ms']:8.1f} ms  {flag}")
+    print(f"import budget {budget_ms:.0f} ms (after numpy): {'FAILED' if failed else 'ok'}")
+    return failed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='run the benchmarks')
+    run.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    run.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    run.add_argument('--repeats', type=int, default=3)
+    run.add_argument('--budget', type=float, default=60.0,
+                     help='skip sizes predicted to take longer than this many seconds')
+    run.add_argument('--warm', action='store_true', help='time with the SVD already cached')
+    run.add_argument('--no-isolate', action='store_true',
+                     help='measure in this process (RSS is then cumulative)')
+    run.add_argument('--output', help='write the report to this JSON file')
+    run.add_argument('--compare', metavar='BASELINE', help='compare against a baseline JSON')
+    run.add_argument('--threshold', type=float, default=0.25)
+
+    cmp = sub.add_parser('compare', help='compare two reports')
+    cmp.add_argument('baseline')
+    cmp.add_argument('current')
+    cmp.add_argument('--threshold', type=float, default=0.25)
+
+    imp = sub.add_parser('imports', help='check worker import time')
+    imp.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    imp.add_argument('--repeats', type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.command == 'imports':
+        return int(_print_import_check(import_times(repeats=args.repeats), args.budget_ms))
+    if args.command == 'compare':
+        baseline = json.loads(Path(args.baseline).read_text())
+        current = json.loads(Path(args.current).read_text())
+        return int(_print_comparison(compare_reports(baseline, current, args.threshold), args.threshold))
+
+    report = run_suite(args.cases, args.sizes, args.repeats, args.warm, args.budget,
+                       isolate=not args.no_isolate)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        return int(_print_comparison(compare_reports(baseline, report, args.threshold), args.threshold))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
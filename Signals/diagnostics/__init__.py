@@ -0,0 +1,25 @@
+"""
+Spectral diagnostics: singular values, condition numbers, Picard plot
+and L-curve.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'condition_number',
+    'l_curve',
+    'picard_plot',
+    'svd_analysis',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
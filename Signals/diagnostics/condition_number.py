@@ -1,4 +1,7 @@
-from svd_analysis import singular_values, condition_number
+if __package__:
+    from .svd_analysis import singular_values, condition_number
+else:
+    from svd_analysis import singular_values, condition_number
 
 # Re-export for convenience
 __all__ = ['singular_values', 'condition_number']
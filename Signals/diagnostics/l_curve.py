@@ -1,16 +1,19 @@
 import numpy as np
-from numpy.linalg import svd, norm
-from reconstruction.spectral_filters import tikhonov_filter
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from reconstruction import factored, fourier
+from reconstruction.parameter_choice import spectral_data, tikhonov_curves
 
 
 def l_curve(A: np.ndarray, y: np.ndarray, lambdas: np.ndarray):
-    """Compute L-curve data (residual and solution norms) for regularization parameter selection."""
-    U, s, Vt = svd(A, full_matrices=False)
-    residual_norms = []
-    solution_norms = []
-    for lam in lambdas:
-        filt = tikhonov_filter(s, lam)
-        x_hat = (Vt.T * filt) @ (U.T @ y)
-        residual_norms.append(norm(A @ x_hat - y))
-        solution_norms.append(norm(x_hat))
-    return np.array(residual_norms), np.array(solution_norms)
+    """Compute L-curve data (residual and solution norms) for regularization parameter selection.
+
+    Norms come from the singular values and U^T y, O(n) per lambda.
+    """
+    if isinstance(A, CirculantOperator):
+        return fourier.l_curve(A, y, lambdas)
+    if isinstance(A, FactoredOperator):
+        return factored.l_curve(A, y, lambdas)
+    s, c, perp2 = spectral_data(A, y)
+    curves = tikhonov_curves(s, c, lambdas, perp2)
+    return curves['residual_norm'], curves['solution_norm']
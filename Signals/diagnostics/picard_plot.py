@@ -1,9 +1,21 @@
 import numpy as np
-from numpy.linalg import svd
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from reconstruction import factored, fourier
+from reconstruction.partial_svd import truncated_svd
 
 
-def picard_data(A: np.ndarray, y: np.ndarray):
-    """Compute Picard plot data: singular values and Fourier coefficients |U^T y|."""
-    U, s, _ = svd(A, full_matrices=False)
+def picard_data(A: np.ndarray, y: np.ndarray, k: int | None = None):
+    """Compute Picard plot data: singular values and Fourier coefficients |U^T y|.
+
+    With ``k`` only the leading k singular triplets are computed.
+    """
+    if isinstance(A, CirculantOperator):
+        s, uy = fourier.picard_data(A, y)
+        return s[:k], uy[:k]
+    if isinstance(A, FactoredOperator):
+        s, uy = factored.picard_data(A, y)
+        return s[:k], uy[:k]
+    U, s, _ = truncated_svd(A, min(A.shape) if k is None else k)
     uy = np.abs(U.T @ y)
-    return s, uy
+    return s.copy(), uy
@@ -1,12 +1,33 @@
 import numpy as np
-from numpy.linalg import svd
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from reconstruction import factored, fourier
+from reconstruction.factorization import fingerprint, get_cache
+from reconstruction.partial_svd import FULL_SVD_MAX, estimate_condition, truncated_svd
 
 
-def singular_values(A: np.ndarray) -> np.ndarray:
-    _, s, _ = svd(A, full_matrices=False)
-    return s
+def singular_values(A: np.ndarray, k: int | None = None) -> np.ndarray:
+    """Singular values of A in decreasing order; only the leading k if given."""
+    if isinstance(A, CirculantOperator):
+        return fourier.spectrum(A)[0][:k]
+    if isinstance(A, FactoredOperator):
+        return factored.spectrum(A)[0][:k]
+    _, s, _ = truncated_svd(A, min(A.shape) if k is None else k)
+    return s.copy()
 
 
-def condition_number(A: np.ndarray) -> float:
+def condition_number(A: np.ndarray, method: str = 'auto') -> float:
+    """s_max / s_min: 'exact' from the SVD, 'estimate' by power/inverse iteration.
+
+    'auto' is exact for small or already factored operators and estimates
+    otherwise.
+    """
+    if method == 'auto':
+        small = isinstance(A, (CirculantOperator, FactoredOperator)) or min(A.shape) <= FULL_SVD_MAX
+        method = 'exact' if small or get_cache().contains(fingerprint(A)) else 'estimate'
+    if method == 'estimate':
+        return estimate_condition(A)
+    if method != 'exact':
+        raise ValueError("method must be 'auto', 'exact' or 'estimate'")
     s = singular_values(A)
     return float(s[0] / s[-1])
@@ -0,0 +1,25 @@
+"""
+Error metrics, parameter grids and method comparisons.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'comparison',
+    'error_metrics',
+    'grid',
+    'noise_sensitivity',
+    'precision_report',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
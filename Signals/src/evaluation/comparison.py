@@ -1,7 +1,64 @@
 import numpy as np
 from typing import Dict, List, Optional
-from reconstruction import pseudoinverse, tikhonov, tsvd, nsit
-from evaluation.error_metrics import mse, psnr, relative_error
+from evaluation.grid import execute_grid
+
+
+_METRICS = ("mse", "psnr", "rel_error")
+_NSIT_FIELDS = ("iterations", "converged", "final_residual", "final_alpha")
+
+
+def _grid_tasks(tikh_lambdas, tsvd_ks, nsit_alpha_inits, nsit_strategies,
+                nsit_max_iters, noise_level, tau) -> List[dict]:
+    tasks = [{"method": "pseudoinverse"}]
+    tasks += [{"method": "tikhonov", "lambda": float(lam)} for lam in tikh_lambdas]
+    tasks += [{"method": "tsvd", "k": int(k)} for k in tsvd_ks]
+    for alpha_init in nsit_alpha_inits:
+        for strategy in nsit_strategies:
+            tasks.append({
+                "method": "nsit",
+                "alpha_0": alpha_init,
+                "schedule_type": strategy,
+                "max_iter": nsit_max_iters,
+                "noise_level": noise_level,
+                "tau": tau,
+            })
+    return tasks
+
+
+def _collect(rows: List[dict], detailed: bool, return_solutions: bool) -> Dict:
+    """Regroup grid rows into the per-method result layout."""
+    results = {
+        "pseudoinverse": {},
+        "tikhonov": [],
+        "tsvd": [],
+        "nsit": [],
+    }
+
+    for row in rows:
+        entry = {}
+        method = row["method"]
+        if method == "tikhonov":
+            entry["lambda"] = row["lambda"]
+        elif method == "tsvd":
+            entry["k"] = row["k"]
+        elif method == "nsit":
+            if detailed:
+                entry["alpha_init"] = row["alpha_0"]
+            entry["strategy"] = row["schedule_type"]
+        entry.update({name: row[name] for name in _METRICS})
+        if method == "nsit":
+            entry.update({name: row[name] for name in _NSIT_FIELDS})
+            if detailed:
+                entry["history"] = row["history"]
+        if return_solutions:
+            entry["solution"] = row["solution"]
+
+        if method == "pseudoinverse":
+            results["pseudoinverse"] = entry
+        else:
+            results[method].append(entry)
+
+    return results
 
 
 def compare_methods(
@@ -12,13 +69,16 @@ def compare_methods(
     tsvd_ks: List[int],
     nsit_strategies: Optional[List[str]] = None,
     nsit_max_iters: int = 50,
+    noise_level: float = 0.01,
+    executor: str = "serial",
+    max_workers: Optional[int] = None,
 ) -> Dict:
     """
     Compare multiple regularization methods.
-    
+
     Parameters
     ----------
-    A : np.ndarray
+    A : np.ndarray or LinearOperator
         Forward operator
     y : np.ndarray
         Measurements
@@ -29,74 +89,28 @@ def compare_methods(
     tsvd_ks : list
         TSVD truncation values to test
     nsit_strategies : list, optional
-        NSIT parameter adaptation strategies to test
+        NSIT schedule types to test ('sqrt', 'linear', 'exp', 'power')
     nsit_max_iters : int
         Maximum iterations for NSIT
-        
+    noise_level : float
+        Relative noise level δ for NSIT's Morozov stopping
+    executor : str
+        'serial', 'thread' or 'process' (see evaluation.grid)
+    max_workers : int, optional
+        Worker pool size
+
     Returns
     -------
     results : dict
         Comprehensive comparison results
     """
     if nsit_strategies is None:
-        nsit_strategies = ["residual_norm", "hybrid"]
-    
-    results = {
-        "pseudoinverse": {},
-        "tikhonov": [],
-        "tsvd": [],
-        "nsit": [],
-    }
-    
-    # Pseudoinverse baseline
-    x_pinv = pseudoinverse.reconstruct(A, y)
-    results["pseudoinverse"] = {
-        "mse": mse(x_true, x_pinv),
-        "psnr": psnr(x_true, x_pinv),
-        "rel_error": relative_error(x_true, x_pinv),
-    }
-    
-    # Tikhonov with different lambdas
-    for lam in tikh_lambdas:
-        x_hat = tikhonov.reconstruct(A, y, lam)
-        results["tikhonov"].append({
-            "lambda": float(lam),
-            "mse": mse(x_true, x_hat),
-            "psnr": psnr(x_true, x_hat),
-            "rel_error": relative_error(x_true, x_hat),
-        })
-    
-    # TSVD with different truncation values
-    for k in tsvd_ks:
-        x_hat = tsvd.reconstruct(A, y, k)
-        results["tsvd"].append({
-            "k": int(k),
-            "mse": mse(x_true, x_hat),
-            "psnr": psnr(x_true, x_hat),
-            "rel_error": relative_error(x_true, x_hat),
-        })
-    
-    # NSIT with different strategies
-    for strategy in nsit_strategies:
-        x_hat, history = nsit.reconstruct(
-            A,
-            y,
-            alpha_strategy=strategy,
-            max_iters=nsit_max_iters,
-            verbose=False,
-        )
-        results["nsit"].append({
-            "strategy": strategy,
-            "mse": mse(x_true, x_hat),
-            "psnr": psnr(x_true, x_hat),
-            "rel_error": relative_error(x_true, x_hat),
-            "iterations": history["iterations"],
-            "converged": history["converged"],
-            "final_residual": history["residual_norms"][-1],
-            "final_alpha": history["alphas"][-1],
-        })
-    
-    return results
+        nsit_strategies = ["sqrt", "exp"]
+
+    tasks = _grid_tasks(tikh_lambdas, tsvd_ks, [None], nsit_strategies,
+                        nsit_max_iters, noise_level, 1.0)
+    rows = execute_grid(A, y, x_true, tasks, executor=executor, max_workers=max_workers)
+    return _collect(rows, detailed=False, return_solutions=False)
 
 
 def compare_methods_extended(
@@ -109,13 +123,17 @@ def compare_methods_extended(
     nsit_strategies: Optional[List[str]] = None,
     nsit_max_iters: int = 50,
     return_solutions: bool = False,
+    noise_level: float = 0.01,
+    tau: float = 1.0,
+    executor: str = "serial",
+    max_workers: Optional[int] = None,
 ) -> Dict:
     """
     Extended comparison with detailed NSIT analysis.
-    
+
     Parameters
     ----------
-    A : np.ndarray
+    A : np.ndarray or LinearOperator
         Forward operator
     y : np.ndarray
         Measurements
@@ -126,14 +144,22 @@ def compare_methods_extended(
     tsvd_ks : list
         TSVD k values
     nsit_alpha_inits : list, optional
-        Initial alpha values for NSIT
+        Initial alpha values for NSIT (None selects ||A||²)
     nsit_strategies : list, optional
-        NSIT strategies
+        NSIT schedule types
     nsit_max_iters : int
         Max iterations
     return_solutions : bool
         Include reconstructed solutions
-        
+    noise_level : float
+        Relative noise level δ for NSIT's Morozov stopping
+    tau : float
+        Morozov safety factor
+    executor : str
+        'serial', 'thread' or 'process' (see evaluation.grid)
+    max_workers : int, optional
+        Worker pool size
+
     Returns
     -------
     results : dict
@@ -142,78 +168,10 @@ def compare_methods_extended(
     if nsit_alpha_inits is None:
         nsit_alpha_inits = [1.0]
     if nsit_strategies is None:
-        nsit_strategies = ["residual_norm", "hybrid"]
-    
-    results = {
-        "pseudoinverse": {},
-        "tikhonov": [],
-        "tsvd": [],
-        "nsit": [],
-    }
-    
-    # Pseudoinverse
-    x_pinv = pseudoinverse.reconstruct(A, y)
-    results["pseudoinverse"] = {
-        "mse": mse(x_true, x_pinv),
-        "psnr": psnr(x_true, x_pinv),
-        "rel_error": relative_error(x_true, x_pinv),
-    }
-    if return_solutions:
-        results["pseudoinverse"]["solution"] = x_pinv
-    
-    # Tikhonov
-    for lam in tikh_lambdas:
-        x_hat = tikhonov.reconstruct(A, y, lam)
-        entry = {
-            "lambda": float(lam),
-            "mse": mse(x_true, x_hat),
-            "psnr": psnr(x_true, x_hat),
-            "rel_error": relative_error(x_true, x_hat),
-        }
-        if return_solutions:
-            entry["solution"] = x_hat
-        results["tikhonov"].append(entry)
-    
-    # TSVD
-    for k in tsvd_ks:
-        x_hat = tsvd.reconstruct(A, y, k)
-        entry = {
-            "k": int(k),
-            "mse": mse(x_true, x_hat),
-            "psnr": psnr(x_true, x_hat),
-            "rel_error": relative_error(x_true, x_hat),
-        }
-        if return_solutions:
-            entry["solution"] = x_hat
-        results["tsvd"].append(entry)
-    
-    # NSIT with different settings
-    for alpha_init in nsit_alpha_inits:
-        for strategy in nsit_strategies:
-            x_hat, history = nsit.reconstruct(
-                A,
-                y,
-                alpha_init=alpha_init,
-                alpha_strategy=strategy,
-                max_iters=nsit_max_iters,
-                verbose=False,
-            )
-            
-            entry = {
-                "alpha_init": float(alpha_init),
-                "strategy": strategy,
-                "mse": mse(x_true, x_hat),
-                "psnr": psnr(x_true, x_hat),
-                "rel_error": relative_error(x_true, x_hat),
-                "iterations": history["iterations"],
-                "converged": history["converged"],
-                "final_residual": history["residual_norms"][-1],
-                "final_alpha": history["alphas"][-1],
-                "history": history,
-            }
-            if return_solutions:
-                entry["solution"] = x_hat
-            
-            results["nsit"].append(entry)
-    
-    return results
+        nsit_strategies = ["sqrt", "exp"]
+
+    tasks = _grid_tasks(tikh_lambdas, tsvd_ks, nsit_alpha_inits, nsit_strategies,
+                        nsit_max_iters, noise_level, tau)
+    rows = execute_grid(A, y, x_true, tasks, executor=executor,
+                        max_workers=max_workers, return_solutions=return_solutions)
+    return _collect(rows, detailed=True, return_solutions=return_solutions)
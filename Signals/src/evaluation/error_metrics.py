@@ -1,9 +1,14 @@
+from __future__ import annotations
+
 import numpy as np
 import math
 
 
+METRICS = ("mse", "psnr", "rel_error")
+
+
 def mse(x_true: np.ndarray, x_est: np.ndarray) -> float:
-    return float(np.mean((x_true - x_est) ** 2))
+    return float(np.mean(np.square(x_true - x_est, dtype=np.float64)))
 
 
 def psnr(x_true: np.ndarray, x_est: np.ndarray) -> float:
@@ -15,6 +20,141 @@ def psnr(x_true: np.ndarray, x_est: np.ndarray) -> float:
 
 
 def relative_error(x_true: np.ndarray, x_est: np.ndarray) -> float:
-    num = np.linalg.norm(x_true - x_est)
-    den = np.linalg.norm(x_true)
+    num = np.sqrt(np.sum(np.square(x_true - x_est, dtype=np.float64)))
+    den = np.sqrt(np.sum(np.square(x_true, dtype=np.float64)))
     return float(num / den)
+
+
+def _table(sq: np.ndarray, size: int, max_val, ref_norm) -> dict:
+    """MSE, PSNR and relative error from per-estimate sums of squared errors."""
+    m = sq / size
+    with np.errstate(divide='ignore'):
+        p = 20 * np.log10(max_val) - 10 * np.log10(m)
+    return {
+        "mse": m,
+        "psnr": p,
+        "rel_error": np.sqrt(sq) / ref_norm,
+    }
+
+
+def metric_dtype(with_ssim: bool = False) -> np.dtype:
+    """Record layout returned by ``batch_metrics``."""
+    names = list(METRICS) + (["ssim"] if with_ssim else [])
+    return np.dtype([(name, np.float64) for name in names])
+
+
+def _gaussian_filter(images: np.ndarray, window: np.ndarray) -> np.ndarray:
+    """Separable 'valid' filtering of the last two axes."""
+    out = np.lib.stride_tricks.sliding_window_view(images, len(window), axis=-2) @ window
+    return np.lib.stride_tricks.sliding_window_view(out, len(window), axis=-1) @ window
+
+
+def ssim(x_true: np.ndarray, X_est: np.ndarray, data_range: float | None = None,
+         window_size: int = 11, sigma: float = 1.5) -> np.ndarray:
+    """
+    Structural similarity of each image in X_est (B × H × W, or H × W)
+    against x_true, with an 11 × 11 Gaussian window (Wang et al. 2004).
+
+    ``data_range`` defaults to the peak-to-peak range of x_true. The local
+    statistics of x_true are computed once for the whole stack.
+    """
+    X_est = np.asarray(X_est, dtype=float)
+    single = X_est.ndim == 2
+    if single:
+        X_est = X_est[None]
+    x_true = np.asarray(x_true, dtype=float)
+    L = np.ptp(x_true) if data_range is None else data_range
+    L = L if L > 0 else 1.0
+    C1, C2 = (0.01 * L) ** 2, (0.03 * L) ** 2
+
+    size = min(window_size, *x_true.shape)
+    size -= 1 - size % 2
+    idx = np.arange(size) - size // 2
+    window = np.exp(-0.5 * (idx / sigma) ** 2)
+    window /= window.sum()
+
+    mu_x = _gaussian_filter(x_true, window)
+    var_x = _gaussian_filter(x_true ** 2, window) - mu_x ** 2
+    mu_y = _gaussian_filter(X_est, window)
+    var_y = _gaussian_filter(X_est ** 2, window) - mu_y ** 2
+    cov = _gaussian_filter(X_est * x_true, window) - mu_x * mu_y
+
+    ssim_map = ((2 * mu_x * mu_y + C1) * (2 * cov + C2)) / \
+        ((mu_x ** 2 + mu_y ** 2 + C1) * (var_x + var_y + C2))
+    values = ssim_map.mean(axis=(-2, -1))
+    return float(values[0]) if single else values
+
+
+def batch_metrics(x_true: np.ndarray, X_est: np.ndarray, with_ssim: bool | None = None,
+                  chunk_size: int = 256) -> np.ndarray:
+    """
+    Every metric for a stack of estimates of one signal, from one difference pass.
+
+    Parameters
+    ----------
+    x_true : np.ndarray
+        True signal (n,) or image (H × W)
+    X_est : np.ndarray
+        Estimates stacked on the first axis: (B × n) or (B × H × W)
+    with_ssim : bool, optional
+        Add an 'ssim' field; defaults to True for images
+    chunk_size : int
+        Estimates per difference temporary, bounding memory for large B
+
+    Returns
+    -------
+    table : np.ndarray
+        Structured array of length B with fields 'mse', 'psnr',
+        'rel_error' (and 'ssim')
+    """
+    x_true = np.asarray(x_true)
+    X_est = np.asarray(X_est)
+    if X_est.shape[1:] != x_true.shape:
+        raise ValueError("X_est must stack estimates shaped like x_true on its first axis")
+    if with_ssim is None:
+        with_ssim = x_true.ndim == 2
+    if with_ssim and x_true.ndim != 2:
+        raise ValueError("SSIM needs 2D estimates (B × H × W)")
+
+    B = X_est.shape[0]
+    sq = np.empty(B)
+    flat_true = x_true.reshape(-1)
+    flat_est = X_est.reshape(B, -1)
+    for start in range(0, B, chunk_size):
+        diff = flat_est[start:start + chunk_size] - flat_true
+        sq[start:start + chunk_size] = np.einsum('ij,ij->i', diff, diff, dtype=np.float64)
+
+    table = np.empty(B, dtype=metric_dtype(with_ssim))
+    ref_norm = np.sqrt(np.einsum('i,i->', flat_true, flat_true, dtype=np.float64))
+    columns = _table(sq, flat_true.size, float(np.max(np.abs(flat_true))), ref_norm)
+    for name, values in columns.items():
+        table[name] = values
+    if with_ssim:
+        for start in range(0, B, chunk_size):
+            table["ssim"][start:start + chunk_size] = ssim(x_true, X_est[start:start + chunk_size])
+    return table
+
+
+def scores(x_true: np.ndarray, x_est: np.ndarray) -> dict:
+    """MSE, PSNR and relative error of one estimate as floats, from one difference."""
+    row = batch_metrics(x_true, np.asarray(x_est)[None], with_ssim=False)[0]
+    return {name: float(row[name]) for name in METRICS}
+
+
+def path_metrics(x_true: np.ndarray, X: np.ndarray) -> dict:
+    """MSE, PSNR and relative error of every column of X against x_true.
+
+    Vectorized counterpart of the scalar metrics for an (n × L) block of
+    solutions such as a regularization path, or an (H × W × L) stack of
+    images; returns arrays of length L.
+    """
+    table = batch_metrics(x_true, np.moveaxis(X, -1, 0), with_ssim=False)
+    return {name: table[name] for name in METRICS}
+
+
+def frame_metrics(X_true: np.ndarray, X_est: np.ndarray) -> dict:
+    """MSE, PSNR and relative error of each frame (row) of X_est against the matching row of X_true."""
+    diff = X_est - X_true
+    sq = np.einsum('ij,ij->i', diff, diff, dtype=np.float64)
+    ref_norm = np.sqrt(np.einsum('ij,ij->i', X_true, X_true, dtype=np.float64))
+    return _table(sq, X_true.shape[1], np.max(np.abs(X_true), axis=1).astype(np.float64), ref_norm)
@@ -0,0 +1,208 @@
+"""
+Parallel execution of reconstruction parameter grids.
+
+A grid is a list of task dicts, each naming a method and its parameters:
+
+    {'method': 'pseudoinverse'}
+    {'method': 'tikhonov', 'lambda': 0.05}
+    {'method': 'tsvd', 'k': 20}
+    {'method': 'nsit', 'schedule_type': 'sqrt', 'noise_level': 0.01,
+     'alpha_0': None, 'tau': 1.0, 'max_iter': 50}
+    {'method': 'fnsit', 'alpha0': 1.0, 'q': 0.8, 'delta': 0.01, ...}
+
+Any task may add 'noise_sigma' to reconstruct from y plus fresh Gaussian
+noise drawn from its own RNG stream.
+
+Tasks are split into chunks and fanned out over a process pool, a thread
+pool, or run serially. The operator and data are sent to each process once
+through the pool initializer, not pickled per task. Every task gets a
+child of ``np.random.SeedSequence(seed)`` by position, so results do not
+depend on the executor or the number of workers. Within a chunk, noise-free
+Tikhonov and TSVD tasks are solved together as one regularization path.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from evaluation.error_metrics import path_metrics, scores
+import reconstruction
+
+
+_context = {}
+
+
+def _init_worker(A, y, x_true) -> None:
+    _context.update(A=A, y=y, x_true=x_true)
+
+
+def _run_task(task: dict, A, y: np.ndarray, x_true: np.ndarray,
+              seed: np.random.SeedSequence, keep_solutions: bool) -> dict:
+    if 'noise_sigma' in task:
+        rng = np.random.default_rng(seed)
+        y = y + rng.normal(0.0, task['noise_sigma'], size=y.shape)
+
+    method = task['method']
+    row = dict(task)
+    if method == 'pseudoinverse':
+        x_hat = reconstruction.pseudoinverse.reconstruct(A, y)
+    elif method == 'tikhonov':
+        x_hat = reconstruction.tikhonov.reconstruct(A, y, task['lambda'])
+    elif method == 'tsvd':
+        x_hat = reconstruction.tsvd.reconstruct(A, y, task['k'])
+    elif method == 'nsit':
+        noise_level = task.get('noise_level', 0.01)
+        tau = task.get('tau', 1.0)
+        x_hat, history = reconstruction.nsit.nsit_with_morozov(
+            A, y, noise_level,
+            schedule_type=task.get('schedule_type', 'sqrt'),
+            tau=tau,
+            max_iter=task.get('max_iter', 100),
+            store_every=None,
+            alpha_0=task.get('alpha_0'),
+        )
+        row.update({
+            "iterations": history["stopping_iter"] + 1,
+            "converged": bool(history["residuals"][-1] <= tau * noise_level * np.linalg.norm(y)),
+            "final_residual": history["residuals"][-1],
+            "final_alpha": history["alphas"][-1],
+            "history": history,
+        })
+    elif method == 'fnsit':
+        x_hat, history = reconstruction.fnsit.fnsit_reconstruct(
+            A, y, task.get('alpha0', 1.0), task.get('q', 0.8),
+            task.get('max_iter', 100), task.get('tau', 1.0), task.get('delta', 0.01),
+            inner_steps=task.get('inner_steps', 5),
+            step_size=task.get('step_size', 0.1),
+            inner_solver=task.get('inner_solver', 'gd'),
+        )
+        row.update({
+            "iterations": history["final_iteration"] + 1,
+            "final_residual": history["residuals"][-1] if history["residuals"] else np.nan,
+            "history": history,
+        })
+    else:
+        raise ValueError(f"unknown method {method!r}")
+
+    row.update(scores(x_true, x_hat))
+    if keep_solutions:
+        row["solution"] = x_hat
+    return row
+
+
+def _run_chunk(chunk: list, keep_solutions: bool, context: dict | None = None) -> list:
+    """Evaluate (index, task, seed) triples; returns (index, row) pairs."""
+    context = context or _context
+    A, y, x_true = context['A'], context['y'], context['x_true']
+    results = []
+
+    # Noise-free Tikhonov / TSVD tasks share one path solve
+    for method, param in (('tikhonov', 'lambda'), ('tsvd', 'k')):
+        group = [(i, t) for i, t, _ in chunk
+                 if t['method'] == method and 'noise_sigma' not in t]
+        if not group:
+            continue
+        path = getattr(reconstruction, method).reconstruct_path
+        X = path(A, y, [t[param] for _, t in group])
+        metrics = path_metrics(x_true, X)
+        for j, (i, task) in enumerate(group):
+            row = dict(task)
+            row.update({name: float(values[j]) for name, values in metrics.items()})
+            if keep_solutions:
+                row["solution"] = X[..., j]
+            results.append((i, row))
+
+    done = {i for i, _ in results}
+    for i, task, seed in chunk:
+        if i not in done:
+            results.append((i, _run_task(task, A, y, x_true, seed, keep_solutions)))
+    return results
+
+
+def execute_grid(A, y: np.ndarray, x_true: np.ndarray, tasks: list,
+                 executor: str = 'serial', max_workers: int | None = None,
+                 seed: int = 0, return_solutions: bool = False,
+                 chunks_per_worker: int = 4) -> list:
+    """
+    Run every task and return one result dict per task, in task order.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Forward operator
+    y : np.ndarray
+        Measurements
+    x_true : np.ndarray
+        True solution
+    tasks : list of dict
+        Grid points (see module docstring)
+    executor : str
+        'process', 'thread' or 'serial'
+    max_workers : int, optional
+        Pool size (defaults to the CPU count)
+    seed : int
+        Root seed; task i uses child i of SeedSequence(seed)
+    return_solutions : bool
+        Include each reconstruction under 'solution'
+    chunks_per_worker : int
+        Load-balancing granularity
+
+    Returns
+    -------
+    rows : list of dict
+        Task parameters plus 'mse', 'psnr', 'rel_error' and method-specific
+        fields
+    """
+    if executor not in ('process', 'thread', 'serial'):
+        raise ValueError("executor must be 'process', 'thread' or 'serial'")
+
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    items = list(zip(range(len(tasks)), tasks, seeds))
+    workers = max_workers or os.cpu_count() or 1
+    if executor == 'serial' or workers == 1:
+        n_chunks = 1
+    else:
+        n_chunks = min(len(items), workers * chunks_per_worker)
+    chunks = [items[k::n_chunks] for k in range(n_chunks)] if items else []
+
+    context = {'A': A, 'y': y, 'x_true': x_true}
+    if executor == 'serial' or workers == 1:
+        pairs = [p for chunk in chunks for p in _run_chunk(chunk, return_solutions, context)]
+    elif executor == 'thread':
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as pool:
+            futures = [pool.submit(_run_chunk, chunk, return_solutions, context) for chunk in chunks]
+            pairs = [p for f in futures for p in f.result()]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(A, y, x_true)) as pool:
+            futures = [pool.submit(_run_chunk, chunk, return_solutions) for chunk in chunks]
+            pairs = [p for f in futures for p in f.result()]
+
+    pairs.sort(key=lambda p: p[0])
+    return [row for _, row in pairs]
+
+
+def to_columns(rows: list) -> dict:
+    """Columnar table from result rows: one array per field, NaN/None where absent."""
+    names = []
+    for row in rows:
+        names.extend(k for k in row if k not in names)
+    table = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        if all(isinstance(v, (int, float, np.number, bool, type(None))) for v in values) \
+                and any(v is not None for v in values):
+            table[name] = np.array([np.nan if v is None else v for v in values], dtype=float)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            table[name] = column
+    return table
+
+
+def run_grid(A, y: np.ndarray, x_true: np.ndarray, tasks: list, **kwargs) -> dict:
+    """``execute_grid`` returning a columnar result table (dict of arrays)."""
+    return to_columns(execute_grid(A, y, x_true, tasks, **kwargs))
@@ -0,0 +1,29 @@
+"""
+Forward operators: blur, downsampling and rank-deficient matrices, their
+matrix-free counterparts, and synthetic test problems with known structure.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'blur_operator',
+    'circulant_operator',
+    'downsample_operator',
+    'linear_operator',
+    'orthogonal',
+    'rank_deficient_operator',
+    'separable_operator',
+    'test_problems',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -1,4 +1,9 @@
 import numpy as np
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import BandedConvolutionOperator
+from forward_models.separable_operator import SeparableOperator
+
+
 def gaussian_kernel(size: int, sigma: float) -> np.ndarray:
     idx = np.arange(-(size // 2), size // 2 + 1)
     kernel = np.exp(-0.5 * (idx / sigma) ** 2)
@@ -6,12 +11,39 @@ def gaussian_kernel(size: int, sigma: float) -> np.ndarray:
     return kernel
 
 
-def blur_matrix(n: int, sigma: float, kernel_radius: int = 10) -> np.ndarray:
+def blur_column(n: int, sigma: float, kernel_radius: int = 10, dtype=np.float64) -> np.ndarray:
+    """First column of the periodic blur matrix: A[i, j] = c[(i - j) % n]."""
     ksize = 2 * kernel_radius + 1
     k = gaussian_kernel(ksize, sigma)
-    A = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            shift = (i - j) % n
-            A[i, j] = k[shift] if shift < ksize else 0.0
-    return A 
+    c = np.zeros(n, dtype=dtype)
+    c[:min(ksize, n)] = k[:n]
+    return c
+
+
+def blur_matrix(n: int, sigma: float, kernel_radius: int = 10, dtype=np.float64) -> np.ndarray:
+    c = blur_column(n, sigma, kernel_radius, dtype)
+    idx = np.arange(n)
+    return c[(idx[:, None] - idx[None, :]) % n]
+
+
+def circulant_blur(n: int, sigma: float, kernel_radius: int = 10, dtype=np.float64) -> CirculantOperator:
+    """Same operator as ``blur_matrix`` but stored by its FFT in O(n) memory."""
+    return CirculantOperator(blur_column(n, sigma, kernel_radius, dtype))
+
+
+def blur_convolution(n: int, sigma: float, kernel_radius: int = 10,
+                     dtype=np.float64) -> BandedConvolutionOperator:
+    """Same operator as ``blur_matrix`` applied as a direct O(n * kernel) convolution."""
+    ksize = 2 * kernel_radius + 1
+    return BandedConvolutionOperator(gaussian_kernel(ksize, sigma).astype(dtype), n)
+
+
+def separable_blur(shape: tuple, sigma, kernel_radius: int = 10, dtype=np.float64) -> SeparableOperator:
+    """Periodic Gaussian blur of an image of ``shape`` (H, W) as A_c X A_r^T.
+
+    ``sigma`` may be a scalar or a (sigma_rows, sigma_cols) pair.
+    """
+    sigma_c, sigma_r = np.broadcast_to(np.asarray(sigma, dtype=float), (2,))
+    A_c = blur_matrix(shape[0], sigma_c, kernel_radius, dtype)
+    A_r = A_c if (shape[1], sigma_r) == (shape[0], sigma_c) else blur_matrix(shape[1], sigma_r, kernel_radius, dtype)
+    return SeparableOperator(A_c, A_r)
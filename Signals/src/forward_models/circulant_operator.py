@@ -0,0 +1,52 @@
+"""
+Circulant (periodic convolution) operators.
+
+A circulant matrix C with first column c is diagonalized by the DFT:
+
+    C = F^H diag(λ) F,    λ = fft(c)
+
+so products with C and C^T cost O(n log n) and the |λ_k| are its singular
+values. The operator is stored by its eigenvalues only, in O(n) memory.
+"""
+
+import numpy as np
+from forward_models.linear_operator import LinearOperator, digest
+
+
+class CirculantOperator(LinearOperator):
+    """
+    Periodic convolution operator defined by its first column.
+
+    Parameters
+    ----------
+    column : np.ndarray
+        First column c of the matrix, A[i, j] = c[(i - j) % n]
+    """
+
+    def __init__(self, column: np.ndarray):
+        self.column = np.asarray(column, dtype=np.result_type(column, np.float32))
+        self.eigenvalues = np.fft.fft(self.column)
+        n = self.column.shape[0]
+        self.shape = (n, n)
+        self.dtype = self.column.dtype
+
+    def _apply(self, x: np.ndarray, eig: np.ndarray) -> np.ndarray:
+        eig = eig.reshape((-1,) + (1,) * (np.ndim(x) - 1))
+        return np.fft.ifft(eig * np.fft.fft(x, axis=0), axis=0).real
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        return self._apply(x, self.eigenvalues)
+
+    def rmatvec(self, x: np.ndarray) -> np.ndarray:
+        return self._apply(x, np.conj(self.eigenvalues))
+
+    @property
+    def T(self) -> "CirculantOperator":
+        return CirculantOperator(np.roll(self.column[::-1], 1))
+
+    def to_dense(self) -> np.ndarray:
+        idx = np.arange(self.shape[0])
+        return self.column[(idx[:, None] - idx[None, :]) % self.shape[0]]
+
+    def fingerprint(self) -> tuple:
+        return ('circulant', digest(self.column))
@@ -1,9 +1,14 @@
 import numpy as np
+from forward_models.linear_operator import DecimationOperator
 
 
-def downsample_matrix(n: int, factor: int = 2) -> np.ndarray:
+def downsample_matrix(n: int, factor: int = 2, dtype=np.float64) -> np.ndarray:
     m = n // factor
-    A = np.zeros((m, n))
-    for i in range(m):
-        A[i, i * factor] = 1.0
+    A = np.zeros((m, n), dtype=dtype)
+    A[np.arange(m), np.arange(m) * factor] = 1.0
     return A
+
+
+def downsample_operator(n: int, factor: int = 2) -> DecimationOperator:
+    """Same operator as ``downsample_matrix`` as strided selection, without the m × n matrix."""
+    return DecimationOperator(n, factor)
@@ -0,0 +1,390 @@
+"""
+Matrix-free linear operators.
+
+An operator only has to provide ``shape``, ``dtype``, ``matvec`` (A @ x) and
+``rmatvec`` (A^T @ y). Both act column-wise on 2D inputs, so ``to_dense``
+and batched products come for free. ``A @ B`` composes two operators,
+``A @ x`` applies one, and ``A.T`` is the adjoint, so code written for dense
+matrices (``A @ x``, ``A.T @ r``) runs unchanged on operators.
+
+``fingerprint`` identifies an operator for the shared factorization cache.
+Structured operators derive it from their defining parameters; the base
+class falls back to object identity, via a per-instance token that is never
+reused (unlike ``id``), and the cache drops such entries when the operator
+is garbage collected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+
+import numpy as np
+
+
+# First element of identity-based fingerprints
+INSTANCE = 'instance'
+_tokens = itertools.count()
+
+
+def digest(a: np.ndarray) -> str:
+    """Content hash of an array."""
+    a = np.ascontiguousarray(a)
+    return hashlib.blake2b(a.data, digest_size=16).hexdigest()
+
+
+class LinearOperator:
+    """Base class: subclasses set ``shape``/``dtype`` and implement matvec/rmatvec."""
+
+    shape = (0, 0)
+    dtype = np.dtype(float)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def __matmul__(self, other):
+        if isinstance(other, LinearOperator):
+            return ComposedOperator(self, other)
+        return self.matvec(other)
+
+    @property
+    def T(self) -> "LinearOperator":
+        return AdjointOperator(self)
+
+    def adjoint(self) -> "LinearOperator":
+        return self.T
+
+    def to_dense(self) -> np.ndarray:
+        return self.matvec(np.eye(self.shape[1], dtype=self.dtype))
+
+    def fingerprint(self) -> tuple:
+        token = self.__dict__.get('_token')
+        if token is None:
+            token = self._token = next(_tokens)
+        return (INSTANCE, type(self).__name__, token, self.shape, np.dtype(self.dtype).str)
+
+
+class DenseOperator(LinearOperator):
+    """Operator view of an explicit matrix."""
+
+    def __init__(self, A: np.ndarray):
+        self.A = np.asarray(A)
+        self.shape = self.A.shape
+        self.dtype = self.A.dtype
+
+    def matvec(self, x):
+        return self.A @ x
+
+    def rmatvec(self, y):
+        return self.A.T @ y
+
+    @property
+    def T(self):
+        return DenseOperator(self.A.T)
+
+    def to_dense(self):
+        return self.A
+
+    def fingerprint(self):
+        return (self.A.shape, self.A.dtype.str, digest(self.A))
+
+
+class AdjointOperator(LinearOperator):
+    def __init__(self, op: LinearOperator):
+        self.op = op
+        self.shape = (op.shape[1], op.shape[0])
+        self.dtype = op.dtype
+
+    def matvec(self, x):
+        return self.op.rmatvec(x)
+
+    def rmatvec(self, y):
+        return self.op.matvec(y)
+
+    @property
+    def T(self):
+        return self.op
+
+    def fingerprint(self):
+        return ('adjoint', self.op.fingerprint())
+
+
+class ComposedOperator(LinearOperator):
+    """Product ``outer @ inner``: apply ``inner`` first, then ``outer``."""
+
+    def __init__(self, outer: LinearOperator, inner: LinearOperator):
+        if outer.shape[1] != inner.shape[0]:
+            raise ValueError(f"cannot compose shapes {outer.shape} and {inner.shape}")
+        self.outer = outer
+        self.inner = inner
+        self.shape = (outer.shape[0], inner.shape[1])
+        self.dtype = np.result_type(outer.dtype, inner.dtype)
+
+    def matvec(self, x):
+        return self.outer.matvec(self.inner.matvec(x))
+
+    def rmatvec(self, y):
+        return self.inner.rmatvec(self.outer.rmatvec(y))
+
+    def fingerprint(self):
+        return ('compose', self.outer.fingerprint(), self.inner.fingerprint())
+
+
+class BandedConvolutionOperator(LinearOperator):
+    """
+    Periodic convolution with a short kernel, applied directly in O(n * k).
+
+    Represents A[i, j] = taps[(i - j) % n] for (i - j) % n < len(taps), i.e.
+    the matrix built by ``blur_matrix``, without storing it.
+    """
+
+    def __init__(self, taps: np.ndarray, n: int):
+        self.taps = np.asarray(taps, dtype=np.result_type(taps, np.float32))[:n]
+        self.shape = (n, n)
+        self.dtype = self.taps.dtype
+
+    def _windows(self, x, head: bool):
+        k = len(self.taps)
+        if head:
+            padded = np.concatenate([x[len(x) - (k - 1):], x], axis=0)
+        else:
+            padded = np.concatenate([x, x[:k - 1]], axis=0)
+        # (n, ..., k) windows over the wrapped signal
+        return np.lib.stride_tricks.sliding_window_view(padded, k, axis=0)
+
+    def matvec(self, x):
+        # y[i] = sum_s taps[s] * x[i - s]
+        return self._windows(np.asarray(x), head=True) @ self.taps[::-1]
+
+    def rmatvec(self, y):
+        # (A^T y)[i] = sum_s taps[s] * y[i + s]
+        return self._windows(np.asarray(y), head=False) @ self.taps
+
+    def fingerprint(self):
+        return ('banded_conv', self.shape, digest(self.taps))
+
+
+class DecimationOperator(LinearOperator):
+    """Keep every ``factor``-th sample: (A x)[i] = x[i * factor]."""
+
+    def __init__(self, n: int, factor: int = 2):
+        self.n = n
+        self.factor = factor
+        self.shape = (n // factor, n)
+        self.dtype = np.dtype(float)
+
+    def matvec(self, x):
+        return np.asarray(x)[:self.shape[0] * self.factor:self.factor]
+
+    def rmatvec(self, y):
+        y = np.asarray(y)
+        out = np.zeros((self.n,) + y.shape[1:], dtype=np.result_type(y, self.dtype))
+        out[:self.shape[0] * self.factor:self.factor] = y
+        return out
+
+    def fingerprint(self):
+        return ('decimate', self.n, self.factor)
+
+
+class LowRankOperator(LinearOperator):
+    """Operator stored by thin factors: A = U diag(s) Vt."""
+
+    def __init__(self, U: np.ndarray, s: np.ndarray, Vt: np.ndarray):
+        self.U = U
+        self.s = s
+        self.Vt = Vt
+        self.shape = (U.shape[0], Vt.shape[1])
+        self.dtype = np.result_type(U, s, Vt)
+
+    def _scale(self, c):
+        return c * self.s.reshape((-1,) + (1,) * (c.ndim - 1))
+
+    def matvec(self, x):
+        return self.U @ self._scale(self.Vt @ x)
+
+    def rmatvec(self, y):
+        return self.Vt.T @ self._scale(self.U.T @ y)
+
+    def fingerprint(self):
+        return ('low_rank', digest(self.U), digest(self.s), digest(self.Vt))
+
+
+class FactoredOperator(LinearOperator):
+    """
+    Square operator given by its SVD: A = U diag(s) V^T.
+
+    U and V are orthogonal LinearOperators (n × n), typically fast
+    transforms from forward_models.orthogonal, so products cost two
+    transforms and the singular values are known without any factorization.
+    ``s`` may come in any order; reconstruction.factored sorts it when a
+    ranking is needed.
+    """
+
+    def __init__(self, U: LinearOperator, s: np.ndarray, V: LinearOperator):
+        n = len(s)
+        if U.shape != (n, n) or V.shape != (n, n):
+            raise ValueError(f"factors {U.shape} and {V.shape} do not match {n} singular values")
+        self.U = U
+        self.V = V
+        self.s = np.asarray(s, dtype=np.result_type(s, np.float32))
+        self.shape = (n, n)
+        self.dtype = np.result_type(U.dtype, self.s, V.dtype)
+
+    def _scale(self, c, s):
+        return c * s.reshape((-1,) + (1,) * (c.ndim - 1))
+
+    def matvec(self, x):
+        return self.U @ self._scale(self.V.T @ x, self.s)
+
+    def rmatvec(self, y):
+        return self.V @ self._scale(self.U.T @ y, self.s)
+
+    def svd(self) -> tuple:
+        """Dense (U, s, Vt) with s descending, built from the factors (no SVD)."""
+        order = np.argsort(-self.s, kind='stable')
+        U = self.U.to_dense()[:, order]
+        Vt = self.V.to_dense()[:, order].T
+        return U, self.s[order], Vt
+
+    def fingerprint(self):
+        return ('factored', self.U.fingerprint(), digest(self.s), self.V.fingerprint())
+
+
+class ToeplitzOperator(LinearOperator):
+    """
+    Toeplitz matrix A[i, j] = t[i - j] applied by FFT in O((m + n) log(m + n)).
+
+    The matrix is embedded in a circulant of length >= m + n - 1 whose
+    first column is [column, 0, ..., 0, row[:0:-1]].
+
+    Parameters
+    ----------
+    column : np.ndarray
+        First column (m,)
+    row : np.ndarray, optional
+        First row (n,), row[0] is ignored; defaults to ``column`` (symmetric)
+    """
+
+    def __init__(self, column: np.ndarray, row: np.ndarray | None = None):
+        self.column = np.asarray(column, dtype=np.result_type(column, np.float32))
+        self.row = self.column if row is None else np.asarray(row, dtype=self.column.dtype)
+        m, n = len(self.column), len(self.row)
+        self.shape = (m, n)
+        self.dtype = self.column.dtype
+        size = 1 << (m + n - 2).bit_length()
+        embed = np.zeros(size, dtype=self.dtype)
+        embed[:m] = self.column
+        embed[size - n + 1:] = self.row[:0:-1]
+        self._size = size
+        self._eig = np.fft.rfft(embed)
+
+    def _apply(self, x, eig, out_len):
+        x = np.asarray(x)
+        eig = eig.reshape((-1,) + (1,) * (x.ndim - 1))
+        out = np.fft.irfft(eig * np.fft.rfft(x, self._size, axis=0), self._size, axis=0)[:out_len]
+        return out.astype(np.result_type(x, self.dtype), copy=False)
+
+    def matvec(self, x):
+        return self._apply(x, self._eig, self.shape[0])
+
+    def rmatvec(self, y):
+        # A^T is the Toeplitz matrix with column and row swapped, i.e. the
+        # time-reversed circulant: conj of the eigenvalues
+        return self._apply(y, np.conj(self._eig), self.shape[1])
+
+    def to_dense(self):
+        m, n = self.shape
+        i, j = np.arange(m)[:, None], np.arange(n)[None, :]
+        return np.where(i >= j, self.column[np.clip(i - j, 0, m - 1)],
+                        self.row[np.clip(j - i, 0, n - 1)])
+
+    def fingerprint(self):
+        return ('toeplitz', digest(self.column), digest(self.row))
+
+
+class KernelOperator(LinearOperator):
+    """
+    Discretized integral operator A[i, j] = w_j K(s_i, t_j), evaluated on the fly.
+
+    Rows are generated ``block`` at a time in every product, so memory is
+    O(block * n) while each product costs O(m n) kernel evaluations. Use it
+    for kernels with no fast structure when the dense matrix would not fit.
+
+    Parameters
+    ----------
+    kernel : callable
+        K(s, t) on broadcast arrays
+    s, t : np.ndarray
+        Collocation points (m,) and quadrature nodes (n,)
+    weights : np.ndarray or float
+        Quadrature weights w_j
+    block : int
+        Rows per generated block
+    """
+
+    def __init__(self, kernel, s: np.ndarray, t: np.ndarray, weights=1.0, block: int = 1024,
+                 dtype=np.float64):
+        self.kernel = kernel
+        self.s = np.asarray(s, dtype=float)
+        self.t = np.asarray(t, dtype=float)
+        self.weights = np.broadcast_to(np.asarray(weights, dtype=float), self.t.shape)
+        self.block = block
+        self.shape = (len(self.s), len(self.t))
+        self.dtype = np.dtype(dtype)
+
+    def _rows(self, start, stop):
+        rows = self.kernel(self.s[start:stop, None], self.t[None, :]) * self.weights
+        return rows.astype(self.dtype, copy=False)
+
+    def matvec(self, x):
+        x = np.asarray(x)
+        out = np.empty((self.shape[0],) + x.shape[1:], dtype=np.result_type(x, self.dtype))
+        for start in range(0, self.shape[0], self.block):
+            stop = min(start + self.block, self.shape[0])
+            out[start:stop] = self._rows(start, stop) @ x
+        return out
+
+    def rmatvec(self, y):
+        y = np.asarray(y)
+        out = np.zeros((self.shape[1],) + y.shape[1:], dtype=np.result_type(y, self.dtype))
+        for start in range(0, self.shape[0], self.block):
+            stop = min(start + self.block, self.shape[0])
+            out += self._rows(start, stop).T @ y[start:stop]
+        return out
+
+    def to_dense(self):
+        return self._rows(0, self.shape[0])
+
+    def fingerprint(self):
+        # A callable has no content to hash short of evaluating all of K, so
+        # the operator is keyed by identity (a token never reused, see the
+        # base class); a rebuilt operator is factored again
+        return LinearOperator.fingerprint(self)
+
+
+def aslinearoperator(A) -> LinearOperator:
+    if isinstance(A, LinearOperator):
+        return A
+    return DenseOperator(A)
+
+
+def operator_norm(A, iters: int = 50, tol: float = 1e-6, rng: np.random.Generator | None = None) -> float:
+    """Estimate ||A||_2 by power iteration on A^T A (matvecs only)."""
+    rng = rng or np.random.default_rng(0)
+    v = rng.standard_normal(A.shape[1])
+    v /= np.linalg.norm(v)
+    sigma = 0.0
+    for _ in range(iters):
+        w = A.T @ (A @ v)
+        w_norm = np.linalg.norm(w)
+        if w_norm == 0:
+            return 0.0
+        new_sigma = np.sqrt(w_norm)
+        v = w / w_norm
+        if abs(new_sigma - sigma) <= tol * new_sigma:
+            return float(new_sigma)
+        sigma = new_sigma
+    return float(sigma)
@@ -0,0 +1,143 @@
+"""
+Fast orthogonal operators.
+
+Each operator Q is square and orthogonal (Q^T Q = I), stored in O(n) or
+O(n k) memory and applied faster than a dense matrix:
+
+    HouseholderOperator   Q = H_1 H_2 ... H_k,  H_i = I - 2 w_i w_i^T
+                          (unit w_i), O(n k) per product
+    DCTOperator           orthonormal DCT-II, O(n log n) through a length-n
+                          FFT; Q^T is the DCT-III
+    HadamardOperator      normalized Walsh-Hadamard transform in Sylvester
+                          order, n a power of two, O(n log n); Q = Q^T
+
+They serve as the singular-vector factors U and V of
+forward_models.linear_operator.FactoredOperator, which builds operators
+with a prescribed spectrum and a known SVD.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from forward_models.linear_operator import LinearOperator, digest
+
+
+class HouseholderOperator(LinearOperator):
+    """
+    Product of Householder reflections Q = H_1 H_2 ... H_k.
+
+    Parameters
+    ----------
+    vectors : np.ndarray
+        Reflection vectors w_i as columns (n × k); normalized on construction
+    """
+
+    def __init__(self, vectors: np.ndarray):
+        W = np.asarray(vectors, dtype=np.result_type(vectors, np.float32))
+        if W.ndim == 1:
+            W = W[:, None]
+        self.vectors = W / np.linalg.norm(W, axis=0)
+        n = W.shape[0]
+        self.shape = (n, n)
+        self.dtype = self.vectors.dtype
+
+    @classmethod
+    def random(cls, n: int, k: int = 8, seed=None, dtype=np.float64) -> HouseholderOperator:
+        """Product of k reflections with Gaussian vectors."""
+        rng = np.random.default_rng(seed)
+        return cls(rng.standard_normal((n, k)).astype(dtype))
+
+    def _reflect(self, x: np.ndarray, columns) -> np.ndarray:
+        x = np.array(x, dtype=np.result_type(x, self.dtype))
+        for i in columns:
+            w = self.vectors[:, i]
+            x -= 2.0 * np.multiply.outer(w, w @ x)
+        return x
+
+    def matvec(self, x):
+        # H_k acts first
+        return self._reflect(x, reversed(range(self.vectors.shape[1])))
+
+    def rmatvec(self, y):
+        return self._reflect(y, range(self.vectors.shape[1]))
+
+    def fingerprint(self):
+        return ('householder', digest(self.vectors))
+
+
+class DCTOperator(LinearOperator):
+    """
+    Orthonormal DCT-II of size n (``scipy.fft.dct(x, norm='ortho')``).
+
+    Computed with Makhoul's reordering: the even samples followed by the
+    odd ones reversed, one complex FFT, and a quarter-sample phase shift.
+    """
+
+    def __init__(self, n: int, dtype=np.float64):
+        self.shape = (n, n)
+        self.dtype = np.dtype(dtype)
+        k = np.arange(n)
+        scale = np.full(n, np.sqrt(2.0 / n))
+        scale[0] = np.sqrt(1.0 / n)
+        # X_k = scale_k * Re(exp(-iπk / 2n) * fft(v)_k)
+        self._twiddle = scale * np.exp(-0.5j * np.pi * k / n)
+
+    def _column(self, v: np.ndarray, ndim: int) -> np.ndarray:
+        return v.reshape((-1,) + (1,) * (ndim - 1))
+
+    def matvec(self, x):
+        x = np.asarray(x)
+        v = np.concatenate([x[0::2], x[1::2][::-1]], axis=0)
+        X = (self._column(self._twiddle, x.ndim) * np.fft.fft(v, axis=0)).real
+        return X.astype(np.result_type(x, self.dtype), copy=False)
+
+    def rmatvec(self, y):
+        # DCT-III: invert the phase shift (V_k = w_k^{-1} (X_k - i X_{n-k}))
+        y = np.asarray(y)
+        n = self.shape[0]
+        shifted = np.zeros_like(y)
+        shifted[1:] = y[:0:-1]
+        V = (y - 1j * shifted) / self._column(self._twiddle, y.ndim)
+        v = np.fft.ifft(V, axis=0).real
+        x = np.empty_like(v)
+        half = (n + 1) // 2
+        x[0::2] = v[:half]
+        x[1::2] = v[half:][::-1]
+        return x.astype(np.result_type(y, self.dtype), copy=False)
+
+    def fingerprint(self):
+        return ('dct', self.shape[0], self.dtype.str)
+
+
+class HadamardOperator(LinearOperator):
+    """Normalized Walsh-Hadamard transform H_n / sqrt(n), n a power of two."""
+
+    def __init__(self, n: int, dtype=np.float64):
+        if n < 1 or n & (n - 1):
+            raise ValueError(f"Hadamard size must be a power of two, got {n}")
+        self.shape = (n, n)
+        self.dtype = np.dtype(dtype)
+
+    def matvec(self, x):
+        x = np.asarray(x)
+        n = self.shape[0]
+        rest = x.shape[1:]
+        out = np.array(x, dtype=np.result_type(x, self.dtype))
+        h = 1
+        while h < n:
+            # Butterflies between entries h apart: (a, b) -> (a + b, a - b)
+            out = out.reshape((n // (2 * h), 2, h) + rest)
+            a, b = out[:, 0], out[:, 1]
+            out = np.stack((a + b, a - b), axis=1)
+            h *= 2
+        return out.reshape(x.shape) / np.sqrt(n)
+
+    def rmatvec(self, y):
+        return self.matvec(y)
+
+    @property
+    def T(self) -> HadamardOperator:
+        return self
+
+    def fingerprint(self):
+        return ('hadamard', self.shape[0], self.dtype.str)
@@ -1,9 +1,27 @@
+from __future__ import annotations
+
 import numpy as np
-from numpy.linalg import svd
+from numpy.linalg import svd, qr
+from forward_models.linear_operator import LowRankOperator
+
+
+def _random_state(seed):
+    """Global NumPy RNG, or a fixed stream when ``seed`` is given."""
+    return np.random if seed is None else np.random.RandomState(seed)
 
 
-def rank_deficient_matrix(n: int, rank: int) -> np.ndarray:
-    U, _, Vt = svd(np.random.randn(n, n), full_matrices=False)
+def rank_deficient_matrix(n: int, rank: int, dtype=np.float64, seed: int | None = None) -> np.ndarray:
+    U, _, Vt = svd(_random_state(seed).randn(n, n), full_matrices=False)
     s = np.linspace(1.0, 0.1, n)
     s[rank:] = 0.0
-    return (U * s) @ Vt
+    return ((U * s) @ Vt).astype(dtype, copy=False)
+
+
+def rank_deficient_operator(n: int, rank: int, dtype=np.float64,
+                            seed: int | None = None) -> LowRankOperator:
+    """Operator with the spectrum of ``rank_deficient_matrix``, kept as n × rank factors."""
+    rng = _random_state(seed)
+    U, _ = qr(rng.randn(n, rank))
+    V, _ = qr(rng.randn(n, rank))
+    s = np.linspace(1.0, 0.1, n)[:rank]
+    return LowRankOperator(U.astype(dtype), s.astype(dtype), V.T.astype(dtype))
@@ -0,0 +1,200 @@
+"""
+Synthetic test problems with known structure.
+
+Two families:
+
+Operators with a prescribed spectrum, A = U diag(s) V^T, kept in factored
+form (forward_models.linear_operator.FactoredOperator). U and V are fast
+orthogonal transforms (Householder products, DCT or Walsh-Hadamard; see
+forward_models.orthogonal), so the SVD is known exactly and the
+reconstructors in reconstruction.factored apply spectral filters at the cost
+of two transforms. Nothing is ever factored, which makes n = 50 000 as cheap
+to set up as n = 500.
+
+Classic ill-posed test problems after Hansen's Regularization Tools, each
+discretized by the midpoint rule on n points and returned as an operator
+with fast products together with the exact solution:
+
+    heat      inverse heat equation, Volterra kernel
+              k(t) = t^{-3/2} / (2κ√π) exp(-1 / (4κ² t)); lower-triangular
+              Toeplitz, applied by FFT
+    shaw      1-D image restoration, K(s, t) = (cos s + cos t)² sinc²(sin s + sin t)
+              on [-π/2, π/2]; no fast structure, rows generated on the fly
+    deriv2    second derivative, Green's function K(s, t) = s (t - 1) for s < t;
+              symmetric semiseparable, applied with cumulative sums in O(n)
+    gravity   gravity surveying, K(s, t) = d (d² + (s - t)²)^{-3/2};
+              symmetric Toeplitz, applied by FFT
+
+Every classic problem returns (A, x_true); the noise-free data is A @ x_true.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from forward_models.linear_operator import (FactoredOperator, KernelOperator, LinearOperator,
+                                            ToeplitzOperator)
+from forward_models.orthogonal import DCTOperator, HadamardOperator, HouseholderOperator
+
+
+BASES = ('householder', 'dct', 'hadamard')
+DECAYS = ('exponential', 'polynomial', 'linear')
+
+
+def spectrum_profile(n: int, decay: str = 'exponential', condition: float = 1e6,
+                     rank: int | None = None) -> np.ndarray:
+    """
+    Descending singular values from 1 down to 1 / ``condition``.
+
+    'exponential' is geometric, 'polynomial' is i^{-p} with p chosen to reach
+    the condition number at i = n, 'linear' is evenly spaced. With ``rank``
+    the values past the first ``rank`` are set to zero.
+    """
+    if decay == 'exponential':
+        s = np.geomspace(1.0, 1.0 / condition, n)
+    elif decay == 'polynomial':
+        p = np.log(condition) / np.log(n) if n > 1 else 0.0
+        s = np.arange(1, n + 1, dtype=float) ** -p
+    elif decay == 'linear':
+        s = np.linspace(1.0, 1.0 / condition, n)
+    else:
+        raise ValueError(f"decay must be one of {list(DECAYS)}")
+    if rank is not None:
+        s[rank:] = 0.0
+    return s
+
+
+def orthogonal_factor(n: int, basis: str = 'dct', seed=None, reflectors: int = 8,
+                      dtype=np.float64) -> LinearOperator:
+    """Fast orthogonal n × n operator of the given ``basis`` (see ``BASES``)."""
+    if basis == 'householder':
+        return HouseholderOperator.random(n, reflectors, seed, dtype)
+    if basis == 'dct':
+        return DCTOperator(n, dtype)
+    if basis == 'hadamard':
+        return HadamardOperator(n, dtype)
+    raise ValueError(f"basis must be one of {list(BASES)}")
+
+
+def factored_operator(s: np.ndarray, left: str = 'dct', right: str = 'householder',
+                      seed=None, reflectors: int = 8, dtype=np.float64) -> FactoredOperator:
+    """
+    Operator with singular values ``s`` and fast orthogonal singular vectors.
+
+    Parameters
+    ----------
+    s : np.ndarray
+        Singular values (n,)
+    left, right : str
+        Bases of U and V (see ``BASES``); 'hadamard' needs n a power of two
+    seed : int, optional
+        Seed for the Householder vectors (U and V draw independent streams)
+    reflectors : int
+        Reflections per Householder factor
+    dtype : np.dtype
+        Storage dtype
+    """
+    n = len(s)
+    seeds = np.random.SeedSequence(seed).spawn(2)
+    U = orthogonal_factor(n, left, np.random.default_rng(seeds[0]), reflectors, dtype)
+    V = orthogonal_factor(n, right, np.random.default_rng(seeds[1]), reflectors, dtype)
+    return FactoredOperator(U, np.asarray(s, dtype=dtype), V)
+
+
+def prescribed_spectrum(n: int, decay: str = 'exponential', condition: float = 1e6,
+                        rank: int | None = None, left: str = 'dct', right: str = 'householder',
+                        seed=None, dtype=np.float64) -> FactoredOperator:
+    """``factored_operator`` with singular values from ``spectrum_profile``."""
+    return factored_operator(spectrum_profile(n, decay, condition, rank), left, right, seed,
+                             dtype=dtype)
+
+
+def _midpoints(n: int, a: float = 0.0, b: float = 1.0) -> tuple:
+    h = (b - a) / n
+    return a + (np.arange(n) + 0.5) * h, h
+
+
+def _finish(A: LinearOperator, x: np.ndarray, dense: bool, dtype) -> tuple:
+    x = x.astype(dtype, copy=False)
+    return (A.to_dense() if dense else A), x
+
+
+def heat(n: int, kappa: float = 1.0, dense: bool = False, dtype=np.float64) -> tuple:
+    """
+    Inverse heat equation on [0, 1]; κ controls the ill-conditioning
+    (κ = 1 severe, κ = 5 mild). The solution is a pair of smooth pulses.
+    """
+    t, h = _midpoints(n)
+    c = h * t ** -1.5 / (2 * kappa * np.sqrt(np.pi)) * np.exp(-1.0 / (4 * kappa ** 2 * t))
+    row = np.zeros(n)
+    row[0] = c[0]
+    A = ToeplitzOperator(c.astype(dtype), row.astype(dtype))
+    x = np.exp(-((t - 0.3) / 0.08) ** 2) + 0.5 * np.exp(-((t - 0.6) / 0.05) ** 2)
+    return _finish(A, x, dense, dtype)
+
+
+def _shaw_kernel(s, t):
+    return (np.cos(s) + np.cos(t)) ** 2 * np.sinc(np.sin(s) + np.sin(t)) ** 2
+
+
+def shaw(n: int, dense: bool = False, block: int = 1024, dtype=np.float64) -> tuple:
+    """One-dimensional image restoration on [-π/2, π/2] with two Gaussian bumps."""
+    t, h = _midpoints(n, -np.pi / 2, np.pi / 2)
+    A = KernelOperator(_shaw_kernel, t, t, h, block, dtype)
+    x = 2 * np.exp(-6 * (t - 0.8) ** 2) + np.exp(-2 * (t + 0.5) ** 2)
+    return _finish(A, x, dense, dtype)
+
+
+class Deriv2Operator(LinearOperator):
+    """
+    Midpoint discretization of the Green's function of d²/dt² on [0, 1].
+
+    A[i, j] = h t_j (t_i - 1) for j < i, h t_i (t_j - 1) for j > i, which
+    is rank one on each side of the diagonal, so products are two cumulative
+    sums in O(n). A is symmetric.
+    """
+
+    def __init__(self, n: int, dtype=np.float64):
+        t, h = _midpoints(n)
+        self.a = h * (t - 1.0)
+        self.b = t
+        self.diag = h * t * (t - 1.0)
+        self.shape = (n, n)
+        self.dtype = np.dtype(dtype)
+
+    def matvec(self, x):
+        x = np.asarray(x)
+        col = (-1,) + (1,) * (x.ndim - 1)
+        a, b = self.a.reshape(col), self.b.reshape(col)
+        bx, ax = b * x, a * x
+        # Exclusive prefix sums of b x and exclusive suffix sums of a x
+        below = np.cumsum(bx, axis=0) - bx
+        above = np.cumsum(ax[::-1], axis=0)[::-1] - ax
+        out = a * below + b * above + self.diag.reshape(col) * x
+        return out.astype(np.result_type(x, self.dtype), copy=False)
+
+    def rmatvec(self, y):
+        return self.matvec(y)
+
+    def fingerprint(self):
+        return ('deriv2', self.shape[0], self.dtype.str)
+
+
+def deriv2(n: int, dense: bool = False, dtype=np.float64) -> tuple:
+    """Second-derivative problem with solution x(t) = t."""
+    A = Deriv2Operator(n, dtype)
+    return _finish(A, A.b.copy(), dense, dtype)
+
+
+def gravity(n: int, depth: float = 0.25, dense: bool = False, dtype=np.float64) -> tuple:
+    """
+    Gravity surveying: mass density at ``depth`` below the measurement line;
+    deeper sources give a smoother, worse-conditioned kernel.
+    """
+    t, h = _midpoints(n)
+    c = h * depth * (depth ** 2 + (t - t[0]) ** 2) ** -1.5
+    A = ToeplitzOperator(c.astype(dtype))
+    x = np.sin(np.pi * t) + 0.5 * np.sin(2 * np.pi * t)
+    return _finish(A, x, dense, dtype)
+
+
+PROBLEMS = {'heat': heat, 'shaw': shaw, 'deriv2': deriv2, 'gravity': gravity}
@@ -0,0 +1,21 @@
+"""
+Measurement noise models.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'noise',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
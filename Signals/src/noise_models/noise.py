@@ -3,6 +3,18 @@ import numpy as np
 
 
 def add_gaussian_noise(y: np.ndarray, sigma: float, rng: np.random.Generator | None = None):
+    """y plus N(0, sigma²) noise in the dtype of y (drawn in float64, so a
+    float32 and a float64 copy of y see the same realization)."""
     rng = rng or np.random.default_rng()
-    noise = rng.normal(0.0, sigma, size=y.shape)
+    noise = rng.normal(0.0, sigma, size=y.shape).astype(np.result_type(y, np.float32), copy=False)
     return y + noise, noise
+
+
+def noise_streams(n_levels: int, seed=None) -> list:
+    """One independent generator per noise level, spawned from ``seed``.
+
+    Level i always sees the same stream, however many levels or trials are
+    drawn alongside it.
+    """
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n_levels)]
+
@@ -0,0 +1,23 @@
+"""
+Batch and streaming reconstruction pipelines.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'batch',
+    'dataset',
+    'streaming',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,412 @@
+"""
+Batch reconstruction from a JSON job manifest.
+
+A manifest names the operators, the methods with their parameters (fixed
+values or a parameter-choice rule) and the jobs:
+
+    {
+      "output": "runs/nightly",
+      "store": "~/.cache/signals/operators",
+      "seed": 0,
+      "operators": {
+        "blur": {"type": "blur", "sigma": 2.0, "kernel_radius": 10},
+        "half": {"type": "downsample", "factor": 2},
+        "low": {"type": "rank_deficient", "rank": 40, "seed": 1}
+      },
+      "methods": [
+        {"method": "tikhonov", "lambda": "gcv"},
+        {"method": "tsvd", "k": "discrepancy", "noise_level": 0.01},
+        {"method": "nsit", "noise_level": 0.01, "schedule_type": "sqrt"},
+        {"method": "pseudoinverse"}
+      ],
+      "jobs": [
+        {"input": "data/y.npy", "operator": "blur", "truth": "data/x.npy"},
+        {"input": "data/pair.npz", "operator": "half"},
+        {"input": "../images/toy100x100.png", "operator": "blur", "noise_sigma": 0.01}
+      ]
+    }
+
+Inputs:
+
+    .npy         measurement: a vector, or an image reconstructed with the
+                 separable operator built from the operator spec per axis
+    .npz         key 'y' is the measurement, optional key 'x' the truth
+    .png / .jpg  ground-truth image (grayscale, scaled to [0, 1]); the
+                 measurement is simulated as A x plus N(0, noise_sigma²)
+                 noise from a stream seeded by the manifest seed and the
+                 job's position, so reruns see the same data
+
+The operator dimension follows from the data unless the spec gives 'n'.
+With 'store' set, dense operators and their SVDs come from the on-disk
+OperatorStore, so workers share them instead of rebuilding. Relative paths
+are resolved against the manifest's directory. Method fields other than
+'method' and 'label' are passed to the reconstructor.
+
+Jobs run on a process pool, each job applying every pending method to its
+measurement. Every finished (job, method) writes
+``<output>/<job>/<label>.npy`` and appends one line to
+``<output>/checkpoint.jsonl``; a rerun skips what the checkpoint already
+holds, so an interrupted batch resumes where it stopped. A summary with
+per-job seconds and throughput (unknowns reconstructed per second) is
+written to ``<output>/summary.json``. A method or job that raises is logged
+and listed under 'failures' without stopping the batch; it is not
+checkpointed, so the next run retries it, and the exit status is 1.
+
+Usage:
+
+    python -m pipeline.batch manifest.json --workers 4
+    signals-batch manifest.json --restart
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+OPERATOR_TYPES = ('blur', 'downsample', 'rank_deficient')
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+CHECKPOINT = 'checkpoint.jsonl'
+SUMMARY = 'summary.json'
+
+
+def load_manifest(path) -> dict:
+    """Read a manifest and resolve its paths against the manifest's directory."""
+    path = Path(path)
+    manifest = json.loads(path.read_text())
+    base = path.resolve().parent
+
+    def resolve(p):
+        p = Path(p).expanduser()
+        return str(p if p.is_absolute() else base / p)
+
+    for key in ('operators', 'methods', 'jobs'):
+        if key not in manifest:
+            raise ValueError(f"manifest is missing '{key}'")
+    for name, spec in manifest['operators'].items():
+        if spec.get('type') not in OPERATOR_TYPES:
+            raise ValueError(f"operator {name!r}: type must be one of {list(OPERATOR_TYPES)}")
+
+    manifest['output'] = resolve(manifest.get('output', 'batch_output'))
+    if manifest.get('store'):
+        manifest['store'] = resolve(manifest['store'])
+    labels = set()
+    for method in manifest['methods']:
+        method.setdefault('label', method_label(method))
+        if method['label'] in labels:
+            raise ValueError(f"duplicate method label {method['label']!r}")
+        labels.add(method['label'])
+    ids = set()
+    for index, job in enumerate(manifest['jobs']):
+        if job.get('operator') not in manifest['operators']:
+            raise ValueError(f"job {index}: unknown operator {job.get('operator')!r}")
+        job['input'] = resolve(job['input'])
+        if 'truth' in job:
+            job['truth'] = resolve(job['truth'])
+        job.setdefault('id', f"{index:04d}-{Path(job['input']).stem}-{job['operator']}")
+        if job['id'] in ids:
+            raise ValueError(f"duplicate job id {job['id']!r}")
+        ids.add(job['id'])
+    return manifest
+
+
+def method_label(method: dict) -> str:
+    """Output name of a method entry, e.g. 'tikhonov-gcv' or 'tsvd-k20'."""
+    name = method['method']
+    for key, prefix in (('lambda', ''), ('k', 'k')):
+        if key in method:
+            value = method[key]
+            return f"{name}-{value}" if isinstance(value, str) else f"{name}-{prefix}{value:g}"
+    return name
+
+
+# -- operators and data ----------------------------------------------------
+
+def _matrix(spec: dict, n: int, store) -> np.ndarray:
+    kind = spec['type']
+    if kind == 'blur':
+        builder = 'blur_matrix'
+        params = {'n': n, 'sigma': spec.get('sigma', 2.0), 'kernel_radius': spec.get('kernel_radius', 10)}
+    elif kind == 'downsample':
+        builder = 'downsample_matrix'
+        params = {'n': n, 'factor': spec.get('factor', 2)}
+    else:
+        builder = 'rank_deficient_matrix'
+        params = {'n': n, 'rank': spec['rank'], 'seed': spec.get('seed', 0)}
+    if store is not None:
+        return store.operator(builder, **params)
+    from reconstruction.operator_store import BUILDERS
+    return BUILDERS[builder](**params)
+
+
+def _input_size(spec: dict, m: int) -> int:
+    """Signal length n for which the operator produces m measurements."""
+    return m * spec.get('factor', 2) if spec['type'] == 'downsample' else m
+
+
+def build_operator(spec: dict, shape: tuple, from_truth: bool, store=None):
+    """
+    Operator for data of ``shape``: a matrix for vectors, a SeparableOperator
+    (one matrix per axis) for images. ``shape`` is the truth's shape when
+    ``from_truth``, the measurement's otherwise.
+    """
+    from forward_models.separable_operator import SeparableOperator
+
+    sizes = [spec.get('n') or (d if from_truth else _input_size(spec, d)) for d in shape]
+    if len(shape) == 1:
+        return _matrix(spec, sizes[0], store)
+    if len(shape) == 2:
+        A_c = _matrix(spec, sizes[0], store)
+        A_r = A_c if sizes[1] == sizes[0] else _matrix(spec, sizes[1], store)
+        return SeparableOperator(A_c, A_r)
+    raise ValueError(f"expected a vector or an image, got shape {shape}")
+
+
+def read_image(path: str) -> np.ndarray:
+    """Grayscale image in [0, 1] (needs Pillow, which the plot extra pulls in)."""
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise ImportError("reading image files needs Pillow: pip install 'signals-regularization[plot]'") from exc
+    with Image.open(path) as image:
+        return np.asarray(image.convert('L'), dtype=np.float64) / 255.0
+
+
+def load_job_data(job: dict, spec: dict, index: int, seed: int, store=None) -> tuple:
+    """(A, y, x_true or None) of one job."""
+    path = job['input']
+    suffix = Path(path).suffix.lower()
+    x_true = np.load(job['truth']) if 'truth' in job else None
+    if suffix in IMAGE_SUFFIXES:
+        x_true = read_image(path)
+        A = build_operator(spec, x_true.shape, True, store)
+        rng = np.random.default_rng([seed, index])
+        y = A @ x_true
+        return A, y + rng.normal(0.0, job.get('noise_sigma', 0.0), size=y.shape), x_true
+    if suffix == '.npz':
+        with np.load(path) as data:
+            y = data['y']
+            x_true = data['x'] if 'x' in data else x_true
+    elif suffix == '.npy':
+        y = np.load(path)
+    else:
+        raise ValueError(f"unsupported input {path!r}")
+    shape = x_true.shape if x_true is not None else y.shape
+    return build_operator(spec, shape, x_true is not None, store), y, x_true
+
+
+# -- methods ---------------------------------------------------------------
+
+def run_method(A, y: np.ndarray, method: dict) -> tuple:
+    """Solution and extra fields of one method entry."""
+    import reconstruction
+
+    name = method['method']
+    params = {k: v for k, v in method.items() if k not in ('method', 'label')}
+    if name == 'pseudoinverse':
+        return reconstruction.pseudoinverse.reconstruct(A, y, **params), {}
+    if name == 'tikhonov':
+        lam = params.pop('lambda')
+        return reconstruction.tikhonov.reconstruct(A, y, lam, **params), {}
+    if name == 'tsvd':
+        k = params.pop('k')
+        return reconstruction.tsvd.reconstruct(A, y, k, **params), {}
+    if name == 'nsit':
+        noise_level = params.pop('noise_level')
+        x_hat, history = reconstruction.nsit.nsit_with_morozov(A, y, noise_level, store_every=None, **params)
+        return x_hat, {'iterations': history['stopping_iter'] + 1}
+    if name == 'fnsit':
+        from forward_models.separable_operator import SeparableOperator
+
+        args = [params.pop(key, default) for key, default in
+                (('alpha0', 1.0), ('q', 0.8), ('max_iter', 100), ('tau', 1.0), ('delta', 0.01))]
+        if isinstance(A, SeparableOperator):
+            # FNSIT works on vectors: run it on the column-stacked image
+            x_hat, history = reconstruction.fnsit.fnsit_reconstruct(
+                A.as_linear_operator(), y.ravel(order='F'), *args, **params)
+            x_hat = x_hat.reshape(A.input_shape, order='F')
+        else:
+            x_hat, history = reconstruction.fnsit.fnsit_reconstruct(A, y, *args, **params)
+        return x_hat, {'iterations': history['final_iteration'] + 1}
+    raise ValueError(f"unknown method {name!r}")
+
+
+def run_job(job: dict, index: int, manifest: dict, pending: list) -> list:
+    """Apply the ``pending`` method entries to one job; returns one record per method."""
+    from evaluation.error_metrics import scores
+
+    store = None
+    if manifest.get('store'):
+        from reconstruction.operator_store import OperatorStore
+        store = OperatorStore(manifest['store'])
+
+    start = time.perf_counter()
+    spec = manifest['operators'][job['operator']]
+    A, y, x_true = load_job_data(job, spec, index, manifest.get('seed', 0), store)
+    load_seconds = time.perf_counter() - start
+
+    out_dir = Path(manifest['output']) / job['id']
+    out_dir.mkdir(parents=True, exist_ok=True)
+    records = []
+    for method in pending:
+        start = time.perf_counter()
+        try:
+            x_hat, extra = run_method(A, y, method)
+        except Exception as exc:
+            # Keep going; the failure is reported but not checkpointed, so a rerun retries it
+            records.append({'job': job['id'], 'method': method['label'], 'error': repr(exc)})
+            continue
+        seconds = time.perf_counter() - start
+        np.save(out_dir / f"{method['label']}.npy", x_hat)
+        record = {
+            'job': job['id'],
+            'method': method['label'],
+            'output': str(out_dir / f"{method['label']}.npy"),
+            'seconds': seconds,
+            'load_seconds': load_seconds,
+            'unknowns': int(np.size(x_hat)),
+            'unknowns_per_second': np.size(x_hat) / seconds if seconds > 0 else float('inf'),
+            'pid': os.getpid(),
+            **extra,
+        }
+        if x_true is not None:
+            record.update(scores(x_true, x_hat))
+        records.append(record)
+    return records
+
+
+# -- checkpointing and driver ----------------------------------------------
+
+def read_checkpoint(output: str) -> dict:
+    """Completed (job, method) -> record, ignoring a torn last line."""
+    done = {}
+    path = Path(output) / CHECKPOINT
+    if not path.exists():
+        return done
+    for line in path.read_text().splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if Path(record['output']).exists():
+            done[(record['job'], record['method'])] = record
+    return done
+
+
+def _job_failed(job: dict, pending: list, exc: Exception) -> list:
+    return [{'job': job['id'], 'method': m['label'], 'error': repr(exc)} for m in pending]
+
+
+def _append(path: Path, records: list) -> None:
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def run_batch(manifest: dict, workers: int | None = None, restart: bool = False, log=print) -> dict:
+    """
+    Run every pending (job, method) of a loaded manifest; returns the summary.
+
+    ``workers`` defaults to the CPU count; 1 runs in this process.
+    ``restart`` discards the checkpoint and recomputes everything.
+    """
+    output = Path(manifest['output'])
+    output.mkdir(parents=True, exist_ok=True)
+    checkpoint = output / CHECKPOINT
+    if restart and checkpoint.exists():
+        checkpoint.unlink()
+    done = read_checkpoint(output)
+
+    work = []
+    for index, job in enumerate(manifest['jobs']):
+        pending = [m for m in manifest['methods'] if (job['id'], m['label']) not in done]
+        if pending:
+            work.append((job, index, pending))
+    log(f"{len(manifest['jobs'])} jobs, {len(done)} results checkpointed, {len(work)} jobs to run")
+
+    failures = []
+
+    def finished(records):
+        failures.extend(r for r in records if 'error' in r)
+        for r in records:
+            if 'error' in r:
+                log(f"{r['job']:<32} {r['method']:<24} FAILED {r['error']}")
+        records = [r for r in records if 'error' not in r]
+        _append(checkpoint, records)
+        for r in records:
+            done[(r['job'], r['method'])] = r
+            log(f"{r['job']:<32} {r['method']:<24} {r['seconds']:8.3f}s "
+                f"{r['unknowns_per_second']:12.0f} unknowns/s"
+                + (f"  rel_error {r['rel_error']:.4f}" if 'rel_error' in r else ''))
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(work) <= 1:
+        for job, index, pending in work:
+            try:
+                finished(run_job(job, index, manifest, pending))
+            except Exception as exc:
+                finished(_job_failed(job, pending, exc))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(min(workers, len(work))) as pool:
+            futures = {pool.submit(run_job, job, index, manifest, pending): (job, pending)
+                       for job, index, pending in work}
+            for future in as_completed(futures):
+                try:
+                    records = future.result()
+                except Exception as exc:
+                    records = _job_failed(*futures[future], exc)
+                finished(records)
+    wall = time.perf_counter() - start
+
+    records = [done[key] for key in sorted(done)]
+    jobs = {}
+    for r in records:
+        entry = jobs.setdefault(r['job'], {'methods': 0, 'seconds': 0.0, 'unknowns': 0})
+        entry['methods'] += 1
+        entry['seconds'] += r['seconds']
+        entry['unknowns'] += r['unknowns']
+    for entry in jobs.values():
+        entry['unknowns_per_second'] = entry['unknowns'] / entry['seconds'] if entry['seconds'] > 0 else None
+
+    ran = sum(len(p) for _, _, p in work) - len(failures)
+    summary = {
+        'jobs': jobs,
+        'records': records,
+        'failures': failures,
+        'wall_seconds': wall,
+        'computed': ran,
+        'results_per_second': ran / wall if wall > 0 else None,
+    }
+    (output / SUMMARY).write_text(json.dumps(summary, indent=2))
+    log(f"{ran} results in {wall:.2f}s ({summary['results_per_second'] or 0:.2f}/s), "
+        f"{len(failures)} failed, summary in {output / SUMMARY}")
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run a batch of reconstructions from a JSON manifest.')
+    parser.add_argument('manifest')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--output', help='override the manifest output directory')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and rerun every job')
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    if args.output:
+        manifest['output'] = str(Path(args.output).resolve())
+    summary = run_batch(manifest, args.workers, args.restart)
+    return int(bool(summary['failures']))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
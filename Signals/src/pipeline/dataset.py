@@ -0,0 +1,281 @@
+"""
+Synthetic datasets of random signals and their measurements, streamed to disk.
+
+    python -m pipeline.dataset data/train --count 1000000 --n 256 --operator blur --noise-level 0.01
+    signals-dataset data/images --count 20000 --shape 64 64 --operator blur --sigma 1.5
+
+writes into the output directory
+
+    x.npy       ground truth, (count × n) or (count × H × W)
+    y.npy       measurements A x + e, (count × m) or (count × H' × W')
+    sigma.npy   noise standard deviation of each measurement (count,)
+    meta.json   generator, operator and noise settings, chunking and throughput
+
+The arrays are created as .npy memmaps up front and filled chunk by chunk:
+a chunk of signals is synthesized in one vectorized call
+(signal_generation.random_signals), forward-modeled as one batched
+product and corrupted with relative Gaussian noise
+σ_b = noise_level ||A x_b|| / sqrt(m), then written to its rows. Nothing
+larger than a chunk is ever held in memory. With ``workers`` > 1 the chunks
+are spread over processes that write disjoint rows of the same files.
+
+Chunk i draws its signals and its noise from substream i of ``seed`` (the
+streams of random_signals.batch_streams), so the data depend only on the
+seed and the chunk size, not on the number of workers or the order in
+which chunks finish. meta.json is written last;
+a directory without it holds an interrupted run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from forward_models.separable_operator import SeparableOperator
+from reconstruction.precision import norm
+from signal_generation.random_signals import (image_parameters, signal_parameters, synthesize_images,
+                                              synthesize_signals)
+
+
+FILES = ('x.npy', 'y.npy', 'sigma.npy')
+META = 'meta.json'
+# Ground-truth bytes per chunk when no chunk size is given
+CHUNK_BYTES = 32 * 2**20
+
+
+def forward(A, X: np.ndarray) -> np.ndarray:
+    """
+    Measurements of every signal in a batch: X is (B × n) for a matrix or
+    LinearOperator, (B × H × W) for a SeparableOperator.
+    """
+    if isinstance(A, SeparableOperator):
+        return A.apply(X)
+    if isinstance(A, np.ndarray):
+        return X @ A.T
+    return np.ascontiguousarray((A @ X.T).T)
+
+
+def _cast(A, dtype):
+    """Dense factors in the storage dtype, so float32 datasets run float32 GEMMs."""
+    if isinstance(A, np.ndarray):
+        return A.astype(dtype, copy=False)
+    if isinstance(A, SeparableOperator):
+        return SeparableOperator(A.A_c.astype(dtype, copy=False), A.A_r.astype(dtype, copy=False))
+    return A
+
+
+def _output_shape(A, shape: tuple) -> tuple:
+    if isinstance(A, SeparableOperator):
+        return A.output_shape
+    return (A.shape[0],)
+
+
+def default_chunk(shape: tuple, dtype) -> int:
+    """Signals per chunk so that one chunk of ground truth is about CHUNK_BYTES."""
+    return max(1, CHUNK_BYTES // (int(np.prod(shape)) * np.dtype(dtype).itemsize))
+
+
+# Per-process state of a run, set once per worker
+_RUN = {}
+
+
+def _open(config: dict) -> None:
+    out = Path(config['output'])
+    _RUN.clear()
+    _RUN.update(config)
+    _RUN['arrays'] = [np.load(out / name, mmap_mode='r+') for name in FILES]
+
+
+def _write_chunk(index: int) -> int:
+    """Synthesize, measure and store chunk ``index``; returns its size."""
+    config = _RUN
+    x_map, y_map, sigma_map = config['arrays']
+    start = index * config['chunk']
+    stop = min(start + config['chunk'], config['count'])
+    B = stop - start
+    dtype = np.dtype(config['dtype'])
+    shape = config['shape']
+
+    rng = np.random.default_rng(config['streams'][index])
+    if len(shape) == 1:
+        X = synthesize_signals(signal_parameters(rng, B, **config['options']), shape[0], dtype)
+    else:
+        X = synthesize_images(image_parameters(rng, B, **config['options']), shape, dtype)
+
+    Y = forward(config['operator'], X).reshape(B, -1)
+    sigma = config['noise_level'] * norm(Y, axis=1) / np.sqrt(Y.shape[1])
+    noise = rng.standard_normal(Y.shape, dtype=dtype)
+    noise *= sigma.astype(dtype)[:, None]
+    Y += noise
+
+    x_map[start:stop] = X
+    y_map[start:stop] = Y.reshape((B,) + y_map.shape[1:])
+    sigma_map[start:stop] = sigma
+    return B
+
+
+def write_dataset(output, count: int, shape, operator, noise_level: float = 0.01, seed=0,
+                  chunk: int | None = None, dtype=np.float32, workers: int = 1,
+                  log=print, **options) -> dict:
+    """
+    Generate ``count`` random signals or images and their noisy measurements.
+
+    Parameters
+    ----------
+    output : str or Path
+        Directory for x.npy, y.npy, sigma.npy and meta.json
+    count : int
+        Number of signals
+    shape : int or tuple
+        Signal length n, or image shape (H, W)
+    operator : np.ndarray, LinearOperator or SeparableOperator
+        Forward operator; a SeparableOperator for images
+    noise_level : float
+        Relative noise level δ (σ_b = δ ||A x_b|| / sqrt(m))
+    seed : int
+        Seed of the per-chunk substreams
+    chunk : int, optional
+        Signals per chunk (defaults to ``default_chunk``)
+    dtype : np.dtype
+        Storage and compute dtype
+    workers : int
+        Worker processes; 1 runs in this process
+    log : callable
+        Progress output
+    **options
+        Passed to ``signal_parameters`` or ``image_parameters``
+
+    Returns
+    -------
+    meta : dict
+        The contents of meta.json, including 'seconds', 'signals_per_second'
+        and 'megabytes_per_second' (x and y bytes written)
+    """
+    shape = (shape,) if np.isscalar(shape) else tuple(int(d) for d in shape)
+    if len(shape) not in (1, 2):
+        raise ValueError(f"shape must be n or (H, W), got {shape}")
+    if (len(shape) == 2) != isinstance(operator, SeparableOperator):
+        raise ValueError("images need a SeparableOperator and 1-D signals a matrix or LinearOperator")
+    dtype = np.dtype(dtype)
+    chunk = chunk or default_chunk(shape, dtype)
+    n_chunks = -(-count // chunk)
+    operator = _cast(operator, dtype)
+    y_shape = _output_shape(operator, shape)
+
+    out = Path(output)
+    out.mkdir(parents=True, exist_ok=True)
+    (out / META).unlink(missing_ok=True)
+    for name, item_shape, item_dtype in zip(FILES, (shape, y_shape, ()), (dtype, dtype, np.float64)):
+        np.lib.format.open_memmap(out / name, mode='w+', dtype=item_dtype, shape=(count,) + item_shape).flush()
+
+    config = {
+        'output': str(out), 'count': count, 'shape': shape, 'chunk': chunk,
+        'dtype': dtype.str, 'noise_level': noise_level, 'options': options,
+        'operator': operator,
+        'streams': np.random.SeedSequence(seed).spawn(n_chunks),
+    }
+    log(f"{count} signals of shape {shape} in {n_chunks} chunks of {chunk}, {workers} worker(s)")
+
+    start = time.perf_counter()
+    written = 0
+    if workers == 1 or n_chunks == 1:
+        _open(config)
+        for index in range(n_chunks):
+            written += _write_chunk(index)
+        _RUN.clear()
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(workers, n_chunks), initializer=_open, initargs=(config,)) as pool:
+            for size in pool.map(_write_chunk, range(n_chunks)):
+                written += size
+    seconds = time.perf_counter() - start
+
+    nbytes = count * (int(np.prod(shape)) + int(np.prod(y_shape))) * dtype.itemsize
+    meta = {
+        'count': count,
+        'shape': list(shape),
+        'measurement_shape': list(y_shape),
+        'dtype': dtype.name,
+        'noise_level': noise_level,
+        'seed': seed,
+        'chunk': chunk,
+        'options': options,
+        'operator': operator_description(operator),
+        'seconds': seconds,
+        'signals_per_second': written / seconds if seconds > 0 else None,
+        'megabytes_per_second': nbytes / 2**20 / seconds if seconds > 0 else None,
+    }
+    (out / META).write_text(json.dumps(meta, indent=2))
+    log(f"{written} signals in {seconds:.2f}s ({meta['signals_per_second'] or 0:.0f}/s, "
+        f"{meta['megabytes_per_second'] or 0:.0f} MB/s) in {out}")
+    return meta
+
+
+def operator_description(A) -> dict:
+    """JSON-ready description of the operator used (type and shapes)."""
+    if isinstance(A, SeparableOperator):
+        return {'type': 'SeparableOperator', 'A_c': list(A.A_c.shape), 'A_r': list(A.A_r.shape)}
+    return {'type': type(A).__name__, 'shape': list(A.shape)}
+
+
+def load_dataset(path, mmap: bool = True) -> tuple:
+    """(x, y, sigma, meta) of a finished dataset; arrays are read-only memmaps by default."""
+    path = Path(path)
+    if not (path / META).exists():
+        raise FileNotFoundError(f"{path} holds no finished dataset (no {META})")
+    mode = 'r' if mmap else None
+    x, y, sigma = (np.load(path / name, mmap_mode=mode) for name in FILES)
+    return x, y, sigma, json.loads((path / META).read_text())
+
+
+def main(argv=None) -> int:
+    from pipeline.batch import OPERATOR_TYPES, build_operator
+
+    parser = argparse.ArgumentParser(description='Write a dataset of random signals and noisy measurements.')
+    parser.add_argument('output')
+    parser.add_argument('--count', type=int, required=True)
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--n', type=int, help='signal length')
+    size.add_argument('--shape', type=int, nargs=2, metavar=('H', 'W'), help='image shape')
+    parser.add_argument('--operator', choices=OPERATOR_TYPES, default='blur')
+    parser.add_argument('--sigma', type=float, default=2.0, help='blur width')
+    parser.add_argument('--kernel-radius', type=int, default=10)
+    parser.add_argument('--factor', type=int, default=2, help='downsampling factor')
+    parser.add_argument('--rank', type=int, help='rank of the rank_deficient operator')
+    parser.add_argument('--noise-level', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk', type=int)
+    parser.add_argument('--dtype', default='float32')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--components', type=int, default=3, help='sinusoids or plane waves per signal')
+    parser.add_argument('--jumps', type=int, default=1, help='jumps per signal (rectangles per image)')
+    parser.add_argument('--spikes', type=int, default=1, help='spikes per signal (blobs per image)')
+    parser.add_argument('--max-freq', type=float)
+    args = parser.parse_args(argv)
+
+    spec = {'type': args.operator, 'sigma': args.sigma, 'kernel_radius': args.kernel_radius,
+            'factor': args.factor, 'rank': args.rank, 'seed': args.seed}
+    if args.operator == 'rank_deficient' and args.rank is None:
+        parser.error('--rank is required for the rank_deficient operator')
+    shape = (args.n,) if args.n else tuple(args.shape)
+    operator = build_operator(spec, shape, True)
+
+    options = {'components': args.components}
+    if len(shape) == 1:
+        options.update(jumps=args.jumps, spikes=args.spikes)
+    else:
+        options.update(rectangles=args.jumps, blobs=args.spikes)
+    if args.max_freq is not None:
+        options['max_freq'] = args.max_freq
+
+    write_dataset(args.output, args.count, shape, operator, args.noise_level, args.seed, args.chunk,
+                  args.dtype, args.workers, **options)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
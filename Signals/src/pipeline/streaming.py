@@ -0,0 +1,160 @@
+"""
+Streaming reconstruction over memory-mapped measurement files.
+
+Measurements are stored as one ``.npy`` file of shape (frames × m), one
+frame per row, and may be far larger than RAM. Each stage reads a chunk of
+rows through ``np.load(mmap_mode='r')``, reconstructs it with any
+reconstructor taking an (m × B) block, and writes the (B × n) result into an
+output ``.npy`` memmap. Peak memory is a few chunks, independent of the
+file size.
+
+A background thread reads the next chunk while the current one is being
+reconstructed.
+
+Example
+-------
+>>> stage = stream_reconstruct('y.npy', 'x_hat.npy',
+...                            lambda Y: tikhonov.reconstruct(A, Y, 0.05),
+...                            truth_path='x.npy')
+>>> for chunk in stage:
+...     print(chunk['start'], chunk['metrics']['rel_error'].mean())
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+
+import numpy as np
+from evaluation.error_metrics import frame_metrics
+
+
+def iter_chunks(source, chunk_size: int):
+    """Yield (start, stop, rows) over the first axis of an array or ``.npy`` path.
+
+    Rows are copied out of the memmap, so reading happens here and not
+    later inside the reconstructor.
+    """
+    data = np.load(source, mmap_mode='r') if isinstance(source, str) else source
+    for start in range(0, data.shape[0], chunk_size):
+        stop = min(start + chunk_size, data.shape[0])
+        yield start, stop, np.array(data[start:stop])
+
+
+def prefetch(iterable, depth: int = 1):
+    """Run ``iterable`` in a background thread, keeping up to ``depth`` items ready.
+
+    Closing the generator early (or an exception in the consumer) stops the
+    thread: every hand-off, including the end marker and a raised error,
+    gives up once the consumer has gone.
+    """
+    items = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as exc:
+            put(exc)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def stream_reconstruct(measurements_path: str, output_path: str, reconstruct,
+                       chunk_size: int = 1024, truth_path: str | None = None,
+                       dtype=np.float64, prefetch_depth: int = 1):
+    """
+    Reconstruct a measurement file chunk by chunk into an output memmap.
+
+    Parameters
+    ----------
+    measurements_path : str
+        ``.npy`` file of shape (frames × m)
+    output_path : str
+        ``.npy`` file to create, of shape (frames × n)
+    reconstruct : callable
+        Y (m × B) -> X (n × B), e.g. ``lambda Y: tikhonov.reconstruct(A, Y, lam)``
+    chunk_size : int
+        Frames per chunk; bounds peak memory
+    truth_path : str, optional
+        ``.npy`` file of ground truth (frames × n); enables per-frame metrics
+    dtype : dtype
+        Storage type of the output file
+    prefetch_depth : int
+        Chunks read ahead in the background (0 reads synchronously)
+
+    Yields
+    ------
+    chunk : dict
+        'start', 'stop' frame indices and, with ``truth_path``, 'metrics':
+        per-frame arrays of 'mse', 'psnr' and 'rel_error'
+    """
+    n_frames = np.load(measurements_path, mmap_mode='r').shape[0]
+    chunks = iter_chunks(measurements_path, chunk_size)
+    if prefetch_depth > 0:
+        chunks = prefetch(chunks, prefetch_depth)
+    truth = np.load(truth_path, mmap_mode='r') if truth_path is not None else None
+
+    out = None
+    try:
+        for start, stop, Y in chunks:
+            X = reconstruct(Y.T).T
+            if out is None:
+                out = np.lib.format.open_memmap(output_path, mode='w+', dtype=dtype,
+                                                shape=(n_frames, X.shape[1]))
+            out[start:stop] = X
+
+            result = {'start': start, 'stop': stop}
+            if truth is not None:
+                result['metrics'] = frame_metrics(np.asarray(truth[start:stop]), X)
+            yield result
+    finally:
+        # Stop the reader thread now, not whenever the generator is collected
+        chunks.close()
+
+    if out is not None:
+        out.flush()
+        del out
+
+
+def reconstruct_file(measurements_path: str, output_path: str, reconstruct,
+                     **kwargs) -> dict:
+    """Run ``stream_reconstruct`` to completion and return summary statistics.
+
+    Returns the number of frames processed and, when a ground truth is
+    given, the mean of each metric over all frames.
+    """
+    frames = 0
+    totals = {}
+    for chunk in stream_reconstruct(measurements_path, output_path, reconstruct, **kwargs):
+        frames += chunk['stop'] - chunk['start']
+        for name, values in chunk.get('metrics', {}).items():
+            totals[name] = totals.get(name, 0.0) + float(np.sum(values))
+    summary = {'frames': frames}
+    summary.update({f"mean_{name}": total / frames for name, total in totals.items()})
+    return summary
@@ -0,0 +1,47 @@
+"""
+Reconstruction methods (pseudoinverse, Tikhonov, TSVD, NSIT, FNSIT) and
+their shared machinery.
+
+Every package here resolves its submodules lazily through a module-level
+``__getattr__``: ``import reconstruction`` loads nothing, and
+``reconstruction.tikhonov`` imports just that module and its dependencies
+on first access. Worker processes therefore only pay for what they use.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'advisor',
+    'advisor_server',
+    'cgls',
+    'factored',
+    'factorization',
+    'fnsit',
+    'fourier',
+    'inner_solvers',
+    'learned',
+    'nsit',
+    'operator_store',
+    'parameter_choice',
+    'partial_svd',
+    'precision',
+    'pseudoinverse',
+    'schedules',
+    'separable',
+    'spectral_filters',
+    'telemetry',
+    'tikhonov',
+    'tsvd',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
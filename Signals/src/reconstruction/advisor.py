@@ -0,0 +1,317 @@
+"""
+Regularization-parameter advice from a remote service, with a classical fallback.
+
+Instead of sending a free-form prompt per problem, each problem is reduced
+to a compact spectral summary built from its Picard data (s_i, |u_i^T y|):
+
+    n_singular      number of singular values
+    log10_cond      log10(s_max / s_min) over the nonzero singular values
+    decay           slope of log10 s_i against i / n (spectral decay rate)
+    picard_ratio    log10(|u_i^T y| / s_i) at the deciles of i
+    noise_floor     σ estimated from the median |u_i^T y| over the last
+                    quarter of i, where noise dominates the coefficients
+    noise_level     relative noise estimate σ √m / ||y||, or the caller's δ
+    picard_index    i / n past which the locally averaged |u_i^T y| stays
+                    below twice the noise floor
+    log10_s_picard  log10 s at that index
+
+The service receives batches of summaries as JSON
+
+    POST {"requests": [{"id": "0", "summary": {...}}, ...]}
+    ->   {"answers":  [{"id": "0", "lambda": 0.01, "k": 42}, ...]}
+
+and ``Advisor`` sends them from an asyncio client: at most ``concurrency``
+requests in flight, each with a timeout and retried with exponential
+backoff. Answers are cached by a quantized summary (values rounded to
+``QUANTUM`` in their log or relative scale), so problems with the same
+spectral shape share one answer. Whenever the service is unreachable or
+returns an unusable answer, the parameters come from a classical rule in
+reconstruction.parameter_choice instead (GCV, or the discrepancy principle
+when a noise level is given). Every result records its 'source'.
+
+reconstruction.advisor_server provides a local stand-in service speaking
+this protocol, for testing without network access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from urllib.parse import urlsplit
+
+import numpy as np
+from reconstruction.parameter_choice import choose_k, choose_lambda, spectral_data
+from reconstruction.precision import norm
+
+
+# Rounding step of every summary field in the cache key
+QUANTUM = 0.1
+DEFAULT_URL = os.environ.get('SIGNALS_ADVISOR_URL', 'http://127.0.0.1:8765/advise')
+
+
+def spectral_summary(A, y: np.ndarray, noise_level: float | None = None) -> dict:
+    """Compact, JSON-ready spectral description of the problem (A, y)."""
+    s, c, _ = spectral_data(A, y)
+    order = np.argsort(-s, kind='stable')
+    s, c = s[order], np.abs(c[order])
+    p = len(s)
+    positive = s > s[0] * np.finfo(float).eps * p
+    s_pos, c_pos = s[positive], c[positive]
+    r = len(s_pos)
+
+    t = np.arange(r) / max(r - 1, 1)
+    decay = float(np.polyfit(t, np.log10(s_pos), 1)[0]) if r > 1 else 0.0
+    tiny = np.finfo(float).tiny
+    deciles = np.minimum((np.linspace(0.0, 1.0, 11) * (r - 1)).astype(int), r - 1)
+    ratio = np.log10(np.maximum(c_pos[deciles], tiny) / s_pos[deciles])
+
+    # For white noise |u_i^T y| ~ |N(0, σ²)|, whose median is 0.6745 σ
+    floor = float(np.median(c_pos[3 * r // 4:])) / 0.6745 if r >= 4 else float(c_pos[-1])
+    y_norm = float(norm(y))
+    if noise_level is None:
+        noise_level = floor * np.sqrt(np.size(y)) / y_norm if y_norm > 0 else 0.0
+
+    # Last index where the locally averaged coefficients still exceed the floor
+    w = max(3, r // 32) | 1
+    log_c = np.pad(np.log(np.maximum(c_pos, tiny)), w // 2, mode='edge')
+    smooth = np.exp(np.convolve(log_c, np.ones(w) / w, mode='valid'))
+    above = np.flatnonzero(smooth > 2.0 * floor)
+    index = min(int(above[-1]) + 1, r - 1) if len(above) else 0
+
+    return {
+        'n_singular': p,
+        'log10_cond': float(np.log10(s_pos[0] / s_pos[-1])),
+        'decay': decay,
+        'picard_ratio': [float(v) for v in ratio],
+        'noise_floor': floor,
+        'noise_level': float(noise_level),
+        'picard_index': index / max(r - 1, 1),
+        'log10_s_picard': float(np.log10(s_pos[index])),
+    }
+
+
+def summary_key(summary: dict) -> str:
+    """Cache key: the summary with every value rounded to QUANTUM."""
+    def q(value, log=False):
+        if log:
+            value = np.log10(max(value, np.finfo(float).tiny))
+        return round(round(value / QUANTUM) * QUANTUM, 6)
+
+    quantized = {
+        'n_singular': summary['n_singular'],
+        'log10_cond': q(summary['log10_cond']),
+        'decay': q(summary['decay']),
+        'picard_ratio': [q(v) for v in summary['picard_ratio']],
+        'noise_level': q(summary['noise_level'], log=True),
+        'picard_index': q(summary['picard_index']),
+        'log10_s_picard': q(summary['log10_s_picard']),
+    }
+    return json.dumps(quantized, sort_keys=True)
+
+
+class AdvisorError(RuntimeError):
+    """The service could not be reached or answered with an error."""
+
+
+def _dechunk(content: bytes) -> bytes:
+    """Body of a ``Transfer-Encoding: chunked`` response."""
+    out = []
+    while True:
+        line, _, content = content.partition(b'\r\n')
+        size = int(line.split(b';', 1)[0], 16)
+        if size == 0:
+            return b''.join(out)
+        if len(content) < size:
+            raise ValueError("truncated chunked body")
+        out.append(content[:size])
+        content = content[size + 2:]
+
+
+async def _post_json(url: str, payload: dict, timeout: float, api_key: str | None = None) -> dict:
+    """POST a JSON body over HTTP/1.1 with asyncio streams and return the JSON reply."""
+    parts = urlsplit(url)
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    body = json.dumps(payload).encode()
+    headers = [
+        f"POST {parts.path or '/'}{'?' + parts.query if parts.query else ''} HTTP/1.1",
+        f"Host: {parts.hostname}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+    ]
+    if api_key:
+        headers.append(f"Authorization: Bearer {api_key}")
+
+    async def exchange():
+        reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=secure or None)
+        try:
+            writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode() + body)
+            await writer.drain()
+            raw = await reader.read()
+        finally:
+            writer.close()
+        head, _, content = raw.partition(b'\r\n\r\n')
+        status = int(head.split(b' ', 2)[1]) if head.startswith(b'HTTP/') else 0
+        if status != 200:
+            raise AdvisorError(f"service answered with status {status}")
+        fields = dict(line.split(b':', 1) for line in head.split(b'\r\n')[1:] if b':' in line)
+        fields = {k.strip().lower(): v.strip().lower() for k, v in fields.items()}
+        if b'chunked' in fields.get(b'transfer-encoding', b''):
+            content = _dechunk(content)
+        return json.loads(content)
+
+    try:
+        return await asyncio.wait_for(exchange(), timeout)
+    except (OSError, ValueError, IndexError, asyncio.TimeoutError) as exc:
+        raise AdvisorError(f"{type(exc).__name__}: {exc}") from exc
+
+
+class Advisor:
+    """
+    Batched, cached parameter advice for many problems.
+
+    Parameters
+    ----------
+    url : str, optional
+        Service endpoint (defaults to $SIGNALS_ADVISOR_URL or the local
+        stand-in address); an empty string disables the service
+    api_key : str, optional
+        Sent as a bearer token (defaults to $SIGNALS_ADVISOR_KEY)
+    batch_size : int
+        Summaries per request
+    concurrency : int
+        Requests in flight at once
+    timeout : float
+        Seconds per request attempt
+    retries : int
+        Extra attempts after a failed request
+    backoff : float
+        Delay before the first retry, doubled for each further one
+    fallback_rule : str
+        parameter_choice rule used without a noise level; with one the
+        discrepancy principle is used
+    """
+
+    def __init__(self, url: str | None = None, api_key: str | None = None,
+                 batch_size: int = 8, concurrency: int = 4, timeout: float = 10.0,
+                 retries: int = 2, backoff: float = 0.5, fallback_rule: str = 'gcv'):
+        self.url = DEFAULT_URL if url is None else url
+        self.api_key = api_key if api_key is not None else os.environ.get('SIGNALS_ADVISOR_KEY')
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.fallback_rule = fallback_rule
+        self.cache = {}
+        self.stats = {'requests': 0, 'failures': 0, 'cache_hits': 0, 'fallbacks': 0}
+
+    async def advise_many(self, problems, noise_levels=None) -> list:
+        """
+        Parameters for each (A, y) in ``problems``.
+
+        Returns one dict per problem with 'lambda' (Tikhonov), 'k' (TSVD),
+        'source' ('service', 'cache' or 'fallback') and the 'summary'.
+        """
+        problems = list(problems)
+        if noise_levels is None or np.isscalar(noise_levels):
+            noise_levels = [noise_levels] * len(problems)
+        summaries = [spectral_summary(A, y, delta) for (A, y), delta in zip(problems, noise_levels)]
+        keys = [summary_key(s) for s in summaries]
+
+        results = [None] * len(problems)
+        pending = {}
+        for i, key in enumerate(keys):
+            if key in self.cache:
+                results[i] = dict(self.cache[key], source='cache')
+                self.stats['cache_hits'] += 1
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending and self.url:
+            unique = list(pending)
+            batches = [unique[b:b + self.batch_size] for b in range(0, len(unique), self.batch_size)]
+            limit = asyncio.Semaphore(self.concurrency)
+            answers = await asyncio.gather(*(self._ask(batch, keys, summaries, pending, limit)
+                                             for batch in batches))
+            for batch_answers in answers:
+                for key, answer in batch_answers.items():
+                    if key not in pending:
+                        continue
+                    first = pending[key][0]
+                    if self._valid(answer, summaries[first]):
+                        self.cache[key] = {'lambda': float(answer['lambda']), 'k': int(answer['k'])}
+
+        for key, indices in pending.items():
+            for i in indices:
+                if key in self.cache:
+                    results[i] = dict(self.cache[key], source='service')
+                else:
+                    results[i] = self._fallback(*problems[i], noise_levels[i])
+                    self.stats['fallbacks'] += 1
+
+        for result, summary in zip(results, summaries):
+            result['summary'] = summary
+        return results
+
+    def advise(self, A, y: np.ndarray, noise_level: float | None = None) -> dict:
+        """
+        Synchronous advice for one problem. Inside a running event loop
+        (e.g. Jupyter) the request runs on a helper thread with its own loop;
+        ``await advise_many(...)`` avoids blocking that loop.
+        """
+        def run():
+            return asyncio.run(self.advise_many([(A, y)], [noise_level]))[0]
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(1) as pool:
+            return pool.submit(run).result()
+
+    async def _ask(self, batch, keys, summaries, pending, limit) -> dict:
+        payload = {'requests': [{'id': key, 'summary': summaries[pending[key][0]]} for key in batch]}
+        async with limit:
+            for attempt in range(self.retries + 1):
+                self.stats['requests'] += 1
+                try:
+                    reply = await _post_json(self.url, payload, self.timeout, self.api_key)
+                    return self._answers(reply)
+                except AdvisorError:
+                    self.stats['failures'] += 1
+                    if attempt < self.retries:
+                        await asyncio.sleep(self.backoff * 2 ** attempt)
+        return {}
+
+    @staticmethod
+    def _answers(reply) -> dict:
+        # Answers by id; a reply of the wrong shape counts as no answer, so
+        # those problems fall back to the classical rule
+        answers = reply.get('answers') if isinstance(reply, dict) else None
+        if not isinstance(answers, list):
+            return {}
+        return {a['id']: a for a in answers if isinstance(a, dict) and isinstance(a.get('id'), str)}
+
+    @staticmethod
+    def _valid(answer: dict, summary: dict) -> bool:
+        try:
+            lam, k = float(answer['lambda']), int(answer['k'])
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return False
+        return np.isfinite(lam) and lam > 0 and 1 <= k <= summary['n_singular']
+
+    def _fallback(self, A, y, noise_level) -> dict:
+        if noise_level is not None:
+            rule = 'discrepancy'
+        else:
+            rule = self.fallback_rule
+        return {
+            'lambda': choose_lambda(A, y, rule, noise_level=noise_level),
+            'k': choose_k(A, y, rule, noise_level=noise_level),
+            'source': 'fallback',
+            'rule': rule,
+        }
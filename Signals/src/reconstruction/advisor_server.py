@@ -0,0 +1,143 @@
+"""
+Local stand-in for the parameter-advice service used by reconstruction.advisor.
+
+Speaks the same JSON protocol and answers from the summary alone: λ is the
+singular value at which the Picard coefficients reach the noise floor and k
+the index of that singular value, the usual hand-read of a Picard plot.
+It needs nothing beyond the standard library and binds to localhost, so
+the advisor can be exercised offline. ``delay`` and ``fail_first`` simulate
+a slow or flaky service for testing timeouts and retries.
+
+    python -m reconstruction.advisor_server --port 8765
+
+or, in-process:
+
+    with StubServer() as server:
+        advice = Advisor(server.url).advise(A, y)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def answer(summary: dict) -> dict:
+    """The stand-in's advice for one summary."""
+    n = summary['n_singular']
+    k = int(round(summary['picard_index'] * (n - 1))) + 1
+    return {'lambda': 10.0 ** summary['log10_s_picard'], 'k': min(max(k, 1), n)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.received += 1
+            fail = server.received <= server.fail_first
+        if server.delay:
+            time.sleep(server.delay)
+        if fail:
+            self.send_error(503, 'simulated failure')
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            answers = [{'id': r['id'], **answer(r['summary'])} for r in request['requests']]
+        except (ValueError, KeyError, TypeError):
+            self.send_error(400, 'malformed request')
+            return
+        body = json.dumps({'answers': answers}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if server.chunked:
+            # Chunks of at most 64 bytes, as a streaming proxy might send them
+            self.send_header('Transfer-Encoding', 'chunked')
+            body = b''.join(b'%x\r\n%s\r\n' % (len(part), part)
+                            for part in (body[i:i + 64] for i in range(0, len(body), 64))) + b'0\r\n\r\n'
+        else:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up (timeout)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Stand-in service on a background thread.
+
+    Parameters
+    ----------
+    host : str
+        Interface to bind (localhost by default)
+    port : int
+        Port; 0 picks a free one
+    delay : float
+        Seconds to wait before answering each request
+    fail_first : int
+        Number of initial requests answered with HTTP 503
+    chunked : bool
+        Send replies with ``Transfer-Encoding: chunked``
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, delay: float = 0.0,
+                 fail_first: int = 0, chunked: bool = False):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.lock = threading.Lock()
+        self._server.received = 0
+        self._server.delay = delay
+        self._server.fail_first = fail_first
+        self._server.chunked = chunked
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/advise"
+
+    @property
+    def received(self) -> int:
+        """Requests received so far."""
+        return self._server.received
+
+    def start(self) -> StubServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description='Run the stand-in parameter-advice service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--chunked', action='store_true', help='send chunked replies')
+    args = parser.parse_args(argv)
+    server = StubServer(args.host, args.port, args.delay, chunked=args.chunked).start()
+    print(f"serving on {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
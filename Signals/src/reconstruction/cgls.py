@@ -0,0 +1,309 @@
+"""
+Tikhonov paths by CGLS for operators too large to factor.
+
+The damped least-squares problem
+
+    min ||A x - y||² + λ² ||x||²    <=>    (A^T A + λ² I) x = A^T y
+
+is solved by CGLS, which touches A only through products with A and A^T
+(two per iteration) and never forms A^T A.
+
+``tikhonov_path`` solves it over a decreasing λ sequence in one of two ways:
+
+    'warm'        one CGLS run per λ, each started from the previous
+                  solution. The data residual r = y - A x and A^T r do not
+                  depend on λ, so they carry over and a warm start costs no
+                  extra products. With a noise level the path stops at the
+                  first λ meeting the discrepancy principle
+                  ||y - A x|| <= τ δ ||y||, before the small-λ solves that
+                  are the expensive ones.
+    'multishift'  all λ at once in a single Krylov space. The systems differ
+                  only by a shift of A^T A, so they share the Krylov space
+                  K(A^T A, A^T y); the solution for every λ is updated with
+                  scalar recurrences (multi-shift CG) from one sequence of
+                  products, and the path costs as much as its hardest
+                  (smallest λ) solve. Convergence is judged on the
+                  recurrence residual ζ_σ r, which drifts from the true
+                  normal-equation residual in finite precision. Residuals are
+                  evaluated once at the end, one product per λ.
+
+'auto' uses 'warm' when a noise level is given and 'multishift' otherwise.
+Every result reports the matvecs (products with A or A^T) spent.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from reconstruction.precision import norm, storage_dtype
+
+
+METHODS = ('warm', 'multishift')
+
+
+def _dot(a: np.ndarray, b: np.ndarray):
+    # Inner product per column (scalar for vectors), accumulated in float64
+    return np.sum(a * b, axis=0, dtype=np.float64)
+
+
+def _cgls_steps(A, x, r, atr, lam: float, target: float, max_iter: int) -> tuple:
+    """
+    CGLS iterations for one λ from the state (x, r = y - A x, atr = A^T r).
+
+    Stops when ||A^T r - λ² x|| <= target. Returns the updated state and the
+    number of iterations (two matvecs each).
+    """
+    lam2 = lam ** 2
+    s = atr - lam2 * x
+    p = s.copy()
+    gamma = _dot(s, s)
+    iters = 0
+    while iters < max_iter and gamma > target ** 2:
+        q = A @ p
+        delta = _dot(q, q) + lam2 * _dot(p, p)
+        if delta <= 0:
+            break
+        alpha = (gamma / delta).astype(x.dtype)
+        x = x + alpha * p
+        r = r - alpha * q
+        atr = A.T @ r
+        s = atr - lam2 * x
+        gamma_new = _dot(s, s)
+        p = s + (gamma_new / gamma).astype(x.dtype) * p
+        gamma = gamma_new
+        iters += 1
+    return x, r, atr, iters
+
+
+def cgls(A, y: np.ndarray, lam: float = 0.0, x0: np.ndarray | None = None,
+         tol: float = 1e-6, max_iter: int | None = None) -> tuple:
+    """
+    Damped least squares min ||A x - y||² + λ² ||x||² by CGLS.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Operator (m × n)
+    y : np.ndarray
+        Measurements (m,)
+    lam : float
+        Tikhonov parameter λ
+    x0 : np.ndarray, optional
+        Starting guess (zeros by default)
+    tol : float
+        Stop once ||A^T (y - A x) - λ² x|| <= tol * ||A^T y||
+    max_iter : int, optional
+        Iteration cap (defaults to min(m, n))
+
+    Returns
+    -------
+    x : np.ndarray
+        Solution
+    info : dict
+        'iterations', 'matvecs', 'residual_norm' (||y - A x||) and 'converged'
+    """
+    m, n = A.shape
+    max_iter = min(m, n) if max_iter is None else max_iter
+    dtype = storage_dtype(A, y)
+    y = np.asarray(y, dtype=dtype)
+    aty = A.T @ y
+    matvecs = 1
+    if x0 is None:
+        x, r, atr = np.zeros(n, dtype=dtype), y.copy(), aty
+    else:
+        x = np.array(x0, dtype=dtype)
+        r = y - A @ x
+        atr = A.T @ r
+        matvecs += 2
+
+    target = tol * float(norm(aty))
+    x, r, atr, iters = _cgls_steps(A, x, r, atr, lam, target, max_iter)
+    gap = float(norm(atr - lam ** 2 * x))
+    return x, {
+        'iterations': iters,
+        'matvecs': matvecs + 2 * iters,
+        'residual_norm': float(norm(r)),
+        'converged': gap <= target,
+    }
+
+
+def default_lambdas(A, y: np.ndarray, n_lambdas: int = 50, ratio: float = 1e-6) -> np.ndarray:
+    """
+    Decreasing λ grid from ||A^T y|| / ||y|| (the scale of the singular
+    values that carry y) down to ``ratio`` times that, log-spaced.
+    """
+    y_norm = float(norm(y))
+    top = float(norm(A.T @ y)) / y_norm if y_norm > 0 else 1.0
+    return np.geomspace(top, top * ratio, n_lambdas)
+
+
+def _multishift(A, y: np.ndarray, lams: np.ndarray, tol: float, max_iter: int) -> tuple:
+    """
+    Multi-shift CG on (A^T A + λ² I) x = A^T y for every λ at once.
+
+    The smallest λ is the base system; the others are shifted by
+    λ² - λ_min² and updated through the collinearity factors ζ of their
+    residuals (r_σ = ζ_σ r). Returns X (n × L), the iteration at which each
+    λ converged, and the number of iterations run.
+    """
+    n = A.shape[1]
+    dtype = storage_dtype(A, y)
+    sig = np.asarray(lams, dtype=np.float64) ** 2
+    base = float(sig.min())
+    shifts = sig - base
+    L = len(sig)
+
+    b = A.T @ np.asarray(y, dtype=dtype)
+    r = b.copy()
+    p = b.copy()
+    X = np.zeros((n, L), dtype=dtype)
+    P = np.repeat(b[:, None], L, axis=1)
+    rr = _dot(r, r)
+    stop = tol ** 2 * rr
+    zeta_prev = np.ones(L)
+    zeta = np.ones(L)
+    alpha_prev, beta_prev = 1.0, 0.0
+    active = np.ones(L, dtype=bool)
+    converged_at = np.full(L, -1)
+    iters = 0
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        while iters < max_iter and active.any() and rr > 0:
+            Kp = A.T @ (A @ p) + base * p
+            pKp = _dot(p, Kp)
+            if pKp <= 0:
+                break
+            alpha = rr / pKp
+            zeta_next = zeta * zeta_prev * alpha_prev / (
+                alpha * beta_prev * (zeta_prev - zeta) + zeta_prev * alpha_prev * (1.0 + shifts * alpha))
+            alpha_s = alpha * zeta_next / zeta
+            cols = np.flatnonzero(active)
+            X[:, cols] += (alpha_s[cols] * P[:, cols]).astype(dtype, copy=False)
+
+            r = r - np.asarray(alpha, dtype=dtype) * Kp
+            rr_new = _dot(r, r)
+            beta = rr_new / rr
+            beta_s = beta * (zeta_next / zeta) ** 2
+            P[:, cols] = (np.outer(r, zeta_next[cols]) + beta_s[cols] * P[:, cols]).astype(dtype, copy=False)
+            p = r + np.asarray(beta, dtype=dtype) * p
+
+            zeta_prev, zeta = zeta, zeta_next
+            alpha_prev, beta_prev, rr = alpha, beta, rr_new
+            iters += 1
+
+            # The shifted residual is ζ_σ r
+            done = active & ~(zeta ** 2 * rr > stop)
+            converged_at[done] = iters
+            active &= ~done
+    return X, converged_at, iters
+
+
+def tikhonov_path(A, y: np.ndarray, lams=None, noise_level: float | None = None,
+                  tau: float = 1.0, method: str = 'auto', tol: float = 1e-6,
+                  max_iter: int | None = None, n_lambdas: int = 50) -> tuple:
+    """
+    Tikhonov solutions over a decreasing λ sequence with CGLS.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Operator (m × n); only products with A and A^T are used
+    y : np.ndarray
+        Measurements (m,)
+    lams : array_like, optional
+        Parameters, solved from largest to smallest (defaults to
+        ``default_lambdas(A, y, n_lambdas)``)
+    noise_level : float, optional
+        Relative noise level δ; the path stops at the first λ with
+        ||y - A x|| <= τ δ ||y||
+    tau : float
+        Morozov safety factor
+    method : str
+        'auto', 'warm' or 'multishift' (see the module docstring)
+    tol : float
+        Relative tolerance on the normal-equation residual
+        ||A^T (y - A x) - λ² x|| / ||A^T y|| of each solve; 'multishift'
+        tests the residual of its recurrences, not a recomputed one
+    max_iter : int, optional
+        Iteration cap per solve for 'warm', in total for 'multishift'
+        (defaults to min(m, n))
+    n_lambdas : int
+        Size of the default λ grid
+
+    Returns
+    -------
+    X : np.ndarray
+        Solutions, one column per λ solved (n × L'); L' < L when the
+        discrepancy principle stopped the path
+    info : dict
+        'lambdas', 'residual_norms', 'solution_norms', 'iterations',
+        'converged' (False where ``max_iter`` was hit first) and 'matvecs'
+        per λ ('matvecs' cumulative along the path), 'total_matvecs',
+        'stop_index' (index of the discrepancy λ, or None) and 'method'
+    """
+    if method == 'auto':
+        method = 'warm' if noise_level is not None else 'multishift'
+    if method not in METHODS:
+        raise ValueError(f"method must be 'auto' or one of {list(METHODS)}")
+    m, n = A.shape
+    max_iter = min(m, n) if max_iter is None else max_iter
+    dtype = storage_dtype(A, y)
+    y = np.asarray(y, dtype=dtype)
+    matvecs = 0
+    if lams is None:
+        lams = default_lambdas(A, y, n_lambdas)
+        matvecs += 1
+    lams = np.sort(np.asarray(lams, dtype=np.float64))[::-1]
+    if lams.size == 0:
+        raise ValueError("lams must contain at least one λ")
+    target = tau * noise_level * float(norm(y)) if noise_level is not None else None
+
+    if method == 'warm':
+        aty = A.T @ y
+        matvecs += 1
+        tol_abs = tol * float(norm(aty))
+        x, r, atr = np.zeros(n, dtype=dtype), y.copy(), aty
+        columns, residuals, iterations, counts, converged = [], [], [], [], []
+        stop_index = None
+        for j, lam in enumerate(lams):
+            x, r, atr, iters = _cgls_steps(A, x, r, atr, lam, tol_abs, max_iter)
+            matvecs += 2 * iters
+            columns.append(x)
+            residuals.append(float(norm(r)))
+            iterations.append(iters)
+            counts.append(matvecs)
+            converged.append(float(norm(atr - lam ** 2 * x)) <= tol_abs)
+            if target is not None and residuals[-1] <= target:
+                stop_index = j
+                break
+        X = np.stack(columns, axis=1)
+    else:
+        X, converged_at, iters = _multishift(A, y, lams, tol, max_iter)
+        matvecs += 1 + 2 * iters
+        iterations = [int(i) if i >= 0 else iters for i in converged_at]
+        converged = [bool(i >= 0) for i in converged_at]
+        residuals = []
+        for j in range(len(lams)):
+            residuals.append(float(norm(y - A @ X[:, j])))
+            matvecs += 1
+        counts = [matvecs] * len(lams)
+        stop_index = None
+        if target is not None:
+            hits = np.flatnonzero(np.asarray(residuals) <= target)
+            if len(hits):
+                stop_index = int(hits[0])
+                X = X[:, :stop_index + 1]
+                residuals, iterations, counts, converged = (
+                    v[:stop_index + 1] for v in (residuals, iterations, counts, converged))
+
+    L = X.shape[1]
+    return X, {
+        'lambdas': lams[:L],
+        'residual_norms': np.asarray(residuals),
+        'solution_norms': norm(X, axis=0),
+        'iterations': np.asarray(iterations),
+        'converged': np.asarray(converged, dtype=bool),
+        'matvecs': np.asarray(counts),
+        'total_matvecs': matvecs,
+        'stop_index': stop_index,
+        'method': method,
+    }
@@ -0,0 +1,169 @@
+"""
+Closed-form spectral reconstructors for operators given by their SVD.
+
+A FactoredOperator A = U diag(s) V^T carries its singular vectors as fast
+orthogonal transforms, so a spectral filter f(s) is applied as
+
+    x = V ( f(s) * U^T y )
+
+at the cost of one transform with U^T and one with V: O(n log n) for DCT
+and Hadamard factors, O(n k) for k Householder reflections. No SVD is
+computed, and residual and solution norms follow from the coefficients
+U^T y in O(n) because U and V are orthogonal.
+
+The tikhonov / tsvd / pseudoinverse / nsit modules, parameter_choice and
+the Picard, L-curve and SVD diagnostics dispatch here when given a
+FactoredOperator.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import numpy as np
+from forward_models.linear_operator import FactoredOperator
+from reconstruction.precision import norm
+from reconstruction.schedules import nsit_schedule
+
+
+def _column(v: np.ndarray, ndim: int) -> np.ndarray:
+    return v.reshape((-1,) + (1,) * (ndim - 1))
+
+
+def coefficients(op: FactoredOperator, y: np.ndarray) -> np.ndarray:
+    """U^T y, in the (unsorted) order of ``op.s``."""
+    return op.U.T @ y
+
+
+def _filtered_solve(op: FactoredOperator, y: np.ndarray, filt: np.ndarray) -> np.ndarray:
+    """Apply the spectral filter ``filt`` (one factor per singular value) to y."""
+    c = coefficients(op, y)
+    return op.V @ (_column(filt, np.ndim(c)).astype(c.dtype, copy=False) * c)
+
+
+def spectrum(op: FactoredOperator) -> tuple:
+    """Singular values in descending order and their positions in ``op.s``."""
+    order = np.argsort(-op.s, kind='stable')
+    return op.s[order], order
+
+
+def _inverse(s: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    filt = np.zeros(len(s), dtype=float)
+    filt[keep] = 1.0 / s[keep]
+    return filt
+
+
+def tikhonov(op: FactoredOperator, y: np.ndarray, lam: float) -> np.ndarray:
+    s = op.s.astype(float)
+    return _filtered_solve(op, y, s / (s**2 + lam**2))
+
+
+def tikhonov_path(op: FactoredOperator, y: np.ndarray, lams) -> np.ndarray:
+    """Tikhonov solutions for every lambda in ``lams``, one per column (n × L)."""
+    lams = np.asarray(lams, dtype=float)
+    s = op.s.astype(float)[:, None]
+    G = s / (s**2 + lams[None, :]**2)
+    c = coefficients(op, y)
+    return op.V @ (G * c[:, None]).astype(c.dtype, copy=False)
+
+
+def tsvd(op: FactoredOperator, y: np.ndarray, k: int) -> np.ndarray:
+    s = op.s.astype(float)
+    keep = spectrum(op)[1][:k]
+    return _filtered_solve(op, y, _inverse(s, keep[s[keep] > 0]))
+
+
+def tsvd_path(op: FactoredOperator, y: np.ndarray, ks) -> np.ndarray:
+    """TSVD solutions for every truncation level in ``ks``, one per column (n × L)."""
+    ks = np.asarray(ks, dtype=int)
+    s = op.s.astype(float)
+    _, order = spectrum(op)
+    rank = np.empty(len(s), dtype=int)
+    rank[order] = np.arange(len(s))
+    inv = _inverse(s, s > 0)
+    G = np.where(rank[:, None] < ks[None, :], inv[:, None], 0.0)
+    c = coefficients(op, y)
+    return op.V @ (G * c[:, None]).astype(c.dtype, copy=False)
+
+
+def pseudoinverse(op: FactoredOperator, y: np.ndarray, rcond: float = 1e-15) -> np.ndarray:
+    s = op.s.astype(float)
+    return _filtered_solve(op, y, _inverse(s, s > rcond * s.max()))
+
+
+def nsit(op: FactoredOperator, y: np.ndarray, noise_level: float,
+         schedule_type: str = 'sqrt', tau: float = 1.0, max_iter: int = 100,
+         store_every: int | None = 1, alpha_0: float | None = None, callback=None):
+    """
+    NSIT with Morozov stopping, run on the coefficients of the SVD basis.
+
+    With z = V^T x and c = U^T y each correction is a pointwise division by
+    s² + α_n and ||y - A x|| = ||c - s z|| (U is orthogonal), so an
+    iteration costs O(n); V is applied only for stored iterates and the
+    result. Same arguments and history as ``nsit.nsit_with_morozov``.
+    """
+    n = op.shape[1]
+    s = op.s.astype(float)
+    s2 = s ** 2
+    c = coefficients(op, y).astype(float)
+    z = np.zeros(n)
+
+    schedule = nsit_schedule(schedule_type, s2.max() if alpha_0 is None else alpha_0)
+
+    target_residual = tau * noise_level * norm(y)
+    history = {
+        'x': [np.zeros(n, dtype=y.dtype)] if store_every else [],
+        'residuals': [],
+        'alphas': [],
+        'stopping_iter': max_iter - 1
+    }
+
+    def solution(z):
+        return (op.V @ z).astype(y.dtype, copy=False)
+
+    if callback is not None:
+        start = perf_counter()
+
+    for iter_count in range(max_iter):
+        alpha_n = schedule(iter_count)
+
+        r = c - s * z
+        residual_norm = norm(r)
+
+        z = z + s * r / (s2 + alpha_n)
+
+        history['residuals'].append(residual_norm)
+        history['alphas'].append(alpha_n)
+        if store_every and (iter_count + 1) % store_every == 0:
+            history['x'].append(solution(z))
+
+        if residual_norm <= target_residual:
+            history['stopping_iter'] = iter_count
+            if callback is not None:
+                callback(iter_count, residual_norm, alpha_n, 0, 0, perf_counter() - start)
+            break
+        if callback is not None and callback(iter_count, residual_norm, alpha_n, 0, 0,
+                                             perf_counter() - start):
+            history['stopping_iter'] = iter_count
+            break
+
+    return solution(z), history
+
+
+def picard_data(op: FactoredOperator, y: np.ndarray):
+    """Picard data: singular values (descending) and coefficients |U^T y|."""
+    s, order = spectrum(op)
+    return s, np.abs(coefficients(op, y))[order]
+
+
+def l_curve(op: FactoredOperator, y: np.ndarray, lambdas: np.ndarray):
+    """Tikhonov L-curve residual and solution norms from U^T y, O(n) per lambda."""
+    s2 = op.s.astype(float) ** 2
+    c2 = coefficients(op, y).astype(float) ** 2
+    residual_norms = []
+    solution_norms = []
+    for lam in lambdas:
+        denom = s2 + lam**2
+        residual_norms.append(np.sqrt(np.sum((lam**2 / denom) ** 2 * c2)))
+        solution_norms.append(np.sqrt(np.sum(s2 / denom**2 * c2)))
+    return np.array(residual_norms), np.array(solution_norms)
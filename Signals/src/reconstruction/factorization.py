@@ -0,0 +1,181 @@
+"""
+Shared SVD cache for spectral reconstructors and diagnostics.
+
+Tikhonov, TSVD, the Picard and L-curve diagnostics and NSIT's choice of
+alpha_0 all need the SVD of the same forward operator. The cache factors an
+operator once per process and hands the same (U, s, Vt) to every caller.
+
+Operators are keyed by a fingerprint: a content hash of the array bytes
+together with its shape and dtype, so two equal matrices built separately
+share one entry. Matrix-free operators supply their own ``fingerprint()``
+and are materialized once with ``to_dense()`` on a miss; a FactoredOperator
+hands over its known singular vectors instead of being factored. Entries are
+evicted least-recently-used once their total size exceeds the byte budget.
+Operators without a content fingerprint are keyed by identity; their entries
+are dropped when the operator is garbage collected.
+
+Cached factors are read-only; copy them before modifying in place.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict, deque
+
+import numpy as np
+from numpy.linalg import svd
+from forward_models.linear_operator import INSTANCE, FactoredOperator, LinearOperator, digest
+
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def fingerprint(A: np.ndarray) -> tuple:
+    """Key identifying an operator by shape, dtype and content hash."""
+    if isinstance(A, LinearOperator):
+        return A.fingerprint()
+    A = np.asarray(A)
+    return (A.shape, A.dtype.str, digest(A))
+
+
+def _by_identity(key) -> bool:
+    # Identity-based fingerprints, also inside derived keys such as (key, backend, k)
+    return isinstance(key, tuple) and bool(key) and (key[0] == INSTANCE or _by_identity(key[0]))
+
+
+def _nbytes(factors: tuple) -> int:
+    return sum(f.nbytes for f in factors)
+
+
+class FactorizationCache:
+    """
+    LRU cache of thin SVDs keyed by operator fingerprint.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Budget for the cached factors. Least recently used entries are
+        dropped once the total exceeds it; a single factorization larger
+        than the budget is computed but not stored.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # Keys of collected operators; finalizers only append (they may run
+        # while the lock is held), and the entries are dropped on next access
+        self._dead = deque()
+
+    def svd(self, A: np.ndarray) -> tuple:
+        """Return the thin SVD (U, s, Vt) of A, computing it on a miss."""
+        key = fingerprint(A)
+        factors = self.get(key)
+        if factors is not None:
+            return factors
+        with self._lock:
+            self.misses += 1
+
+        if isinstance(A, FactoredOperator):
+            factors = A.svd()
+        else:
+            factors = svd(A.to_dense() if isinstance(A, LinearOperator) else A, full_matrices=False)
+        for f in factors:
+            f.flags.writeable = False
+        self.put(key, factors, owner=A)
+        return factors
+
+    def get(self, key: tuple):
+        """Cached factors stored under ``key``, or None (no miss is counted)."""
+        with self._lock:
+            self._reap()
+            factors = self._entries.get(key)
+            if factors is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return factors
+
+    def contains(self, key: tuple) -> bool:
+        """Whether ``key`` is cached, without counting a hit or refreshing it."""
+        with self._lock:
+            self._reap()
+            return key in self._entries
+
+    def put(self, key: tuple, factors: tuple, owner=None) -> None:
+        """
+        Store precomputed factors under ``key``. With an identity-based key,
+        ``owner`` is the operator whose collection drops the entry.
+        """
+        size = _nbytes(factors)
+        with self._lock:
+            self._reap()
+            if key in self._entries or size > self.max_bytes:
+                return
+            self._entries[key] = factors
+            self._size += size
+            self._evict()
+        if owner is not None and _by_identity(key):
+            # Keyed by a token that dies with the operator: drop it then
+            weakref.finalize(owner, self._dead.append, key)
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self._reap()
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            self._reap()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'nbytes': self._size,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _reap(self) -> None:
+        while self._dead:
+            factors = self._entries.pop(self._dead.popleft(), None)
+            if factors is not None:
+                self._size -= _nbytes(factors)
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._entries:
+            _, factors = self._entries.popitem(last=False)
+            self._size -= _nbytes(factors)
+
+
+_cache = FactorizationCache()
+
+
+def get_cache() -> FactorizationCache:
+    """Process-wide cache shared by all reconstructors and diagnostics."""
+    return _cache
+
+
+def cached_svd(A: np.ndarray) -> tuple:
+    """Thin SVD of A from the process-wide cache."""
+    return _cache.svd(A)
+
+
+def cache_info() -> dict:
+    return _cache.info()
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+def set_cache_budget(max_bytes: int) -> None:
+    _cache.resize(max_bytes)
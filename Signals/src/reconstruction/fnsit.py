@@ -23,10 +23,24 @@ FNSIT innovation: Replace exact solve with gradient descent approximation:
     Update: z ← z - β ∇f(z)  (iterate k_inner times)
 
 Morozov Stopping: ||y - Ax_n|| ≈ τ*δ*||y||
+
+A may be a dense matrix or a matrix-free LinearOperator. The inner solve is
+pluggable (gradient descent, conjugate gradient, Chebyshev; see
+reconstruction.inner_solvers), can warm-start from the previous correction,
+and applies A^T A either as a formed Gram matrix or as two matvecs,
+whichever is cheaper for the shape of A.
+
+Iterates keep the dtype of A and y; residual norms and the Morozov test are
+accumulated in float64. A ``callback`` (see reconstruction.telemetry) sees
+every iteration's residual, alpha, matvec and inner-step counts and may stop
+the iteration early.
 """
 
+from time import perf_counter
+
 import numpy as np
-from numpy.linalg import norm
+from reconstruction.inner_solvers import NormalOperator, make_inner_solver
+from reconstruction.precision import norm, storage_dtype
 
 
 def fnsit_fast_solver(ATA: np.ndarray, rhs: np.ndarray, alpha: float,
@@ -41,8 +55,8 @@ def fnsit_fast_solver(ATA: np.ndarray, rhs: np.ndarray, alpha: float,
 
     Parameters:
     -----------
-    ATA : np.ndarray
-        Precomputed A^T A matrix (n × n)
+    ATA : np.ndarray or LinearOperator
+        Precomputed A^T A matrix (n × n), or the composed operator A.T @ A
     rhs : np.ndarray
         Right-hand side A^T r vector (length n)
     alpha : float
@@ -57,15 +71,16 @@ def fnsit_fast_solver(ATA: np.ndarray, rhs: np.ndarray, alpha: float,
     z : np.ndarray
         Approximate solution to (A^T A + α I) z = rhs
     """
-    n = len(rhs)
-    z = np.zeros(n)  # Cold start
+    z = np.zeros_like(rhs)  # Cold start
 
     for _ in range(inner_steps):
         # Gradient = (A^T A + α I)z - rhs
-        gradient = (ATA + alpha * np.eye(n)) @ z - rhs
+        gradient = ATA @ z
+        gradient += alpha * z
+        gradient -= rhs
 
         # Gradient descent step
-        z = z - step_size * gradient
+        z -= step_size * gradient
 
     return z
 
@@ -73,8 +88,11 @@ def fnsit_fast_solver(ATA: np.ndarray, rhs: np.ndarray, alpha: float,
 def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
                       alpha0: float, q: float, max_iter: int,
                       tau: float, delta: float,
-                      inner_steps: int = 5, step_size: float = 0.1,
-                      x_true: np.ndarray | None = None) -> tuple:
+                      inner_steps: int = 5, step_size: float | None = 0.1,
+                      x_true: np.ndarray | None = None,
+                      inner_solver='gd', warm_start: bool = False,
+                      normal_form: str = 'auto', verbose: bool = False,
+                      callback=None) -> tuple:
     """
     Fast NSIT Reconstruction with Morozov Stopping
 
@@ -84,8 +102,8 @@ def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
 
     Parameters:
     -----------
-    A : np.ndarray
-        Forward operator matrix (m × n)
+    A : np.ndarray or LinearOperator
+        Forward operator (m × n)
     y : np.ndarray
         Measurement vector (length m)
     alpha0 : float
@@ -99,11 +117,24 @@ def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
     delta : float
         Noise level (relative noise or absolute standard deviation)
     inner_steps : int, default=5
-        Number of gradient descent steps per iteration
-    step_size : float, default=0.1
-        Step size for gradient descent
+        Number of inner solver steps per iteration
+    step_size : float | None, default=0.1
+        Step size for gradient descent; None derives it from a power-iteration
+        estimate of ||A||² so it cannot diverge
     x_true : np.ndarray | None, optional
         True solution (for error tracking only)
+    inner_solver : str or solver object, default='gd'
+        'gd', 'cg', 'chebyshev', or any object with
+        ``solve(normal, rhs, alpha, x0)``
+    warm_start : bool, default=False
+        Start each inner solve from the previous correction
+    normal_form : str, default='auto'
+        How A^T A is applied: 'gram', 'matvec' or 'auto' (see NormalOperator)
+    verbose : bool, default=False
+        Print a message when the Morozov criterion stops the iteration
+    callback : callable, optional
+        ``callback(iteration, residual, alpha, matvecs, inner_iterations,
+        elapsed)`` after every update; returning True stops the iteration
 
     Returns:
     --------
@@ -118,10 +149,13 @@ def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
         - 'final_iteration': stopping iteration
     """
     m, n = A.shape
-    x = np.zeros(n)
+    dtype = storage_dtype(A, y)
+    x = np.zeros(n, dtype=dtype)
 
-    # Precompute A^T A (reuse across iterations)
-    ATA = A.T @ A
+    normal = NormalOperator(A, normal_form)
+    if isinstance(inner_solver, str):
+        options = {'step_size': step_size} if inner_solver == 'gd' else {}
+        inner_solver = make_inner_solver(inner_solver, inner_steps, **options)
 
     # Compute Morozov stopping threshold
     y_norm = norm(y)
@@ -135,26 +169,43 @@ def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
         'iterations': []
     }
 
+    # Residual r = y - A x and gradient A^T r, updated incrementally
+    residual = np.array(y, dtype=dtype)
+    rhs = A.T @ residual
+    z = None
+    outer_matvecs = 1
+    if callback is not None:
+        start = perf_counter()
+
     # Main iteration loop
     for iteration in range(max_iter):
         # Current regularization parameter (geometric decay)
         alpha_n = alpha0 * (q ** iteration)
 
-        # Compute residual
-        residual = y - A @ x
         residual_norm = norm(residual)
 
         # **Morozov Stopping Criterion**
         if residual_norm <= threshold:
-            print(f"  FNSIT Morozov stopping at iteration {iteration}")
+            if verbose:
+                print(f"  FNSIT Morozov stopping at iteration {iteration}")
+            # Report the stopping iteration too; it does no inner solve
+            if callback is not None:
+                callback(iteration, residual_norm, alpha_n, outer_matvecs + normal.matvecs,
+                         0, perf_counter() - start)
             break
 
         # **Fast approximate solve** (key difference from NSIT)
-        rhs = A.T @ residual
-        z = fnsit_fast_solver(ATA, rhs, alpha_n, inner_steps, step_size)
-
-        # Update solution
-        x = x + z
+        z = inner_solver.solve(normal, rhs, alpha_n, z if warm_start else None)
+
+        # Update solution, residual and A^T r
+        x += z
+        residual -= A @ z
+        if normal.gram is not None:
+            rhs -= normal.gram @ z
+            outer_matvecs += 1
+        else:
+            rhs = A.T @ residual
+            outer_matvecs += 2
 
         # Track progress
         history['residuals'].append(residual_norm)
@@ -166,7 +217,96 @@ def fnsit_reconstruct(A: np.ndarray, y: np.ndarray,
             error = norm(x - x_true) / norm(x_true)
             history['errors'].append(error)
 
+        if callback is not None and callback(
+                iteration, residual_norm, alpha_n, outer_matvecs + normal.matvecs,
+                getattr(inner_solver, 'iterations', -1), perf_counter() - start):
+            break
+
     # Record final iteration
     history['final_iteration'] = iteration
 
     return x, history
+
+
+def fnsit_reconstruct_batch(A: np.ndarray, Y: np.ndarray,
+                            alpha0: float, q: float, max_iter: int,
+                            tau: float, delta: float,
+                            inner_steps: int = 5, step_size: float | None = 0.1,
+                            inner_solver='gd', warm_start: bool = False,
+                            normal_form: str = 'auto') -> tuple:
+    """
+    FNSIT for many measurement vectors against the same operator.
+
+    Columns of Y (m × B) are corrected together, so every inner step is a
+    block product (BLAS-3) instead of B matvecs. Each column stops at its own
+    Morozov threshold τ*δ*||y_b||; stopped columns drop out of the active
+    block. Arguments are as in ``fnsit_reconstruct``.
+
+    Returns:
+    --------
+    X : np.ndarray
+        Reconstructed solutions (n × B)
+    history : dict
+        Contains:
+        - 'residuals': (iterations × B) array of ||y_b - A x_b|| for the
+          columns updated at each iteration, NaN elsewhere
+        - 'alphas': regularization parameters used
+        - 'final_iteration': per-column stopping iteration (length B)
+    """
+    m, n = A.shape
+    B = Y.shape[1]
+    dtype = storage_dtype(A, Y)
+    X = np.zeros((n, B), dtype=dtype)
+
+    normal = NormalOperator(A, normal_form)
+    if isinstance(inner_solver, str):
+        options = {'step_size': step_size} if inner_solver == 'gd' else {}
+        inner_solver = make_inner_solver(inner_solver, inner_steps, **options)
+
+    threshold = tau * delta * norm(Y, axis=0)
+    residual = np.array(Y, dtype=dtype)
+    rhs = A.T @ residual
+    Z = np.zeros((n, B), dtype=dtype) if warm_start else None
+
+    active = np.ones(B, dtype=bool)
+    final_iteration = np.full(B, max_iter - 1)
+    residuals = []
+    alphas = []
+
+    for iteration in range(max_iter):
+        alpha_n = alpha0 * (q ** iteration)
+
+        idx = np.flatnonzero(active)
+        res = norm(residual[:, idx], axis=0)
+
+        # Per-column Morozov stopping
+        done = res <= threshold[idx]
+        final_iteration[idx[done]] = iteration
+        active[idx[done]] = False
+        idx, res = idx[~done], res[~done]
+        if idx.size == 0:
+            break
+
+        z = inner_solver.solve(normal, rhs[:, idx], alpha_n,
+                               Z[:, idx] if warm_start else None)
+
+        X[:, idx] += z
+        residual[:, idx] -= A @ z
+        if normal.gram is not None:
+            rhs[:, idx] -= normal.gram @ z
+        else:
+            rhs[:, idx] = A.T @ residual[:, idx]
+        if warm_start:
+            Z[:, idx] = z
+
+        row = np.full(B, np.nan)
+        row[idx] = res
+        residuals.append(row)
+        alphas.append(alpha_n)
+
+    history = {
+        'residuals': np.array(residuals).reshape(-1, B),
+        'alphas': alphas,
+        'final_iteration': final_iteration,
+    }
+    return X, history
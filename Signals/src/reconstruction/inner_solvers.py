@@ -0,0 +1,213 @@
+"""
+Iterative solvers for the regularized normal equations
+
+    (A^T A + α I) z = rhs
+
+that only need products with A and A^T, for use inside NSIT/FNSIT.
+
+FNSIT's inner solvers share one interface: ``solve(normal, rhs, alpha, x0)``
+where ``normal`` is a NormalOperator applying A^T A + α I either through a
+formed Gram matrix or two matvecs, and ``x0`` is an optional warm start.
+None of them allocates an n × n matrix per step. After ``solve`` each
+solver's ``iterations`` holds the number of steps it took.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.linalg import norm
+from forward_models.linear_operator import LinearOperator, operator_norm
+
+
+def _dot(a: np.ndarray, b: np.ndarray):
+    # Inner product per column (scalar for vectors), accumulated in float64
+    return np.sum(a * b, axis=0, dtype=np.float64)
+
+
+def conjugate_gradient(apply, rhs: np.ndarray, x0: np.ndarray | None = None,
+                       tol: float = 1e-10, maxiter: int | None = None) -> tuple:
+    """
+    Conjugate gradient for a symmetric positive definite system.
+
+    A 2D ``rhs`` (n × B) runs B independent CG recurrences side by side,
+    so each step is one block product with M.
+
+    Parameters
+    ----------
+    apply : callable
+        z -> M z for the SPD matrix M
+    rhs : np.ndarray
+        Right-hand side (n,) or (n × B)
+    x0 : np.ndarray, optional
+        Starting guess (zeros by default)
+    tol : float
+        Relative residual tolerance ||rhs - M z|| <= tol * ||rhs|| per column
+    maxiter : int, optional
+        Iteration cap (defaults to len(rhs))
+
+    Returns
+    -------
+    z : np.ndarray
+        Approximate solution
+    iters : int
+        Number of iterations performed
+    """
+    maxiter = len(rhs) if maxiter is None else maxiter
+    dtype = np.result_type(rhs, np.float32)
+    z = np.zeros_like(rhs, dtype=dtype) if x0 is None else x0.astype(dtype)
+    r = rhs - apply(z) if x0 is not None else np.array(rhs, dtype=dtype)
+    p = r.copy()
+    rr = _dot(r, r)
+    stop = tol ** 2 * _dot(rhs, rhs)
+    iters = 0
+    while iters < maxiter and np.any(rr > stop):
+        Mp = apply(p)
+        pMp = _dot(p, Mp)
+        # Columns that already converged take no further steps
+        step = np.divide(rr, pMp, out=np.zeros_like(rr), where=(pMp > 0) & (rr > stop))
+        step = step.astype(dtype)
+        z += step * p
+        r -= step * Mp
+        rr_new = _dot(r, r)
+        beta = np.divide(rr_new, rr, out=np.zeros_like(rr), where=rr > 0).astype(dtype)
+        p = r + beta * p
+        rr = rr_new
+        iters += 1
+    return z, iters
+
+
+class NormalOperator:
+    """
+    Applies z -> (A^T A + α I) z for the inner FNSIT solves.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Forward operator (m × n)
+    form : str, default='auto'
+        'gram' forms A^T A once (n² per product), 'matvec' applies A then
+        A^T (2mn per product, nothing formed). 'auto' forms the Gram matrix
+        for dense A when n <= 2m and uses matvecs otherwise.
+    """
+
+    def __init__(self, A, form: str = 'auto'):
+        m, n = A.shape
+        if form == 'auto':
+            form = 'gram' if (not isinstance(A, LinearOperator) and n <= 2 * m) else 'matvec'
+        if form not in ('gram', 'matvec'):
+            raise ValueError("form must be 'auto', 'gram' or 'matvec'")
+        self.A = A
+        self.shape = (n, n)
+        self.gram = A.T @ A if form == 'gram' else None
+        self.matvecs = 0
+        self._lipschitz = None
+
+    def __call__(self, z: np.ndarray, alpha: float) -> np.ndarray:
+        if self.gram is not None:
+            out = self.gram @ z
+        else:
+            out = self.A.T @ (self.A @ z)
+            self.matvecs += 2
+        out += alpha * z
+        return out
+
+    def lipschitz(self) -> float:
+        """||A||², estimated once by power iteration."""
+        if self._lipschitz is None:
+            self._lipschitz = operator_norm(self.A) ** 2
+        return self._lipschitz
+
+
+class GradientDescent:
+    """
+    Fixed-step gradient descent on f(z) = ½ z^T (A^T A + α I) z - rhs^T z.
+
+    ``step_size=None`` uses 1 / (||A||² + α), with ||A|| from power
+    iteration, which converges for any operator scale.
+    """
+
+    def __init__(self, steps: int = 5, step_size: float | None = None):
+        self.steps = steps
+        self.step_size = step_size
+        self.iterations = 0
+
+    def solve(self, normal: NormalOperator, rhs: np.ndarray, alpha: float,
+              x0: np.ndarray | None = None) -> np.ndarray:
+        beta = self.step_size
+        if beta is None:
+            beta = 1.0 / (normal.lipschitz() + alpha)
+        z = np.zeros_like(rhs) if x0 is None else x0.copy()
+        for _ in range(self.steps):
+            gradient = normal(z, alpha)
+            gradient -= rhs
+            z -= beta * gradient
+        self.iterations = self.steps
+        return z
+
+
+class ConjugateGradient:
+    """A fixed budget of CG steps (or fewer once ``tol`` is met)."""
+
+    def __init__(self, steps: int = 5, tol: float = 1e-10):
+        self.steps = steps
+        self.tol = tol
+        self.iterations = 0
+
+    def solve(self, normal: NormalOperator, rhs: np.ndarray, alpha: float,
+              x0: np.ndarray | None = None) -> np.ndarray:
+        z, self.iterations = conjugate_gradient(lambda v: normal(v, alpha), rhs, x0,
+                                                tol=self.tol, maxiter=self.steps)
+        return z
+
+
+class Chebyshev:
+    """
+    Chebyshev semi-iteration on the spectrum bounds [α, ||A||² + α].
+
+    Needs no inner products, only the eigenvalue interval; the upper bound
+    is the power-iteration estimate of ||A||² inflated by ``safety``.
+    """
+
+    def __init__(self, steps: int = 5, safety: float = 1.05):
+        self.steps = steps
+        self.safety = safety
+        self.iterations = 0
+
+    def solve(self, normal: NormalOperator, rhs: np.ndarray, alpha: float,
+              x0: np.ndarray | None = None) -> np.ndarray:
+        lmin = alpha
+        lmax = self.safety * normal.lipschitz() + alpha
+        theta = 0.5 * (lmax + lmin)
+        delta = 0.5 * (lmax - lmin)
+        z = np.zeros_like(rhs) if x0 is None else x0.copy()
+        r = rhs - normal(z, alpha) if x0 is not None else rhs.copy()
+        if delta <= 0:
+            self.iterations = 0
+            return z + r / theta
+
+        sigma = theta / delta
+        rho = 1.0 / sigma
+        d = r / theta
+        for _ in range(self.steps):
+            z += d
+            r -= normal(d, alpha)
+            rho_next = 1.0 / (2.0 * sigma - rho)
+            d *= rho_next * rho
+            d += (2.0 * rho_next / delta) * r
+            rho = rho_next
+        self.iterations = self.steps
+        return z
+
+
+INNER_SOLVERS = {
+    'gd': GradientDescent,
+    'cg': ConjugateGradient,
+    'chebyshev': Chebyshev,
+}
+
+
+def make_inner_solver(name: str, steps: int = 5, **kwargs):
+    """Build an inner solver by name: 'gd', 'cg' or 'chebyshev'."""
+    if name not in INNER_SOLVERS:
+        raise ValueError(f"inner solver must be one of {list(INNER_SOLVERS.keys())}")
+    return INNER_SOLVERS[name](steps=steps, **kwargs)
@@ -0,0 +1,257 @@
+"""
+Tikhonov regularizers learned from training pairs (x, y).
+
+After Alberti et al., "Learning the optimal Tikhonov regularizer for
+inverse problems" (NeurIPS 2021). Both estimators minimize the mean squared
+error E||x̂(y) - x||² over the training set, have a closed form in a few
+batched statistics, and are fitted in one streaming pass over the data
+(``partial_fit`` per batch, or ``fit`` over arrays such as the memmaps of
+pipeline.dataset):
+
+'filter'  per-singular-value filter factors, O(n) state. With the
+          coefficients c = U^T y and z = V^T x of each pair, the estimator
+          x̂ = V diag(f) U^T y has error Σ_i (f_i c_i - z_i)² plus the part
+          of x outside the range of V, so every f_i is fitted on its own:
+
+              f_i = Σ c_i z_i / Σ c_i²,   clipped to [0, 1 / s_i]
+
+          (the loss is a convex quadratic in f_i, so clipping gives the
+          constrained optimum; the bound is that of any Tikhonov filter).
+          f_i = s_i / (s_i² + λ_i²) defines one λ_i per singular value, and
+          ``tikhonov.reconstruct(A, y, model.lambdas)`` applies the learned
+          filter at exactly the cost of a scalar λ. Circulant, separable and
+          factored operators use their closed-form bases, so no dense SVD is
+          needed for them.
+
+'matrix'  a full regularization matrix, O(n²) state. With the mean μ and
+          covariance Σ of x and the white-noise variance σ² of y - A x, the
+          optimal generalized Tikhonov problem
+
+              min ||A x - y||² + (x - μ)^T B (x - μ),   B = σ² Σ^{-1}
+
+          has the solution x̂ = μ + Σ A^T (A Σ A^T + σ² I)^{-1} (y - A μ).
+          The affine map is formed once when the model is finalized, so a
+          reconstruction is a single matrix-vector product.
+
+Training data are stored one signal per row (B × n and B × m, the layout of
+pipeline.dataset); ``reconstruct`` takes y as a vector or an (m × B) block,
+like the other reconstructors.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator, LinearOperator
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable, tikhonov
+from reconstruction.factorization import cached_svd
+
+
+MODES = ('filter', 'matrix')
+
+
+def _forward_rows(A, X: np.ndarray) -> np.ndarray:
+    # A applied to every row of X
+    if isinstance(A, np.ndarray):
+        return X @ A.T
+    return np.asarray(A @ X.T).T
+
+
+def _spectral_basis(A) -> tuple:
+    """
+    Singular values (descending) and maps from batches of y and x to their
+    coefficients c = U^T y and z = V^T x, one row per signal, columns in the
+    same order. Circulant coefficients are complex (DFT basis).
+    """
+    if isinstance(A, CirculantOperator):
+        s, order = fourier.spectrum(A)
+        lam = A.eigenvalues
+        mag = np.abs(lam)
+        phase = np.zeros_like(lam)
+        phase[mag > 0] = np.conj(lam[mag > 0]) / mag[mag > 0]
+        scale = 1.0 / np.sqrt(A.shape[0])
+        return (s,
+                lambda Y: (np.fft.fft(Y, axis=1) * (phase * scale))[:, order],
+                lambda X: (np.fft.fft(X, axis=1) * scale)[:, order])
+    if isinstance(A, FactoredOperator):
+        s, order = factored.spectrum(A)
+        return (s,
+                lambda Y: (A.U.T @ Y.T).T[:, order],
+                lambda X: (A.V.T @ X.T).T[:, order])
+    if isinstance(A, SeparableOperator):
+        S = separable.spectrum(A)
+        order = np.argsort(-S, axis=None, kind='stable')
+        _, _, Vt_c = cached_svd(A.A_c)
+        _, _, Vt_r = cached_svd(A.A_r)
+        return (S.ravel()[order],
+                lambda Y: separable.project(A, Y).reshape(len(Y), -1)[:, order],
+                lambda X: (Vt_c @ X @ Vt_r.T).reshape(len(X), -1)[:, order])
+    U, s, Vt = cached_svd(A)
+    return s, lambda Y: Y @ U, lambda X: X @ Vt.T
+
+
+class LearnedTikhonov:
+    """
+    Streaming fit of an optimal Tikhonov regularizer for the operator A.
+
+    Parameters
+    ----------
+    A : np.ndarray, LinearOperator or SeparableOperator
+        Forward operator (a SeparableOperator takes (B × H × W) image batches
+        and supports the 'filter' mode only)
+    mode : str
+        'filter' (per-singular-value filter) or 'matrix' (full
+        regularization matrix); see the module docstring
+    """
+
+    def __init__(self, A, mode: str = 'filter'):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {list(MODES)}")
+        if mode == 'matrix' and isinstance(A, SeparableOperator):
+            raise ValueError("the 'matrix' mode needs a matrix or LinearOperator")
+        self.A = A
+        self.mode = mode
+        self.count = 0
+        self._solution = None
+        if mode == 'filter':
+            self.s, self._project_y, self._project_x = _spectral_basis(A)
+            p = len(self.s)
+            self.stats = {'cz': np.zeros(p), 'cc': np.zeros(p), 'zz': np.zeros(p), 'xx': 0.0}
+        else:
+            n = A.shape[1]
+            self.stats = {'x': np.zeros(n), 'xxt': np.zeros((n, n)), 'rr': 0.0}
+
+    def partial_fit(self, X: np.ndarray, Y: np.ndarray) -> LearnedTikhonov:
+        """Add a batch of pairs: X and Y hold one signal and its measurement per row."""
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        if len(X) != len(Y):
+            raise ValueError(f"{len(X)} signals but {len(Y)} measurements")
+        stats = self.stats
+        if self.mode == 'filter':
+            C = self._project_y(Y)
+            Z = self._project_x(X)
+            stats['cz'] += np.sum((np.conj(C) * Z).real, axis=0)
+            stats['cc'] += np.sum(np.abs(C) ** 2, axis=0)
+            stats['zz'] += np.sum(np.abs(Z) ** 2, axis=0)
+            stats['xx'] += float(np.sum(X ** 2))
+        else:
+            X = X.reshape(len(X), -1)
+            stats['x'] += X.sum(axis=0)
+            stats['xxt'] += X.T @ X
+            R = Y.reshape(len(Y), -1) - _forward_rows(self.A, X)
+            stats['rr'] += float(np.sum(R ** 2))
+        self.count += len(X)
+        self._solution = None
+        return self
+
+    def fit(self, X: np.ndarray, Y: np.ndarray, batch_size: int = 4096) -> LearnedTikhonov:
+        """Stream over X and Y (arrays or memmaps) ``batch_size`` rows at a time."""
+        for start in range(0, len(X), batch_size):
+            self.partial_fit(X[start:start + batch_size], Y[start:start + batch_size])
+        return self
+
+    def _solve(self):
+        if self.count == 0:
+            raise RuntimeError("the model has not seen any training data")
+        if self._solution is not None:
+            return self._solution
+        stats = self.stats
+        if self.mode == 'filter':
+            s, cz, cc = self.s, stats['cz'], stats['cc']
+            f = np.zeros(len(s))
+            ok = (cc > 0) & (s > 0)
+            f[ok] = np.clip(cz[ok] / cc[ok], 0.0, 1.0 / s[ok])
+            self._solution = f
+        else:
+            A = self.A.to_dense() if isinstance(self.A, LinearOperator) else np.asarray(self.A)
+            mu = stats['x'] / self.count
+            cov = stats['xxt'] / self.count - np.outer(mu, mu)
+            sigma2 = stats['rr'] / (self.count * A.shape[0])
+            # R = Σ A^T (A Σ A^T + σ² I)^{-1}, from the symmetric system M R^T = A Σ
+            AS = A @ cov
+            M = AS @ A.T + sigma2 * np.eye(A.shape[0])
+            try:
+                R = np.linalg.solve(M, AS).T
+            except np.linalg.LinAlgError:
+                R = (np.linalg.pinv(M, hermitian=True) @ AS).T
+            self._solution = (R, mu - R @ (A @ mu), mu, cov, sigma2)
+        return self._solution
+
+    @property
+    def filter(self) -> np.ndarray:
+        """Learned filter factors f_i, for singular values in descending order."""
+        if self.mode != 'filter':
+            raise AttributeError("only the 'filter' mode learns filter factors")
+        return self._solve()
+
+    @property
+    def lambdas(self) -> np.ndarray:
+        """
+        Per-singular-value λ_i with s_i / (s_i² + λ_i²) = f_i (inf where
+        f_i = 0), for ``tikhonov.reconstruct(A, y, lambdas)``.
+        """
+        f = self.filter
+        lam = np.full(len(f), np.inf)
+        keep = f > 0
+        lam[keep] = np.sqrt(np.maximum(self.s[keep] / f[keep] - self.s[keep] ** 2, 0.0))
+        return lam
+
+    @property
+    def noise_variance(self) -> float:
+        """σ² of y - A x per measurement ('matrix' mode)."""
+        return self._solve()[4]
+
+    @property
+    def regularization_matrix(self) -> np.ndarray:
+        """B = σ² Σ^{-1} ('matrix' mode; pseudo-inverse when Σ is singular)."""
+        if self.mode != 'matrix':
+            raise AttributeError("only the 'matrix' mode learns a regularization matrix")
+        _, _, _, cov, sigma2 = self._solve()
+        return sigma2 * np.linalg.pinv(cov, hermitian=True)
+
+    def reconstruct(self, y: np.ndarray) -> np.ndarray:
+        """Learned estimate x̂(y); y may be an (m × B) block (an image or image stack for separable A)."""
+        if self.mode == 'filter':
+            return tikhonov.reconstruct(self.A, y, self.lambdas)
+        R, b = self._solve()[:2]
+        return R @ y + (b if np.ndim(y) == 1 else b[:, None])
+
+    def risk(self, lam=None) -> float:
+        """
+        Mean squared error E||x̂ - x||² over the training set ('filter' mode),
+        of the learned filter or, with ``lam``, of Tikhonov with that (scalar
+        or per-singular-value) λ; computed from the statistics in O(n).
+        """
+        if self.mode != 'filter':
+            raise AttributeError("the training risk is computed in the 'filter' mode")
+        f = self.filter if lam is None else self.s / (self.s ** 2 + np.asarray(lam, dtype=float) ** 2)
+        stats = self.stats
+        per_value = f ** 2 * stats['cc'] - 2 * f * stats['cz'] + stats['zz']
+        unreachable = max(stats['xx'] - float(stats['zz'].sum()), 0.0)
+        return (float(per_value.sum()) + unreachable) / self.count
+
+    def best_scalar(self, lambdas=None) -> tuple:
+        """(λ, risk) of the best scalar Tikhonov parameter on a grid, for comparison."""
+        if lambdas is None:
+            positive = self.s[self.s > 0]
+            lambdas = np.geomspace(positive[0], positive[0] * 1e-8, 200)
+        risks = [self.risk(lam) for lam in lambdas]
+        best = int(np.argmin(risks))
+        return float(lambdas[best]), float(risks[best])
+
+    def save(self, path) -> None:
+        """Write the statistics (not the operator) to an .npz file; training can resume from it."""
+        np.savez(path, mode=self.mode, count=self.count, **self.stats)
+
+    @classmethod
+    def load(cls, path, A) -> LearnedTikhonov:
+        """Model for operator A with the statistics saved in ``path``."""
+        with np.load(path) as data:
+            model = cls(A, str(data['mode']))
+            model.count = int(data['count'])
+            for key in model.stats:
+                value = data[key]
+                model.stats[key] = float(value) if value.ndim == 0 else value.copy()
+        return model
@@ -14,15 +14,50 @@ where:
     α_n = decreasing regularization parameter
 
 Morozov Stopping: Stop when ||y - Ax_n|| ≈ τ*δ*||y||
+
+Spectral form (dense A = U S V^T): in the SVD basis every correction is
+diagonal, and the residual coefficients obey
+
+    U^T r_n = U^T y * prod_{j<n} α_j / (s² + α_j)
+
+so iterate n is a cumulative filter factor applied to U^T y. After the one
+(cached) SVD each iteration costs O(n); the cumulative products are scanned
+in blocks of iterations up to the Morozov stopping index, so memory does
+not grow with max_iter.
+
+A may also be a matrix-free LinearOperator; then the correction is computed
+by conjugate gradients using only A @ z and A.T @ r.
+
+A ``callback`` (see reconstruction.telemetry) is invoked after every
+iteration and may stop the iteration early.
+
+Iterates keep the dtype of A and y (float32 or float64); residual norms and
+the Morozov test are always accumulated in float64.
 """
 
+from __future__ import annotations
+
+from time import perf_counter
+
 import numpy as np
-from numpy.linalg import svd, norm
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator, LinearOperator, operator_norm
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable
+from reconstruction.factorization import cached_svd
+from reconstruction.inner_solvers import conjugate_gradient
+from reconstruction.precision import norm, storage_dtype
+from reconstruction.schedules import nsit_schedule
+
+# Iterations per block when scanning the spectral filter factors
+_BLOCK = 64
     
 
 def nsit_with_morozov(A: np.ndarray, y: np.ndarray, noise_level: float,
                       schedule_type: str = 'sqrt', tau: float = 1.0, 
-                      max_iter: int = 100):
+                      max_iter: int = 100, method: str = 'spectral',
+                      store_every: int | None = 1, alpha_0: float | None = None,
+                      callback=None):
     """
     Non-Stationary Iterated Tikhonov (NSIT) with Morozov stopping.
     
@@ -32,8 +67,8 @@ def nsit_with_morozov(A: np.ndarray, y: np.ndarray, noise_level: float,
     
     Parameters:
     -----------
-    A : np.ndarray
-        Forward operator matrix (m × n)
+    A : np.ndarray or LinearOperator
+        Forward operator (m × n)
     y : np.ndarray
         Measurement vector (length m)
     noise_level : float
@@ -44,6 +79,19 @@ def nsit_with_morozov(A: np.ndarray, y: np.ndarray, noise_level: float,
         Safety factor for Morozov principle
     max_iter : int, default=100
         Maximum number of iterations
+    method : str, default='spectral'
+        For dense A: 'spectral' runs every iteration as filter factors on
+        the cached SVD; 'solve' does a dense linear solve per iteration.
+        Matrix-free operators always use conjugate gradients.
+    store_every : int or None, default=1
+        Keep every ``store_every``-th iterate in history['x'] (so
+        history['x'][j] is x_{j * store_every}); None keeps none.
+    alpha_0 : float, optional
+        Initial regularization parameter; defaults to ||A||², the largest
+        squared singular value
+    callback : callable, optional
+        ``callback(iteration, residual, alpha, matvecs, inner_iterations,
+        elapsed)`` after every iteration; returning True stops the iteration
         
     Returns:
     --------
@@ -53,40 +101,51 @@ def nsit_with_morozov(A: np.ndarray, y: np.ndarray, noise_level: float,
         Contains 'residuals': ||y - Ax_n||
                 'alphas': regularization parameters used
                 'stopping_iter': iteration where stopped
-                'x': solution at each iteration
+                'x': solution at each stored iteration
     """
+    if isinstance(A, CirculantOperator):
+        return fourier.nsit(A, y, noise_level, schedule_type, tau, max_iter, store_every,
+                            alpha_0, callback)
+    if isinstance(A, FactoredOperator):
+        return factored.nsit(A, y, noise_level, schedule_type, tau, max_iter, store_every,
+                             alpha_0, callback)
+    if isinstance(A, SeparableOperator):
+        return separable.nsit(A, y, noise_level, schedule_type, tau, max_iter, alpha_0, callback)
+
+    matrix_free = isinstance(A, LinearOperator)
+    if method not in ('spectral', 'solve'):
+        raise ValueError("method must be 'spectral' or 'solve'")
+    if method == 'spectral' and not matrix_free:
+        return _nsit_spectral(A, y, noise_level, schedule_type, tau, max_iter, store_every,
+                              alpha_0, callback)
+
     m, n = A.shape
-    x = np.zeros(n)
+    x = np.zeros(n, dtype=storage_dtype(A, y))
     
     # Auto-select initial alpha
-    U, s, _ = svd(A, full_matrices=False)
-    alpha_0 = s.max() ** 2
+    if alpha_0 is None:
+        alpha_0 = operator_norm(A) ** 2 if matrix_free else cached_svd(A)[1].max() ** 2
     
     # Setup schedule function
-    schedules = {
-        'sqrt': lambda n: alpha_0 / np.sqrt(n + 1),
-        'linear': lambda n: alpha_0 / (n + 1),
-        'exp': lambda n: alpha_0 * (0.9 ** n),
-        'power': lambda n: alpha_0 / ((n + 1) ** 1.5),
-    }
-    
-    if schedule_type not in schedules:
-        raise ValueError(f"schedule_type must be one of {list(schedules.keys())}")
-    
-    schedule = schedules[schedule_type]
+    schedule = nsit_schedule(schedule_type, alpha_0)
     
     # Setup Morozov criterion
     target_residual = tau * noise_level * norm(y)
     
-    # Precompute A^T*A for efficiency
-    AtA = A.T @ A
+    # Precompute A^T*A for efficiency; M is reused for A^T*A + α_n*I
+    if not matrix_free:
+        AtA = A.T @ A
+        M = np.empty_like(AtA)
     
     history = {
-        'x': [x.copy()],
+        'x': [x.copy()] if store_every else [],
         'residuals': [],
         'alphas': [],
         'stopping_iter': max_iter - 1
     }
+    matvecs = 0
+    if callback is not None:
+        start = perf_counter()
     
     # Main iteration loop
     for iter_count in range(max_iter):
@@ -97,17 +156,246 @@ def nsit_with_morozov(A: np.ndarray, y: np.ndarray, noise_level: float,
         residual_norm = norm(r)
         
         # Update: x_n = x_{n-1} + (A^T*A + α_n*I)^{-1} * A^T * r
-        correction = np.linalg.solve(AtA + alpha_n * np.eye(n), A.T @ r)
+        if matrix_free:
+            correction, inner = conjugate_gradient(
+                lambda z: A.T @ (A @ z) + alpha_n * z, A.T @ r)
+        else:
+            M[:] = AtA
+            M.flat[::n + 1] += alpha_n
+            correction = np.linalg.solve(M, A.T @ r)
+            inner = 0
         x = x + correction
+        matvecs += 2 + 2 * inner
         
         # Store history
         history['residuals'].append(residual_norm)
         history['alphas'].append(alpha_n)
-        history['x'].append(x.copy())
+        if store_every and (iter_count + 1) % store_every == 0:
+            history['x'].append(x.copy())
         
-        # Check Morozov stopping criterion
+        # Check Morozov stopping criterion, then the callback
         if residual_norm <= target_residual:
             history['stopping_iter'] = iter_count
+            if callback is not None:
+                callback(iter_count, residual_norm, alpha_n, matvecs, inner, perf_counter() - start)
+            break
+        if callback is not None and callback(iter_count, residual_norm, alpha_n, matvecs, inner,
+                                             perf_counter() - start):
+            history['stopping_iter'] = iter_count
             break
     
     return x, history
+
+
+def _nsit_spectral(A: np.ndarray, y: np.ndarray, noise_level: float,
+                   schedule_type: str, tau: float, max_iter: int,
+                   store_every: int | None, alpha_0: float | None = None, callback=None):
+    """NSIT on the cached SVD: all iterations as cumulative filter factors."""
+    if callback is not None:
+        start = perf_counter()
+    U, s, Vt = cached_svd(A)
+    c = U.T @ y
+    dtype = c.dtype
+    s2 = s.astype(np.float64) ** 2
+
+    schedule = nsit_schedule(schedule_type, s2.max() if alpha_0 is None else alpha_0)
+    alphas = np.array([schedule(k) for k in range(max_iter)])
+    target_residual = tau * noise_level * norm(y)
+
+    # ||y - A x_k||² = ||c * decay_k||² + ||y - U U^T y||², decay_k = prod_{j<k} α_j / (s² + α_j)
+    perp2 = max(norm(y) ** 2 - norm(c) ** 2, 0.0)
+    c2 = np.square(c, dtype=np.float64)
+    residuals = []
+    for _, D in _decay_blocks(s2, alphas[:max_iter - 1]):
+        block = np.sqrt(c2 @ D ** 2 + perp2)
+        residuals.extend(block)
+        if (block <= target_residual).any():
+            break
+    residuals = np.array(residuals)
+
+    hits = np.flatnonzero(residuals <= target_residual)
+    stop = int(hits[0]) if len(hits) else max_iter - 1
+    if callback is not None:
+        # Replay the iterations for the callback; it may stop before Morozov
+        for k in range(stop + 1):
+            if callback(k, residuals[k], alphas[k], 0, 0, perf_counter() - start):
+                stop = k
+                break
+
+    # x_k = V diag((1 - decay_k) / s) c
+    coef = np.zeros_like(c)
+    nz = s > 0
+    coef[nz] = c[nz] / s[nz]
+    history = {
+        'x': [],
+        'residuals': residuals[:stop + 1].tolist(),
+        'alphas': alphas[:stop + 1].tolist(),
+        'stopping_iter': stop
+    }
+    if store_every:
+        ks = np.arange(0, stop + 2, store_every)
+        X = Vt.T @ ((1.0 - _decay_columns(s2, alphas, ks)) * coef[:, None]).astype(dtype)
+        history['x'] = list(X.T)
+    x = Vt.T @ ((1.0 - _decay_columns(s2, alphas, [stop + 1])[:, 0]) * coef).astype(dtype)
+    return x, history
+
+
+def nsit_with_morozov_batch(A: np.ndarray, Y: np.ndarray, noise_level: float,
+                            schedule_type: str = 'sqrt', tau: float = 1.0,
+                            max_iter: int = 100, method: str = 'spectral',
+                            alpha_0: float | None = None):
+    """
+    NSIT with Morozov stopping for many measurement vectors at once.
+
+    Every column of Y (m × B) is reconstructed against the same operator
+    and stops at its own threshold τ*δ*||y_b||. With method='spectral' all
+    columns and iterations are evaluated together from the cached SVD;
+    otherwise the still-active columns are corrected together with one
+    multi-right-hand-side solve (dense) or block CG (matrix-free) per
+    iteration.
+
+    Returns:
+    --------
+    X : np.ndarray
+        Reconstructed solutions (n × B)
+    history : dict
+        Contains 'residuals': (iterations × B) array of ||y_b - A x_b||,
+                 NaN once a column has stopped
+                'alphas': regularization parameters used
+                'stopping_iter': per-column stopping iteration (length B)
+    """
+    if method not in ('spectral', 'solve'):
+        raise ValueError("method must be 'spectral' or 'solve'")
+    matrix_free = isinstance(A, LinearOperator)
+    if method == 'spectral' and not matrix_free:
+        return _nsit_spectral_batch(A, Y, noise_level, schedule_type, tau, max_iter, alpha_0)
+
+    m, n = A.shape
+    B = Y.shape[1]
+    X = np.zeros((n, B), dtype=storage_dtype(A, Y))
+
+    if alpha_0 is None:
+        alpha_0 = operator_norm(A) ** 2 if matrix_free else cached_svd(A)[1].max() ** 2
+    if not matrix_free:
+        AtA = A.T @ A
+        M = np.empty_like(AtA)
+    schedule = nsit_schedule(schedule_type, alpha_0)
+
+    target = tau * noise_level * norm(Y, axis=0)
+    active = np.ones(B, dtype=bool)
+    stopping_iter = np.full(B, max_iter - 1)
+    residuals = []
+    alphas = []
+
+    for iter_count in range(max_iter):
+        alpha_n = schedule(iter_count)
+        idx = np.flatnonzero(active)
+
+        R = Y[:, idx] - A @ X[:, idx]
+        res = np.full(B, np.nan)
+        res[idx] = norm(R, axis=0)
+
+        if matrix_free:
+            correction, _ = conjugate_gradient(
+                lambda Z: A.T @ (A @ Z) + alpha_n * Z, A.T @ R)
+        else:
+            M[:] = AtA
+            M.flat[::n + 1] += alpha_n
+            correction = np.linalg.solve(M, A.T @ R)
+        X[:, idx] += correction
+
+        residuals.append(res)
+        alphas.append(alpha_n)
+
+        done = idx[res[idx] <= target[idx]]
+        stopping_iter[done] = iter_count
+        active[done] = False
+        if not active.any():
+            break
+
+    history = {
+        'residuals': np.array(residuals),
+        'alphas': alphas,
+        'stopping_iter': stopping_iter,
+    }
+    return X, history
+
+
+def _nsit_spectral_batch(A: np.ndarray, Y: np.ndarray, noise_level: float,
+                         schedule_type: str, tau: float, max_iter: int,
+                         alpha_0: float | None = None):
+    """Batched spectral NSIT: residual norms for all iterations and columns in one GEMM."""
+    U, s, Vt = cached_svd(A)
+    C = U.T @ Y
+    s2 = s.astype(np.float64) ** 2
+
+    schedule = nsit_schedule(schedule_type, s2.max() if alpha_0 is None else alpha_0)
+    alphas = np.array([schedule(k) for k in range(max_iter)])
+    target = tau * noise_level * norm(Y, axis=0)
+
+    # residuals[k, b]² = sum_i decay[i, k]² C[i, b]² + ||y_b - U U^T y_b||²
+    perp2 = np.maximum(norm(Y, axis=0) ** 2 - norm(C, axis=0) ** 2, 0.0)
+    C2 = np.square(C, dtype=np.float64)
+    blocks = []
+    done = np.zeros(Y.shape[1], dtype=bool)
+    for _, D in _decay_blocks(s2, alphas[:max_iter - 1]):
+        blocks.append(np.sqrt((D ** 2).T @ C2 + perp2[None, :]))
+        done |= (blocks[-1] <= target[None, :]).any(axis=0)
+        if done.all():
+            break
+    residuals = np.full((max_iter, Y.shape[1]), np.nan)
+    scanned = np.concatenate(blocks)
+    residuals[:len(scanned)] = scanned
+
+    hit = residuals <= target[None, :]
+    stop = np.where(hit.any(axis=0), hit.argmax(axis=0), max_iter - 1)
+
+    coef = np.zeros_like(C)
+    nz = s > 0
+    coef[nz] = C[nz] / s[nz, None]
+    cols, which = np.unique(stop + 1, return_inverse=True)
+    X = Vt.T @ ((1.0 - _decay_columns(s2, alphas, cols)[:, which]) * coef).astype(C.dtype)
+
+    # Mask iterations after each column's stop, as the iterative form reports
+    after = np.arange(max_iter)[:, None] > stop[None, :]
+    residuals[after] = np.nan
+    last = int(stop.max()) + 1
+    history = {
+        'residuals': residuals[:last],
+        'alphas': alphas[:last].tolist(),
+        'stopping_iter': stop,
+    }
+    return X, history
+
+
+def _decay_blocks(s2: np.ndarray, alphas: np.ndarray, block: int | None = None):
+    """
+    Yield (k0, D) with D[:, j] = prod_{i<k0+j} α_i / (s² + α_i), one block of
+    iterations at a time, for k = 0 .. len(alphas).
+
+    Only the running product at the block boundary is carried between
+    blocks, so memory is O(len(s2) * block) however many iterations run.
+    """
+    block = block or _BLOCK
+    run = np.ones_like(s2)
+    total = len(alphas) + 1
+    for k0 in range(0, total, block):
+        k1 = min(k0 + block, total)
+        D = np.empty((len(s2), k1 - k0))
+        D[:, 0] = run
+        a = alphas[k0:k1 - 1]
+        np.cumprod(a / (s2[:, None] + a), axis=1, out=D[:, 1:])
+        D[:, 1:] *= run[:, None]
+        if k1 < total:
+            run = D[:, -1] * (alphas[k1 - 1] / (s2 + alphas[k1 - 1]))
+        yield k0, D
+
+
+def _decay_columns(s2: np.ndarray, alphas: np.ndarray, ks) -> np.ndarray:
+    """Decay columns at the sorted iteration indices ks, scanning only up to max(ks)."""
+    ks = np.asarray(ks)
+    out = np.empty((len(s2), len(ks)))
+    for k0, D in _decay_blocks(s2, alphas[:ks[-1]]):
+        sel = (ks >= k0) & (ks < k0 + D.shape[1])
+        out[:, sel] = D[:, ks[sel] - k0]
+    return out
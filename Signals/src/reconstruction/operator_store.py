@@ -0,0 +1,279 @@
+"""
+Persistent on-disk store of forward operators and their SVDs.
+
+Building ``blur_matrix`` and factoring it are paid again by every process.
+The store saves both under a key derived from the constructor and its
+arguments (defaults filled in, so ``blur_matrix(256, 2.0)`` and
+``blur_matrix(256, 2.0, kernel_radius=10)`` share an entry), one directory
+per entry:
+
+    <root>/<key>/operator.npy, U.npy, s.npy, Vt.npy, meta.json
+
+Arrays are loaded with ``mmap_mode='r'``: nothing is read until touched, and
+worker processes mapping the same entry share the page cache instead of
+holding private copies. Loaded factors are registered in the process-wide
+FactorizationCache under the operator's fingerprint, so ``cached_svd`` and
+everything built on it pick them up without refactoring.
+
+Entries are written to a temporary directory and renamed into place, so
+concurrent writers never expose a half-written entry. Keys include
+STORE_VERSION; bumping it (when a constructor or the file layout changes)
+orphans old entries, which are removed by ``prune``. The total size on disk
+is capped: after each write the least recently used entries are deleted
+until the store fits in ``max_bytes``.
+
+Only deterministic constructors may be stored; random ones need a seed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from forward_models.blur_operator import blur_matrix
+from forward_models.downsample_operator import downsample_matrix
+from forward_models.rank_deficient_operator import rank_deficient_matrix
+from forward_models.linear_operator import digest
+from reconstruction.factorization import cached_svd, get_cache
+
+
+STORE_VERSION = 1
+DEFAULT_MAX_BYTES = 4 * 2**30
+DEFAULT_ROOT = Path(os.environ.get('SIGNALS_STORE', Path.home() / '.cache' / 'signals' / 'operators'))
+
+BUILDERS = {
+    'blur_matrix': blur_matrix,
+    'downsample_matrix': downsample_matrix,
+    'rank_deficient_matrix': rank_deficient_matrix,
+}
+# Constructors that draw random numbers: only stored with an explicit seed
+SEEDED = {'rank_deficient_matrix'}
+
+_FACTORS = ('U', 's', 'Vt')
+
+
+def _canonical(builder, params: dict) -> tuple:
+    """Constructor name and its arguments with defaults applied, JSON-ready."""
+    if isinstance(builder, str):
+        if builder not in BUILDERS:
+            raise ValueError(f"unknown operator {builder!r}; expected one of {sorted(BUILDERS)}")
+        name, fn = builder, BUILDERS[builder]
+    else:
+        fn = builder
+        name = next((key for key, value in BUILDERS.items() if value is fn),
+                    f'{fn.__module__}.{fn.__qualname__}')
+
+    signature = inspect.signature(fn, eval_str=True)
+    bound = signature.bind(**params)
+    bound.apply_defaults()
+    args = {}
+    for key, value in bound.arguments.items():
+        annotation = signature.parameters[key].annotation
+        if key == 'dtype':
+            value = np.dtype(value).name
+        elif annotation is float:
+            value = float(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        args[key] = value
+    if name in SEEDED and args.get('seed') is None:
+        raise ValueError(f"{name} is random; pass seed= to store it")
+    return name, fn, args
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+class OperatorStore:
+    """
+    Disk cache of operators and thin SVDs keyed by constructor parameters.
+
+    Parameters
+    ----------
+    root : str or Path, optional
+        Directory holding the entries (defaults to $SIGNALS_STORE or
+        ~/.cache/signals/operators)
+    max_bytes : int
+        Size cap on disk; least recently used entries are deleted beyond it.
+        An entry larger than the cap is returned but not kept.
+    """
+
+    def __init__(self, root=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root is not None else DEFAULT_ROOT
+        self.max_bytes = int(max_bytes)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def key(self, builder, **params) -> str:
+        """Entry name for ``builder(**params)``."""
+        name, _, args = _canonical(builder, params)
+        text = json.dumps({'version': STORE_VERSION, 'builder': name, 'params': args}, sort_keys=True)
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def operator(self, builder, **params) -> np.ndarray:
+        """Read-only memory-mapped ``builder(**params)``, built and saved on a miss."""
+        entry, A = self._entry(builder, params)
+        return A if entry is None else self._load(entry, 'operator')
+
+    def svd(self, builder, **params) -> tuple:
+        """
+        Memory-mapped thin SVD (U, s, Vt) of ``builder(**params)``.
+
+        The factors are computed with ``cached_svd`` on a miss and saved next
+        to the operator; either way they end up in the process-wide
+        factorization cache under the operator's fingerprint.
+        """
+        entry, A = self._entry(builder, params)
+        if entry is None:
+            return cached_svd(A)
+        if not all((entry / f'{f}.npy').exists() for f in _FACTORS):
+            factors = cached_svd(self._load(entry, 'operator'))
+            self._add_files(entry, dict(zip(_FACTORS, factors)))
+            return factors
+
+        meta = self._meta(entry)
+        factors = tuple(self._load(entry, f) for f in _FACTORS)
+        get_cache().put((tuple(meta['shape']), meta['dtype'], meta['digest']), factors)
+        return factors
+
+    def entries(self) -> list:
+        """Metadata of every valid entry, most recently used first."""
+        rows = []
+        for path in self._entry_dirs():
+            meta = self._meta(path)
+            if meta is None or meta.get('version') != STORE_VERSION:
+                continue
+            meta['key'] = path.name
+            meta['nbytes'] = _dir_size(path)
+            meta['last_used'] = (path / 'meta.json').stat().st_mtime
+            rows.append(meta)
+        return sorted(rows, key=lambda row: row['last_used'], reverse=True)
+
+    def info(self) -> dict:
+        rows = self.entries()
+        return {
+            'root': str(self.root),
+            'entries': len(rows),
+            'nbytes': sum(row['nbytes'] for row in rows),
+            'max_bytes': self.max_bytes,
+        }
+
+    def prune(self) -> int:
+        """Delete unreadable, stale-version and over-budget entries; returns bytes freed."""
+        freed = 0
+        for path in self._entry_dirs():
+            meta = self._meta(path)
+            if meta is None or meta.get('version') != STORE_VERSION:
+                freed += self._remove(path)
+        return freed + self._evict()
+
+    def clear(self) -> None:
+        for path in self._entry_dirs():
+            self._remove(path)
+
+    # -- internals ---------------------------------------------------------
+
+    def _entry(self, builder, params: dict) -> tuple:
+        """(entry directory, None), or (None, operator) when it was too large to keep."""
+        name, fn, args = _canonical(builder, params)
+        entry = self.root / self.key(builder, **params)
+        if self._meta(entry) is not None:
+            os.utime(entry / 'meta.json')
+            return entry, None
+
+        A = np.ascontiguousarray(fn(**params))
+        meta = {
+            'version': STORE_VERSION,
+            'builder': name,
+            'params': args,
+            'shape': list(A.shape),
+            'dtype': A.dtype.str,
+            'digest': digest(A),
+            'created': time.time(),
+        }
+        self._write(entry, {'operator': A}, meta)
+        return (entry, None) if self._meta(entry) is not None else (None, A)
+
+    def _write(self, entry: Path, arrays: dict, meta: dict) -> None:
+        tmp = Path(tempfile.mkdtemp(prefix='.tmp-', dir=self.root))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp / f'{name}.npy', array)
+            (tmp / 'meta.json').write_text(json.dumps(meta, indent=1))
+            if _dir_size(tmp) > self.max_bytes:
+                return
+            if entry.exists() and self._meta(entry) is None:
+                # Left behind by an interrupted writer (no or unreadable
+                # meta.json); os.replace cannot overwrite a non-empty directory
+                self._remove(entry)
+            try:
+                os.replace(tmp, entry)
+            except OSError:
+                # Another process stored the same entry first
+                return
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self._evict(keep=entry.name)
+
+    def _add_files(self, entry: Path, arrays: dict) -> None:
+        if _dir_size(entry) + sum(a.nbytes for a in arrays.values()) > self.max_bytes:
+            return
+        for name, array in arrays.items():
+            fd, tmp = tempfile.mkstemp(suffix='.npy', dir=entry)
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp, entry / f'{name}.npy')
+        self._evict(keep=entry.name)
+
+    @staticmethod
+    def _load(entry: Path, name: str) -> np.ndarray:
+        return np.load(entry / f'{name}.npy', mmap_mode='r')
+
+    def _meta(self, entry: Path):
+        try:
+            meta = json.loads((entry / 'meta.json').read_text())
+        except (OSError, ValueError):
+            return None
+        if not (entry / 'operator.npy').exists():
+            return None
+        return meta
+
+    def _entry_dirs(self) -> list:
+        return [p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith('.')]
+
+    def _remove(self, path: Path) -> int:
+        size = _dir_size(path) if path.exists() else 0
+        shutil.rmtree(path, ignore_errors=True)
+        return size
+
+    def _evict(self, keep: str | None = None) -> int:
+        rows = self.entries()
+        total = sum(row['nbytes'] for row in rows)
+        freed = 0
+        for row in reversed(rows):
+            if total <= self.max_bytes:
+                break
+            if row['key'] == keep:
+                continue
+            size = self._remove(self.root / row['key'])
+            total -= size
+            freed += size
+        return freed
+
+
+_store = None
+
+
+def get_store() -> OperatorStore:
+    """Process-wide store at DEFAULT_ROOT, created on first use."""
+    global _store
+    if _store is None:
+        _store = OperatorStore()
+    return _store
@@ -0,0 +1,343 @@
+"""
+Automatic regularization-parameter selection.
+
+Everything here works on the spectral data of the problem: singular values
+s, coefficients c = U^T y and the part of y outside the range of U,
+||y - U U^T y||². With Tikhonov filter factors φ_i = s_i² / (s_i² + λ²):
+
+    ||r(λ)||² = Σ ((1 - φ_i) c_i)² + ||y_perp||²
+    ||x(λ)||² = Σ (φ_i c_i / s_i)²
+    GCV(λ)    = ||r(λ)||² / (m - Σ φ_i)²
+
+so each λ costs O(n) instead of a reconstruction and an O(n²) product.
+The L-curve curvature uses the closed-form derivatives of Hansen's
+Regularization Tools (lcfun).
+
+Rules:
+    'gcv'          minimize GCV
+    'discrepancy'  solve ||r(λ)|| = τ δ ||y|| (Morozov, δ relative noise)
+    'lcurve'       maximize curvature of (log ||r||, log ||x||)
+
+For Tikhonov a coarse log-spaced scan brackets the optimum, which is then
+refined with Brent's method (minimization) or Brent's root finder
+(discrepancy). For TSVD every k is evaluated at once from cumulative sums.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable
+from reconstruction.factorization import cached_svd
+
+
+RULES = ('gcv', 'discrepancy', 'lcurve')
+
+
+def spectral_data(A, y: np.ndarray) -> tuple:
+    """Singular values s, coefficients c = U^T y, and ||y - U U^T y||²."""
+    if isinstance(A, CirculantOperator):
+        s, c = fourier.picard_data(A, y)
+        return s, c, 0.0
+    if isinstance(A, FactoredOperator):
+        s, order = factored.spectrum(A)
+        return s, factored.coefficients(A, y)[order], 0.0
+    if isinstance(A, SeparableOperator):
+        # Kronecker values in descending order, as the TSVD rules take the
+        # first k entries to be the k largest (separable.tsvd keeps those)
+        s = separable.spectrum(A).ravel()
+        order = np.argsort(-s, kind='stable')
+        s = s[order]
+        c = separable.project(A, y).ravel()[order]
+    else:
+        U, s, _ = cached_svd(A)
+        c = U.T @ y
+    perp2 = max(float(np.sum(y ** 2) - c @ c), 0.0)
+    return s, c, perp2
+
+
+def tikhonov_curves(s: np.ndarray, c: np.ndarray, lams, perp2: float = 0.0,
+                    m: int | None = None) -> dict:
+    """
+    Residual norm, solution norm, GCV and L-curve curvature for each lambda.
+
+    Vectorized over ``lams``; O(n) work per lambda.
+    """
+    lams = np.atleast_1d(np.asarray(lams, dtype=float))
+    m = len(c) if m is None else m
+    s = s[:, None]
+    c2 = (c ** 2)[:, None]
+    lam = lams[None, :]
+
+    f = s ** 2 / (s ** 2 + lam ** 2)
+    cf = 1.0 - f
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xi2 = np.where(s > 0, c2 / s ** 2, 0.0)
+
+    eta2 = np.sum(f ** 2 * xi2, axis=0)
+    rho2 = np.sum(cf ** 2 * c2, axis=0) + perp2
+    eta = np.sqrt(eta2)
+    rho = np.sqrt(rho2)
+
+    # Hansen's lcfun: derivatives of eta and rho with respect to lambda
+    f1 = -2.0 * f * cf / lam
+    f2 = -f1 * (3.0 - 4.0 * f) / lam
+    phi = np.sum(f * f1 * xi2, axis=0)
+    psi = np.sum(cf * f1 * c2, axis=0)
+    dphi = np.sum((f1 ** 2 + f * f2) * xi2, axis=0)
+    dpsi = np.sum((-f1 ** 2 + cf * f2) * c2, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        deta = phi / eta
+        drho = -psi / rho
+        ddeta = dphi / eta - deta * (deta / eta)
+        ddrho = -dpsi / rho - drho * (drho / rho)
+        dlogeta = deta / eta
+        dlogrho = drho / rho
+        ddlogeta = ddeta / eta - dlogeta ** 2
+        ddlogrho = ddrho / rho - dlogrho ** 2
+        curvature = (dlogrho * ddlogeta - ddlogrho * dlogeta) / (dlogrho ** 2 + dlogeta ** 2) ** 1.5
+        gcv = rho2 / (m - np.sum(f, axis=0)) ** 2
+
+    return {
+        'residual_norm': rho,
+        'solution_norm': eta,
+        'gcv': gcv,
+        'curvature': curvature,
+    }
+
+
+def tsvd_curves(s: np.ndarray, c: np.ndarray, perp2: float = 0.0,
+                m: int | None = None) -> dict:
+    """Residual norm, solution norm and GCV for every truncation level k = 0..r."""
+    m = len(c) if m is None else m
+    c2 = c ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xi2 = np.where(s > 0, c2 / s ** 2, 0.0)
+    k = np.arange(len(s) + 1)
+    tail = np.concatenate([[0.0], np.cumsum(c2[::-1])])[::-1]
+    rho2 = tail + perp2
+    eta2 = np.concatenate([[0.0], np.cumsum(xi2)])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gcv = rho2 / (m - k) ** 2
+    return {
+        'k': k,
+        'residual_norm': np.sqrt(rho2),
+        'solution_norm': np.sqrt(eta2),
+        'gcv': gcv,
+    }
+
+
+def _brent_minimize(f, a: float, b: float, tol: float = 1e-6, maxiter: int = 100) -> float:
+    """Brent's method (golden section with parabolic steps) on [a, b]."""
+    golden = 0.3819660112501051
+    x = w = v = a + golden * (b - a)
+    fx = fw = fv = f(x)
+    d = e = 0.0
+    for _ in range(maxiter):
+        mid = 0.5 * (a + b)
+        tol1 = tol * abs(x) + 1e-12
+        tol2 = 2.0 * tol1
+        if abs(x - mid) <= tol2 - 0.5 * (b - a):
+            break
+        use_golden = True
+        if abs(e) > tol1:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2.0 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            if abs(p) < abs(0.5 * q * e) and a * q < p + x * q < b * q:
+                e, d = d, p / q
+                u = x + d
+                if u - a < tol2 or b - u < tol2:
+                    d = tol1 if mid >= x else -tol1
+                use_golden = False
+        if use_golden:
+            e = (a if x >= mid else b) - x
+            d = golden * e
+        u = x + (d if abs(d) >= tol1 else (tol1 if d > 0 else -tol1))
+        fu = f(u)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    return x
+
+
+def _brent_root(g, a: float, b: float, tol: float = 1e-10, maxiter: int = 100) -> float:
+    """Brent's root finder for g on a sign-changing bracket [a, b]."""
+    fa, fb = g(a), g(b)
+    if fa * fb > 0:
+        raise ValueError("root is not bracketed")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb == 0:
+            return b
+        if fa * fb > 0:
+            a, fa = c, fc
+            d = e = b - a
+        if abs(fa) < abs(fb):
+            c, fc = b, fb
+            b, fb = a, fa
+            a, fa = c, fc
+        tol1 = 2e-16 * abs(b) + 0.5 * tol
+        mid = 0.5 * (a - b)
+        if abs(mid) <= tol1:
+            return b
+        if abs(e) >= tol1 and abs(fc) > abs(fb):
+            s = fb / fc
+            if c == a:
+                p, q = 2.0 * mid * s, 1.0 - s
+            else:
+                q, r = fc / fa, fb / fa
+                p = s * (2.0 * mid * q * (q - r) - (b - c) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * mid * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = mid
+        else:
+            d = e = mid
+        c, fc = b, fb
+        b += d if abs(d) > tol1 else (tol1 if mid > 0 else -tol1)
+        fb = g(b)
+    return b
+
+
+def _lambda_range(s: np.ndarray) -> tuple:
+    positive = s[s > 0]
+    hi = float(positive.max())
+    lo = max(float(positive.min()), hi * 1e-12)
+    return np.log(lo) - 1.0, np.log(hi) + 1.0
+
+
+def choose_lambda(A, y: np.ndarray, rule: str = 'gcv', noise_level: float | None = None,
+                  tau: float = 1.0, n_bracket: int = 32) -> float:
+    """
+    Tikhonov parameter chosen by ``rule`` ('gcv', 'discrepancy', 'lcurve').
+
+    Parameters
+    ----------
+    A : np.ndarray or operator
+        Forward operator (dense, LinearOperator, circulant or separable)
+    y : np.ndarray
+        Measurements
+    rule : str
+        Parameter-choice rule
+    noise_level : float, optional
+        Relative noise level δ (required for 'discrepancy')
+    tau : float
+        Morozov safety factor
+    n_bracket : int
+        Points of the coarse log-spaced scan used to bracket the optimum
+
+    Returns
+    -------
+    lam : float
+    """
+    if rule not in RULES:
+        raise ValueError(f"rule must be one of {list(RULES)}")
+    s, c, perp2 = spectral_data(A, y)
+    m = np.size(y)
+    lo, hi = _lambda_range(s)
+
+    if rule == 'discrepancy':
+        if noise_level is None:
+            raise ValueError("the discrepancy rule needs noise_level")
+        target = tau * noise_level * np.linalg.norm(y)
+
+        def gap(t):
+            return tikhonov_curves(s, c, np.exp(t), perp2, m)['residual_norm'][0] - target
+
+        if gap(lo) >= 0:
+            return float(np.exp(lo))
+        if gap(hi) <= 0:
+            return float(np.exp(hi))
+        return float(np.exp(_brent_root(gap, lo, hi)))
+
+    key, sign = ('gcv', 1.0) if rule == 'gcv' else ('curvature', -1.0)
+
+    def objective(t):
+        value = sign * tikhonov_curves(s, c, np.exp(t), perp2, m)[key][0]
+        return value if np.isfinite(value) else np.inf
+
+    grid = np.linspace(lo, hi, n_bracket)
+    values = sign * tikhonov_curves(s, c, np.exp(grid), perp2, m)[key]
+    values = np.where(np.isfinite(values), values, np.inf)
+    i = int(np.argmin(values))
+    a, b = grid[max(i - 1, 0)], grid[min(i + 1, n_bracket - 1)]
+    t = _brent_minimize(objective, a, b)
+    return float(np.exp(t if objective(t) <= values[i] else grid[i]))
+
+
+def choose_k(A, y: np.ndarray, rule: str = 'gcv', noise_level: float | None = None,
+             tau: float = 1.0) -> int:
+    """TSVD truncation level chosen by ``rule``, evaluated exactly over all k."""
+    if rule not in RULES:
+        raise ValueError(f"rule must be one of {list(RULES)}")
+    s, c, perp2 = spectral_data(A, y)
+    m = np.size(y)
+    # Numerical rank; separable operators have no 2D shape, so fall back to (m, #s)
+    size = max(getattr(A, 'shape', (m, s.size)))
+    r = int(np.sum(s > np.finfo(float).eps * size * s.max()))
+    curves = tsvd_curves(s, c, perp2, m)
+
+    if rule == 'discrepancy':
+        if noise_level is None:
+            raise ValueError("the discrepancy rule needs noise_level")
+        target = tau * noise_level * np.linalg.norm(y)
+        hits = np.flatnonzero(curves['residual_norm'][:r + 1] <= target)
+        return int(hits[0]) if len(hits) else r
+
+    if rule == 'gcv':
+        gcv = curves['gcv'][:min(r, m - 1) + 1]
+        return int(np.nanargmin(gcv))
+
+    # Discrete L-curve corner: the sharpest turn of the lower convex hull of
+    # (log ||r_k||, log ||x_k||), which ignores the jitter of the noisy tail
+    ks = np.arange(1, r + 1)
+    with np.errstate(divide='ignore'):
+        px = np.log(curves['residual_norm'][ks])
+        py = np.log(curves['solution_norm'][ks])
+    keep = np.isfinite(px) & np.isfinite(py)
+    ks, px, py = ks[keep], px[keep], py[keep]
+    if len(ks) < 3:
+        return r
+    hull = []
+    for j in np.argsort(px, kind='stable'):
+        while len(hull) >= 2:
+            a, b = hull[-2], hull[-1]
+            if (px[b] - px[a]) * (py[j] - py[a]) - (py[b] - py[a]) * (px[j] - px[a]) <= 0:
+                hull.pop()
+            else:
+                break
+        hull.append(j)
+    if len(hull) < 3:
+        return int(ks[hull[0]])
+    hull = np.array(hull)
+    angle = np.arctan2(np.diff(py[hull]), np.diff(px[hull]))
+    turn = np.diff(angle)
+    return int(ks[hull[1 + int(np.argmax(turn))]])
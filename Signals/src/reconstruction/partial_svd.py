@@ -0,0 +1,263 @@
+"""
+Partial SVD backends and condition-number estimation for large operators.
+
+TSVD with a small k, a Picard plot of the leading singular values, or a
+condition number do not need all n singular triplets. Three backends are
+available:
+
+    'full'        LAPACK thin SVD through the shared factorization cache
+    'randomized'  range finder with oversampling and power iterations
+                  (Halko, Martinsson & Tropp), a few block products with A
+    'lanczos'     Golub-Kahan-Lanczos bidiagonalization with full
+                  reorthogonalization, grown until the top k Ritz values
+                  converge; only matvecs with A and A^T
+
+``truncated_svd`` picks one by size and requested rank: small operators or
+large k use the full factorization, small k and matrix-free operators
+Lanczos, and moderate k on large dense matrices the randomized range
+finder, whose block products make better use of BLAS. Partial factors are stored in
+the same cache under (fingerprint, backend, k).
+
+``estimate_condition`` gives s_max / s_min from power iteration on A^T A and
+inverse iteration, without any SVD.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.linalg import norm, qr, svd
+from forward_models.linear_operator import LinearOperator, operator_norm
+from reconstruction.factorization import cached_svd, fingerprint, get_cache
+from reconstruction.inner_solvers import conjugate_gradient
+from reconstruction.precision import storage_dtype
+
+
+BACKENDS = ('full', 'randomized', 'lanczos')
+
+# Operators with min(shape) up to this size are always factored in full
+FULL_SVD_MAX = 2048
+# ... as are requests for more than this fraction of the spectrum
+FULL_RANK_FRACTION = 0.25
+# Dense requests up to this rank use Lanczos rather than the range finder
+LANCZOS_MAX_RANK = 64
+
+
+def randomized_svd(A, k: int, oversample: int = 10, power_iters: int = 4,
+                   rng: np.random.Generator | None = None) -> tuple:
+    """
+    Top-k SVD by randomized range finding.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Operator (m × n)
+    k : int
+        Number of singular triplets
+    oversample : int
+        Extra sample vectors beyond k
+    power_iters : int
+        Subspace iterations with A A^T; sharpen the estimate when the
+        spectrum decays slowly
+    rng : np.random.Generator, optional
+        Source of the Gaussian test matrix
+
+    Returns
+    -------
+    U, s, Vt : np.ndarray
+        (m × k), (k,), (k × n)
+    """
+    m, n = A.shape
+    rng = rng or np.random.default_rng(0)
+    width = min(k + oversample, m, n)
+    Q, _ = qr(A @ rng.standard_normal((n, width), dtype=storage_dtype(A)))
+    for _ in range(power_iters):
+        Q, _ = qr(A.T @ Q)
+        Q, _ = qr(A @ Q)
+    Ub, s, Vt = svd((A.T @ Q).T, full_matrices=False)
+    return Q @ Ub[:, :k], s[:k], Vt[:k]
+
+
+def lanczos_svd(A, k: int, ncv: int | None = None, tol: float = 1e-8,
+                rng: np.random.Generator | None = None) -> tuple:
+    """
+    Top-k SVD by Golub-Kahan-Lanczos bidiagonalization.
+
+    Runs A V_j = U_j B_j with B_j upper bidiagonal, reorthogonalizing fully,
+    and doubles j until the Ritz residuals β_j |p_j| of the k largest
+    singular values of B_j fall below tol * s_1.
+
+    Parameters
+    ----------
+    A : np.ndarray or LinearOperator
+        Operator (m × n)
+    k : int
+        Number of singular triplets
+    ncv : int, optional
+        Initial Krylov dimension (defaults to max(2k + 1, k + 20))
+    tol : float
+        Relative residual tolerance
+    rng : np.random.Generator, optional
+        Source of the starting vector
+
+    Returns
+    -------
+    U, s, Vt : np.ndarray
+        (m × k), (k,), (k × n)
+    """
+    m, n = A.shape
+    p = min(m, n)
+    rng = rng or np.random.default_rng(0)
+    steps = min(ncv or max(2 * k + 1, k + 20), p)
+    dtype = storage_dtype(A)
+    small = np.finfo(dtype).eps * p
+
+    U = np.zeros((m, steps), dtype=dtype)
+    V = np.zeros((n, steps + 1), dtype=dtype)
+    alpha = np.zeros(steps)
+    beta = np.zeros(steps)
+
+    def fresh(basis, j):
+        # Random unit vector orthogonal to the first j basis vectors
+        w = rng.standard_normal(basis.shape[0], dtype=dtype)
+        for _ in range(2):
+            w -= basis[:, :j] @ (basis[:, :j].T @ w)
+        return w / norm(w)
+
+    v = rng.standard_normal(n)
+    V[:, 0] = v / norm(v)
+    j = 0
+    while True:
+        while j < steps:
+            u = A @ V[:, j]
+            if j > 0:
+                u -= beta[j - 1] * U[:, j - 1]
+            for _ in range(2):
+                u -= U[:, :j] @ (U[:, :j].T @ u)
+            alpha[j] = norm(u)
+            if alpha[j] <= small * max(alpha[0], 1.0):
+                alpha[j] = 0.0
+                U[:, j] = fresh(U, j)
+            else:
+                U[:, j] = u / alpha[j]
+
+            w = A.T @ U[:, j] - alpha[j] * V[:, j]
+            for _ in range(2):
+                w -= V[:, :j + 1] @ (V[:, :j + 1].T @ w)
+            beta[j] = norm(w)
+            if j + 1 < n:
+                if beta[j] <= small * max(alpha[0], 1.0):
+                    beta[j] = 0.0
+                    V[:, j + 1] = fresh(V, j + 1)
+                else:
+                    V[:, j + 1] = w / beta[j]
+            j += 1
+
+        B = np.diag(alpha[:j]) + np.diag(beta[:j - 1], 1)
+        P, s, Qt = svd(B)
+        residual = np.abs(beta[j - 1] * P[j - 1, :k])
+        if j == p or np.all(residual <= tol * s[0]):
+            break
+
+        # Grow the Krylov space
+        steps = min(2 * steps, p)
+        U = np.hstack([U, np.zeros((m, steps - j), dtype=dtype)])
+        V = np.hstack([V, np.zeros((n, steps - j), dtype=dtype)])
+        alpha = np.concatenate([alpha, np.zeros(steps - j)])
+        beta = np.concatenate([beta, np.zeros(steps - j)])
+
+    P, Qt = P.astype(dtype), Qt.astype(dtype)
+    return U[:, :j] @ P[:, :k], s[:k].astype(dtype), Qt[:k] @ V[:, :j].T
+
+
+def select_backend(A, k: int) -> str:
+    """Backend ``truncated_svd`` uses for the top-k factors of A."""
+    p = min(A.shape)
+    if p <= FULL_SVD_MAX or k > FULL_RANK_FRACTION * p:
+        return 'full'
+    if isinstance(A, LinearOperator) or k <= LANCZOS_MAX_RANK:
+        return 'lanczos'
+    return 'randomized'
+
+
+def truncated_svd(A, k: int, backend: str = 'auto', **kwargs) -> tuple:
+    """
+    Leading k singular triplets (U_k, s_k, Vt_k) of A, cached.
+
+    A full factorization already in the cache is sliced rather than
+    recomputed. ``backend`` is 'auto' (see ``select_backend``) or one of
+    BACKENDS; extra keyword arguments go to the partial backend.
+    """
+    m, n = A.shape
+    k = int(np.clip(k, 0, min(m, n)))
+    if backend == 'auto':
+        backend = select_backend(A, k)
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be 'auto' or one of {list(BACKENDS)}")
+
+    cache = get_cache()
+    key = fingerprint(A)
+    full = cache.get(key) if backend != 'full' else None
+    if backend == 'full' or full is not None:
+        U, s, Vt = full if full is not None else cached_svd(A)
+        return U[:, :k], s[:k], Vt[:k]
+    if k == 0:
+        return np.zeros((m, 0)), np.zeros(0), np.zeros((0, n))
+
+    partial_key = (key, backend, k)
+    factors = cache.get(partial_key)
+    if factors is None:
+        solver = randomized_svd if backend == 'randomized' else lanczos_svd
+        factors = solver(A, k, **kwargs)
+        for f in factors:
+            f.flags.writeable = False
+        cache.put(partial_key, factors, owner=A)
+    return factors
+
+
+def smallest_singular_value(A, iters: int = 100, tol: float = 1e-6,
+                            rng: np.random.Generator | None = None) -> float:
+    """
+    Estimate s_min by inverse iteration.
+
+    Dense operators are reduced to a square triangular factor R (A = QR) and
+    s_min = 1 / ||R^{-1}||, with ||R^{-1}|| from power iteration; one O(n³)
+    factorization instead of an SVD. Matrix-free operators run inverse
+    iteration on A^T A with conjugate-gradient solves, which is only as
+    accurate as CG on the normal equations allows.
+    """
+    m, n = A.shape
+    if not isinstance(A, LinearOperator):
+        A = np.asarray(A)
+        if m < n:
+            A = A.T
+        R = A if A.shape[0] == A.shape[1] else qr(A, mode='r')
+        try:
+            R_inv = np.linalg.inv(R)
+        except np.linalg.LinAlgError:
+            return 0.0
+        return 1.0 / operator_norm(R_inv, iters, tol, rng)
+
+    rng = rng or np.random.default_rng(0)
+    v = rng.standard_normal(n)
+    v /= norm(v)
+    mu = 0.0
+    for _ in range(iters):
+        z, _ = conjugate_gradient(lambda w: A.T @ (A @ w), v, tol=tol)
+        z_norm = norm(z)
+        if not np.isfinite(z_norm) or z_norm == 0:
+            return 0.0
+        v = z / z_norm
+        if abs(z_norm - mu) <= tol * z_norm:
+            mu = z_norm
+            break
+        mu = z_norm
+    return float(1.0 / np.sqrt(mu))
+
+
+def estimate_condition(A, iters: int = 100, tol: float = 1e-6,
+                       rng: np.random.Generator | None = None) -> float:
+    """Condition number s_max / s_min from power and inverse iteration."""
+    s_min = smallest_singular_value(A, iters, tol, rng)
+    if s_min == 0:
+        return float(np.inf)
+    return float(operator_norm(A, iters, tol, rng) / s_min)
@@ -0,0 +1,28 @@
+"""
+Floating-point precision policy.
+
+Operators and signals may be stored in float32, halving memory and using
+single-precision BLAS, or in float64. Forward models and noise generators
+take a ``dtype``; reconstructors keep products, factors and iterates in the
+storage dtype of their inputs and accumulate every norm, residual and
+Morozov comparison in float64 (ACCUMULATE), so stopping decisions are not
+made on single-precision sums.
+"""
+
+import numpy as np
+
+
+ACCUMULATE = np.dtype(np.float64)
+
+
+def storage_dtype(*arrays) -> np.dtype:
+    """float32 if every floating input is float32, float64 otherwise."""
+    dtype = np.result_type(*(np.dtype(getattr(a, 'dtype', np.float64)) for a in arrays))
+    return np.dtype(np.float32) if dtype == np.float32 else ACCUMULATE
+
+
+def norm(a: np.ndarray, axis=None):
+    """Euclidean norm summed in float64 (per column with axis=0)."""
+    if np.iscomplexobj(a):
+        a = np.abs(a)
+    return np.sqrt(np.sum(np.square(a, dtype=ACCUMULATE), axis=axis))
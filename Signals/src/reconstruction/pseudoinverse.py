@@ -1,6 +1,22 @@
 import numpy as np
-from numpy.linalg import pinv
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable
+from reconstruction.factorization import cached_svd
 
 
-def reconstruct(A: np.ndarray, y: np.ndarray) -> np.ndarray:
-    return pinv(A) @ y
+def reconstruct(A: np.ndarray, y: np.ndarray, rcond: float = 1e-15) -> np.ndarray:
+    """Pseudoinverse solution; y may be an (m × B) block, solved with one GEMM."""
+    if isinstance(A, CirculantOperator):
+        return fourier.pseudoinverse(A, y, rcond)
+    if isinstance(A, FactoredOperator):
+        return factored.pseudoinverse(A, y, rcond)
+    if isinstance(A, SeparableOperator):
+        return separable.pseudoinverse(A, y, rcond)
+    # Same cutoff as numpy.linalg.pinv, but reusing the shared SVD
+    U, s, Vt = cached_svd(A)
+    filt = np.zeros_like(s)
+    keep = s > rcond * s.max()
+    filt[keep] = 1.0 / s[keep]
+    return (Vt.T * filt) @ (U.T @ y)
@@ -0,0 +1,18 @@
+import numpy as np
+
+
+def nsit_schedule(schedule_type: str, alpha_0: float):
+    """Decreasing NSIT regularization schedule n -> α_n starting from alpha_0.
+
+    α_n is a Python float, so it does not promote float32 iterates.
+    """
+    schedules = {
+        'sqrt': lambda n: alpha_0 / np.sqrt(n + 1),
+        'linear': lambda n: alpha_0 / (n + 1),
+        'exp': lambda n: alpha_0 * (0.9 ** n),
+        'power': lambda n: alpha_0 / ((n + 1) ** 1.5),
+    }
+    if schedule_type not in schedules:
+        raise ValueError(f"schedule_type must be one of {list(schedules.keys())}")
+    schedule = schedules[schedule_type]
+    return lambda n: float(schedule(n))
@@ -1,7 +1,8 @@
 import numpy as np
 
 
-def tikhonov_filter(s: np.ndarray, lam: float) -> np.ndarray:
+def tikhonov_filter(s: np.ndarray, lam) -> np.ndarray:
+    """s / (s² + λ²); ``lam`` is a scalar or one value per singular value (inf gives 0)."""
     return s / (s**2 + lam**2)
 
 
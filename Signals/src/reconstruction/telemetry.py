@@ -0,0 +1,129 @@
+"""
+Per-iteration callbacks for the iterative reconstructors.
+
+``nsit_with_morozov`` and ``fnsit_reconstruct`` accept ``callback``, called
+once per outer iteration, after the update, as
+
+    callback(iteration, residual, alpha, matvecs, inner_iterations, elapsed)
+
+    iteration         0-based outer iteration index
+    residual          ||y - A x|| tested by the Morozov criterion
+    alpha             regularization parameter α_n of the iteration
+    matvecs           products with A or A^T so far (cumulative)
+    inner_iterations  inner solver steps in this iteration (-1 if unknown)
+    elapsed           seconds since the solve started (perf_counter)
+
+A callback that returns True stops the iteration there, keeping the
+iterate it just produced. Without a callback the solvers do not read the
+clock or build any arguments, so the hook costs one ``is None`` test per
+iteration.
+
+The spectral NSIT path evaluates all iterations at once; its callbacks are
+replayed afterwards in order and report zero matvecs. FNSIT tests the
+Morozov criterion before its update, so its stopping iteration is reported
+without an update and with zero inner iterations.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+RECORD_DTYPE = np.dtype([
+    ('iteration', np.int64),
+    ('residual', np.float64),
+    ('alpha', np.float64),
+    ('matvecs', np.int64),
+    ('inner_iterations', np.int64),
+    ('elapsed', np.float64),
+])
+
+
+class Recorder:
+    """
+    Stores every callback into a preallocated structured array.
+
+    Parameters
+    ----------
+    capacity : int
+        Initial number of rows; doubled when exceeded
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._rows = np.empty(capacity, dtype=RECORD_DTYPE)
+        self.count = 0
+
+    def __call__(self, iteration, residual, alpha, matvecs, inner_iterations, elapsed):
+        if self.count == len(self._rows):
+            grown = np.empty(max(2 * len(self._rows), 1), dtype=RECORD_DTYPE)
+            grown[:self.count] = self._rows
+            self._rows = grown
+        self._rows[self.count] = (iteration, residual, alpha, matvecs, inner_iterations, elapsed)
+        self.count += 1
+        return False
+
+    @property
+    def records(self) -> np.ndarray:
+        """Recorded rows (a view; fields as in RECORD_DTYPE)."""
+        return self._rows[:self.count]
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+class Profiler:
+    """Per-iteration wall time and matvec throughput from perf_counter timestamps."""
+
+    def __init__(self):
+        self._elapsed = []
+        self._matvecs = []
+        self._inner = []
+
+    def __call__(self, iteration, residual, alpha, matvecs, inner_iterations, elapsed):
+        self._elapsed.append(elapsed)
+        self._matvecs.append(matvecs)
+        self._inner.append(inner_iterations)
+        return False
+
+    def iteration_times(self) -> np.ndarray:
+        """Seconds spent in each iteration."""
+        return np.diff(self._elapsed, prepend=0.0)
+
+    def summary(self) -> dict:
+        times = self.iteration_times()
+        total = float(self._elapsed[-1]) if self._elapsed else 0.0
+        matvecs = int(self._matvecs[-1]) if self._matvecs else 0
+        return {
+            'iterations': len(times),
+            'total_seconds': total,
+            'mean_iteration_seconds': float(times.mean()) if len(times) else 0.0,
+            'max_iteration_seconds': float(times.max()) if len(times) else 0.0,
+            'matvecs': matvecs,
+            'matvecs_per_second': matvecs / total if total > 0 else 0.0,
+            'inner_iterations': int(sum(i for i in self._inner if i > 0)),
+        }
+
+
+class Budget:
+    """Stop once a wall-time, matvec or residual limit is reached."""
+
+    def __init__(self, seconds: float | None = None, matvecs: int | None = None,
+                 residual: float | None = None):
+        self.seconds = seconds
+        self.matvecs = matvecs
+        self.residual = residual
+
+    def __call__(self, iteration, residual, alpha, matvecs, inner_iterations, elapsed):
+        return ((self.seconds is not None and elapsed >= self.seconds)
+                or (self.matvecs is not None and matvecs >= self.matvecs)
+                or (self.residual is not None and residual <= self.residual))
+
+
+def chain(*callbacks):
+    """One callback calling each of ``callbacks``; stops if any asks to."""
+    def combined(*args):
+        stop = False
+        for cb in callbacks:
+            stop = bool(cb(*args)) or stop
+        return stop
+    return combined
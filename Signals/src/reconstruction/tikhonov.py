@@ -1,8 +1,72 @@
+from __future__ import annotations
+
 import numpy as np
-from numpy.linalg import svd
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable
+from reconstruction.parameter_choice import choose_lambda
+from reconstruction.factorization import cached_svd
+from reconstruction.spectral_filters import tikhonov_filter
+
+
+def _native_order(A, lam: np.ndarray) -> np.ndarray:
+    """Per-singular-value parameters, given for descending s, in the layout of A's backend."""
+    if isinstance(A, CirculantOperator):
+        order = fourier.spectrum(A)[1]
+    elif isinstance(A, FactoredOperator):
+        order = factored.spectrum(A)[1]
+    elif isinstance(A, SeparableOperator):
+        S = separable.spectrum(A)
+        out = np.empty(S.size)
+        out[np.argsort(-S, axis=None, kind='stable')] = lam
+        return out.reshape(S.shape)
+    else:
+        return lam
+    out = np.empty_like(lam)
+    out[order] = lam
+    return out
+
 
+def reconstruct(A: np.ndarray, y: np.ndarray, lam, noise_level: float | None = None,
+                tau: float = 1.0) -> np.ndarray:
+    """Tikhonov solution; y may be an (m × B) block, solved with one GEMM.
 
-def reconstruct(A: np.ndarray, y: np.ndarray, lam: float) -> np.ndarray:
-    U, s, Vt = svd(A, full_matrices=False)
+    ``lam`` may also name a parameter-choice rule ('gcv', 'discrepancy',
+    'lcurve'; see reconstruction.parameter_choice), applied to a single y.
+    ``noise_level`` and ``tau`` are only used by the discrepancy rule.
+    An array gives one parameter per singular value, in order of descending
+    singular values (as learned by reconstruction.learned); the filter is
+    then s_i / (s_i² + λ_i²), at the cost of a scalar λ.
+    """
+    if isinstance(lam, str):
+        lam = choose_lambda(A, y, lam, noise_level=noise_level, tau=tau)
+    elif np.ndim(lam):
+        lam = _native_order(A, np.asarray(lam, dtype=float))
+    if isinstance(A, CirculantOperator):
+        return fourier.tikhonov(A, y, lam)
+    if isinstance(A, FactoredOperator):
+        return factored.tikhonov(A, y, lam)
+    if isinstance(A, SeparableOperator):
+        return separable.tikhonov(A, y, lam)
+    U, s, Vt = cached_svd(A)
     filt = s / (s**2 + lam**2)
     return (Vt.T * filt) @ (U.T @ y)
+
+
+def reconstruct_path(A: np.ndarray, y: np.ndarray, lams) -> np.ndarray:
+    """Tikhonov solutions for every lambda in ``lams``, one per column (n × L).
+
+    For a SeparableOperator and an image y the solutions are stacked on the
+    last axis instead (H × W × L).
+    """
+    if isinstance(A, CirculantOperator):
+        return fourier.tikhonov_path(A, y, lams)
+    if isinstance(A, FactoredOperator):
+        return factored.tikhonov_path(A, y, lams)
+    if isinstance(A, SeparableOperator):
+        return separable.tikhonov_path(A, y, lams)
+    U, s, Vt = cached_svd(A)
+    lams = np.asarray(lams, dtype=float)
+    filt = tikhonov_filter(s[:, None], lams[None, :])
+    return Vt.T @ (filt * (U.T @ y)[:, None])
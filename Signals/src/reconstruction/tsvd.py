@@ -1,9 +1,53 @@
+from __future__ import annotations
+
 import numpy as np
-from numpy.linalg import svd
+from forward_models.circulant_operator import CirculantOperator
+from forward_models.linear_operator import FactoredOperator
+from forward_models.separable_operator import SeparableOperator
+from reconstruction import factored, fourier, separable
+from reconstruction.parameter_choice import choose_k
+from reconstruction.partial_svd import truncated_svd
+
+
+def reconstruct(A: np.ndarray, y: np.ndarray, k, noise_level: float | None = None,
+                tau: float = 1.0) -> np.ndarray:
+    """Rank-k TSVD solution; y may be an (m × B) block, solved with one GEMM.
+
+    ``k`` may also name a parameter-choice rule ('gcv', 'discrepancy',
+    'lcurve'; see reconstruction.parameter_choice), applied to a single y.
+    """
+    if isinstance(k, str):
+        k = choose_k(A, y, k, noise_level=noise_level, tau=tau)
+    if isinstance(A, CirculantOperator):
+        return fourier.tsvd(A, y, k)
+    if isinstance(A, FactoredOperator):
+        return factored.tsvd(A, y, k)
+    if isinstance(A, SeparableOperator):
+        return separable.tsvd(A, y, k)
+    U, s, Vt = truncated_svd(A, k)
+    return (Vt.T / s) @ (U.T @ y)
+
+
+def reconstruct_path(A: np.ndarray, y: np.ndarray, ks) -> np.ndarray:
+    """TSVD solutions for every truncation level in ``ks``, one per column (n × L).
 
+    Column j of the running sum over v_i (u_i^T y) / s_i is the rank-(j+1)
+    solution, so all truncation levels cost about as much as one. Only the
+    leading max(ks) singular triplets are computed.
 
-def reconstruct(A: np.ndarray, y: np.ndarray, k: int) -> np.ndarray:
-    U, s, Vt = svd(A, full_matrices=False)
-    filt = np.zeros_like(s)
-    filt[:k] = 1.0 / s[:k]
-    return (Vt.T * filt) @ (U.T @ y)
+    For a SeparableOperator and an image y the solutions are stacked on the
+    last axis instead (H × W × L).
+    """
+    if isinstance(A, CirculantOperator):
+        return fourier.tsvd_path(A, y, ks)
+    if isinstance(A, FactoredOperator):
+        return factored.tsvd_path(A, y, ks)
+    if isinstance(A, SeparableOperator):
+        return separable.tsvd_path(A, y, ks)
+    ks = np.clip(np.asarray(ks, dtype=int), 0, min(A.shape))
+    kmax = int(ks.max(initial=0))
+    U, s, Vt = truncated_svd(A, kmax)
+    coef = (U.T @ y) / s
+    partial = np.cumsum(Vt.T * coef, axis=1)
+    partial = np.hstack([np.zeros((Vt.shape[1], 1)), partial])
+    return partial[:, ks]
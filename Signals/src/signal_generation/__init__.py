@@ -0,0 +1,22 @@
+"""
+Synthetic test signals.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'generate_signals',
+    'random_signals',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
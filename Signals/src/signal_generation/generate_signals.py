@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def sinusoid(t: np.ndarray) -> np.ndarray:
@@ -7,10 +6,9 @@ def sinusoid(t: np.ndarray) -> np.ndarray:
 
 
 def multisine(t: np.ndarray, freqs=(2, 5, 9), amps=(1.0, 0.6, 0.3)) -> np.ndarray:
-    out = np.zeros_like(t)
-    for f, a in zip(freqs, amps):
-        out += a * np.sin(2 * np.pi * f * t)
-    return out
+    t = np.asarray(t)
+    waves = np.sin(2 * np.pi * np.multiply.outer(np.asarray(freqs, dtype=float), t))
+    return np.tensordot(np.asarray(amps, dtype=float), waves, axes=1).astype(t.dtype, copy=False)
 
 
 def piecewise(t: np.ndarray) -> np.ndarray:
@@ -46,11 +44,13 @@ def sine_mixture_2d(
 
     x = np.linspace(0.0, 1.0, size, endpoint=False)
     y = np.linspace(0.0, 1.0, size, endpoint=False)
-    xx, yy = np.meshgrid(x, y)
+    amp, fx, fy, phase = np.asarray(components, dtype=float).reshape(-1, 4).T
 
-    signal = np.zeros((size, size), dtype=float)
-    for amp, fx, fy, phase in components:
-        signal += amp * np.sin(2.0 * np.pi * (fx * xx + fy * yy) + phase)
+    # sin(a + b) = sin(a) cos(b) + cos(a) sin(b) with a along x and b along y,
+    # so the mixture is two (size × K) @ (K × size) products
+    a = 2.0 * np.pi * np.outer(fx, x) + phase[:, None]
+    b = 2.0 * np.pi * np.outer(fy, y)
+    signal = (amp[:, None] * np.cos(b)).T @ np.sin(a) + (amp[:, None] * np.sin(b)).T @ np.cos(a)
 
     if normalize:
         s_min, s_max = signal.min(), signal.max()
@@ -62,6 +62,9 @@ def sine_mixture_2d(
 
 if __name__ == "__main__":
     # Quick visual check when running this module directly.
+    # matplotlib is optional (the ``plot`` extra), so it is only imported here.
+    import matplotlib.pyplot as plt
+
     t = np.linspace(0, 1, 1000)
     y1 = sinusoid(t)
     y2 = multisine(t)
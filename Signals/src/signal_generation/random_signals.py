@@ -0,0 +1,199 @@
+"""
+Randomized test signals and images, generated a batch at a time.
+
+Each signal is a sum of sinusoids with a box jump and a Gaussian spike
+added (the test signal of notebook 9), with every frequency, amplitude,
+phase, jump and spike drawn at random. Images mix plane waves with
+rectangles and Gaussian blobs.
+
+Generation is split in two steps. ``signal_parameters`` / ``image_parameters``
+draw the parameters as (B × K) arrays, one row per signal and one column
+per component. ``synthesize_signals`` / ``synthesize_images`` then evaluate
+the whole batch with broadcast arithmetic and no Python loop over signals
+or components:
+
+    sinusoids   on the uniform grid t_j = j Δ, write j = q L + r with
+                L ≈ √n; by sin(a + b) = sin(a) cos(b) + cos(a) sin(b) the
+                amplitude-weighted sum over K components is two batched
+                (n/L × K) @ (K × L) products, and only 2 B K √n sines are
+                evaluated instead of B K n
+    jumps       ±height deltas at the box edges, scattered with bincount
+                and integrated by a cumulative sum, O(B n)
+    images      plane waves and blobs are separable in the same way, with
+                a along x and b along y: a (B × H × W) batch is two batched
+                (H × K) @ (K × W) products and takes B K (H + W) sines;
+                rectangles are corner deltas integrated along both axes
+
+``batch_streams`` spawns one independent generator per batch from a seed
+(the pattern of noise_models.noise.noise_streams), so batch i always holds
+the same signals however many batches are drawn or in which order.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def batch_streams(n_batches: int, seed=None) -> list:
+    """One independent generator per batch, spawned from ``seed``."""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n_batches)]
+
+
+def _signs(rng: np.random.Generator, shape: tuple) -> np.ndarray:
+    return np.where(rng.random(shape) < 0.5, -1.0, 1.0)
+
+
+def signal_parameters(rng: np.random.Generator, batch: int, components: int = 3, jumps: int = 1,
+                      spikes: int = 1, max_freq: float = 10.0) -> dict:
+    """
+    Random parameters of ``batch`` 1-D signals on t in [0, 1].
+
+    Returns a dict of (batch × K) arrays: 'freqs' in [1, max_freq], 'amps'
+    in [0.1, 0.6] and 'phases' for the sinusoids; 'jump_start',
+    'jump_stop' and 'jump_height' (±0.3 to ±0.9) for the jumps;
+    'spike_center', 'spike_width' (0.01 to 0.05) and 'spike_height'
+    (0.5 to 1) for the spikes.
+    """
+    start = rng.uniform(0.0, 0.9, (batch, jumps))
+    return {
+        'freqs': rng.uniform(1.0, max_freq, (batch, components)),
+        'amps': rng.uniform(0.1, 0.6, (batch, components)),
+        'phases': rng.uniform(0.0, 2 * np.pi, (batch, components)),
+        'jump_start': start,
+        'jump_stop': np.minimum(start + rng.uniform(0.05, 0.3, (batch, jumps)), 1.0),
+        'jump_height': _signs(rng, (batch, jumps)) * rng.uniform(0.3, 0.9, (batch, jumps)),
+        'spike_center': rng.uniform(0.05, 0.95, (batch, spikes)),
+        'spike_width': rng.uniform(0.01, 0.05, (batch, spikes)),
+        'spike_height': rng.uniform(0.5, 1.0, (batch, spikes)),
+    }
+
+
+def _steps(starts: np.ndarray, stops: np.ndarray, heights: np.ndarray, n: int) -> np.ndarray:
+    """(B × n) sum of boxes heights[b, j] on [starts[b, j], stops[b, j]) (sample indices)."""
+    B = starts.shape[0]
+    rows = np.arange(B)[:, None] * (n + 1)
+    index = np.concatenate([rows + starts, rows + stops], axis=1).ravel()
+    weights = np.concatenate([heights, -heights], axis=1).ravel()
+    deltas = np.bincount(index, weights, minlength=B * (n + 1)).reshape(B, n + 1)
+    return np.cumsum(deltas[:, :n], axis=1)
+
+
+def _sinusoids(amps: np.ndarray, omegas: np.ndarray, phases: np.ndarray, n: int) -> np.ndarray:
+    """(B × n) sum over k of amps[:, k] sin(omegas[:, k] j + phases[:, k]), j = 0..n-1."""
+    B = amps.shape[0]
+    L = max(int(np.ceil(np.sqrt(n))), 1)
+    Q = -(-n // L)
+    # Angles at the block starts q L (B × K × Q) and within a block r (B × K × L)
+    head = np.multiply.outer(omegas * L, np.arange(Q))
+    head += phases[..., None]
+    tail = np.multiply.outer(omegas, np.arange(L))
+    a = amps[..., None]
+    out = (a * np.sin(head)).transpose(0, 2, 1) @ np.cos(tail)
+    out += (a * np.cos(head)).transpose(0, 2, 1) @ np.sin(tail)
+    return out.reshape(B, Q * L)[:, :n]
+
+
+def synthesize_signals(params: dict, n: int, dtype=np.float64) -> np.ndarray:
+    """Evaluate ``signal_parameters`` output on n samples of [0, 1]; (B × n)."""
+    t = np.linspace(0.0, 1.0, n)
+    step = 1.0 / max(n - 1, 1)
+
+    out = _sinusoids(params['amps'], 2 * np.pi * step * params['freqs'], params['phases'], n)
+
+    starts = np.searchsorted(t, params['jump_start'])
+    stops = np.searchsorted(t, params['jump_stop'], side='right')
+    out += _steps(starts, stops, params['jump_height'], n)
+
+    bumps = np.subtract.outer(params['spike_center'], t)
+    bumps /= params['spike_width'][..., None]
+    np.square(bumps, out=bumps)
+    bumps *= -0.5
+    np.exp(bumps, out=bumps)
+    out += np.einsum('bk,bkn->bn', params['spike_height'], bumps)
+    return out.astype(dtype, copy=False)
+
+
+def random_signals(batch: int, n: int, rng: np.random.Generator | None = None,
+                   dtype=np.float64, **kwargs) -> np.ndarray:
+    """(batch × n) random signals; keyword arguments go to ``signal_parameters``."""
+    rng = rng or np.random.default_rng()
+    return synthesize_signals(signal_parameters(rng, batch, **kwargs), n, dtype)
+
+
+def image_parameters(rng: np.random.Generator, batch: int, components: int = 3,
+                     rectangles: int = 1, blobs: int = 1, max_freq: float = 8.0) -> dict:
+    """
+    Random parameters of ``batch`` images on [0, 1)².
+
+    Returns a dict of (batch × K) arrays: 'amps', 'fx', 'fy' and 'phases' of
+    the plane waves amp sin(2π (fx x + fy y) + φ); 'rect_x0', 'rect_x1',
+    'rect_y0', 'rect_y1' and 'rect_height' of the rectangles;
+    'blob_x', 'blob_y', 'blob_width' and 'blob_height' of the Gaussian blobs.
+    """
+    x0 = rng.uniform(0.0, 0.8, (batch, rectangles))
+    y0 = rng.uniform(0.0, 0.8, (batch, rectangles))
+    return {
+        'amps': rng.uniform(0.1, 0.6, (batch, components)),
+        'fx': rng.uniform(0.0, max_freq, (batch, components)),
+        'fy': rng.uniform(0.0, max_freq, (batch, components)),
+        'phases': rng.uniform(0.0, 2 * np.pi, (batch, components)),
+        'rect_x0': x0,
+        'rect_x1': np.minimum(x0 + rng.uniform(0.1, 0.4, (batch, rectangles)), 1.0),
+        'rect_y0': y0,
+        'rect_y1': np.minimum(y0 + rng.uniform(0.1, 0.4, (batch, rectangles)), 1.0),
+        'rect_height': _signs(rng, (batch, rectangles)) * rng.uniform(0.3, 0.9, (batch, rectangles)),
+        'blob_x': rng.uniform(0.1, 0.9, (batch, blobs)),
+        'blob_y': rng.uniform(0.1, 0.9, (batch, blobs)),
+        'blob_width': rng.uniform(0.02, 0.08, (batch, blobs)),
+        'blob_height': rng.uniform(0.5, 1.0, (batch, blobs)),
+    }
+
+
+def _gaussian(centers: np.ndarray, widths: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    g = np.subtract.outer(centers, grid)
+    g /= widths[..., None]
+    np.square(g, out=g)
+    g *= -0.5
+    return np.exp(g, out=g)
+
+
+def synthesize_images(params: dict, shape: tuple, dtype=np.float64) -> np.ndarray:
+    """Evaluate ``image_parameters`` output on an (H × W) grid; (B × H × W)."""
+    H, W = shape
+    x = np.linspace(0.0, 1.0, W, endpoint=False)
+    y = np.linspace(0.0, 1.0, H, endpoint=False)
+
+    # Plane waves: rows b along y (B × K × H), columns a along x (B × K × W)
+    a = np.multiply.outer(2 * np.pi * params['fx'], x)
+    a += params['phases'][..., None]
+    b = np.multiply.outer(2 * np.pi * params['fy'], y)
+    amps = params['amps'][..., None]
+    out = (amps * np.cos(b)).transpose(0, 2, 1) @ np.sin(a)
+    out += (amps * np.sin(b)).transpose(0, 2, 1) @ np.cos(a)
+
+    # Gaussian blobs: separable products of a column and a row profile
+    gy = params['blob_height'][..., None] * _gaussian(params['blob_y'], params['blob_width'], y)
+    gx = _gaussian(params['blob_x'], params['blob_width'], x)
+    out += gy.transpose(0, 2, 1) @ gx
+
+    # Rectangles: ±height at the four corners, integrated along both axes
+    B = out.shape[0]
+    c0 = np.searchsorted(x, params['rect_x0'])
+    c1 = np.searchsorted(x, params['rect_x1'], side='right')
+    r0 = np.searchsorted(y, params['rect_y0'])
+    r1 = np.searchsorted(y, params['rect_y1'], side='right')
+    h = params['rect_height']
+    base = np.arange(B)[:, None] * (H + 1) * (W + 1)
+    index = np.concatenate([base + r0 * (W + 1) + c0, base + r0 * (W + 1) + c1,
+                            base + r1 * (W + 1) + c0, base + r1 * (W + 1) + c1], axis=1).ravel()
+    weights = np.concatenate([h, -h, -h, h], axis=1).ravel()
+    corners = np.bincount(index, weights, minlength=B * (H + 1) * (W + 1)).reshape(B, H + 1, W + 1)
+    out += np.cumsum(np.cumsum(corners[:, :H, :W], axis=1), axis=2)
+    return out.astype(dtype, copy=False)
+
+
+def random_images(batch: int, shape: tuple, rng: np.random.Generator | None = None,
+                  dtype=np.float64, **kwargs) -> np.ndarray:
+    """(batch × H × W) random images; keyword arguments go to ``image_parameters``."""
+    rng = rng or np.random.default_rng()
+    return synthesize_images(image_parameters(rng, batch, **kwargs), shape, dtype)
@@ -0,0 +1,68 @@
+"""Parameter advice against the local stand-in service."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix
+from reconstruction.advisor import Advisor
+from reconstruction.advisor_server import StubServer
+
+
+@pytest.fixture(scope='module')
+def problem():
+    A = blur_matrix(64, 2.0)
+    t = np.linspace(0, 1, 64)
+    y = A @ np.sin(2 * np.pi * t) + 1e-3 * np.random.default_rng(0).standard_normal(64)
+    return A, y
+
+
+@pytest.mark.parametrize('chunked', [False, True])
+def test_service_answers(problem, chunked):
+    with StubServer(chunked=chunked) as server:
+        result = Advisor(server.url, retries=0).advise(*problem)
+    assert result['source'] == 'service'
+    assert result['lambda'] > 0 and 1 <= result['k'] <= 64
+
+
+def test_advise_inside_running_loop(problem):
+    async def notebook_cell():
+        return Advisor(server.url, retries=0).advise(*problem)
+
+    with StubServer() as server:
+        result = asyncio.run(notebook_cell())
+    assert result['source'] == 'service'
+
+
+def test_fallback_without_service(problem):
+    result = Advisor('').advise(*problem, noise_level=1e-2)
+    assert result['source'] == 'fallback' and result['rule'] == 'discrepancy'
+
+
+@pytest.mark.parametrize('reply', [
+    [1, 2, 3],
+    'answers',
+    {'answers': None},
+    {'answers': [5]},
+    {'answers': {'id': 'x'}},
+    {'answers': [{'id': ['unhashable'], 'lambda': 0.1, 'k': 3}]},
+    {'answers': [{'id': 'unknown', 'lambda': 0.1, 'k': 3}]},
+    {'answers': [{'id': None, 'lambda': 'big', 'k': float('inf')}]},
+], ids=lambda r: type(r).__name__ + ':' + repr(r)[:24])
+def test_malformed_reply_falls_back(problem, monkeypatch, reply):
+    async def post(*args, **kwargs):
+        return reply
+
+    monkeypatch.setattr('reconstruction.advisor._post_json', post)
+    advisor = Advisor('http://127.0.0.1:1/advise', retries=0)
+    result = advisor.advise(*problem)
+    assert result['source'] == 'fallback'
+    assert advisor.stats['fallbacks'] == 1
+
+
+def test_unusable_answer_values_fall_back(problem, monkeypatch):
+    async def post(url, payload, *args, **kwargs):
+        return {'answers': [{'id': r['id'], 'lambda': -1.0, 'k': 10 ** 9} for r in payload['requests']]}
+
+    monkeypatch.setattr('reconstruction.advisor._post_json', post)
+    assert Advisor('http://127.0.0.1:1/advise', retries=0).advise(*problem)['source'] == 'fallback'
@@ -0,0 +1,28 @@
+"""Every batch method runs on vectors and on images."""
+
+import numpy as np
+import pytest
+from pipeline.batch import build_operator, run_method
+
+METHODS = [
+    {'method': 'pseudoinverse'},
+    {'method': 'tikhonov', 'lambda': 'gcv'},
+    {'method': 'tsvd', 'k': 'discrepancy', 'noise_level': 0.01},
+    {'method': 'nsit', 'noise_level': 0.01},
+    {'method': 'fnsit', 'delta': 0.01, 'step_size': None},
+]
+
+
+@pytest.mark.parametrize('shape', [(48,), (24, 20)], ids=['vector', 'image'])
+@pytest.mark.parametrize('method', METHODS, ids=lambda m: m['method'])
+def test_run_method(shape, method):
+    A = build_operator({'type': 'blur', 'sigma': 1.5}, shape, True)
+    grids = np.meshgrid(*(np.linspace(0, 1, d) for d in shape), indexing='ij')
+    x = np.sin(2 * np.pi * grids[0]) + (grids[-1] > 0.5)
+    y = A @ x
+    y = y + 0.01 * np.linalg.norm(y) / np.sqrt(y.size) * np.random.default_rng(0).standard_normal(y.shape)
+    x_hat, _ = run_method(A, y, dict(method))
+    assert x_hat.shape == x.shape
+    assert np.all(np.isfinite(x_hat))
+    if method['method'] != 'pseudoinverse':
+        assert np.linalg.norm(x_hat - x) / np.linalg.norm(x) < 0.5
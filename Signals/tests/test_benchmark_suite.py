@@ -0,0 +1,64 @@
+"""Benchmark suite: every case runs, exponents fit, and regressions are flagged."""
+
+import importlib.util
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+SUITE = Path(__file__).resolve().parent.parent / 'benchmarks' / 'benchmark_suite.py'
+
+
+@pytest.fixture(scope='module')
+def suite():
+    spec = importlib.util.spec_from_file_location('benchmark_suite', SUITE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_case_runs(suite):
+    report = suite.run_suite(list(suite.CASES), [64], repeats=1, isolate=False, log=lambda _: None)
+    assert set(report['results']) == set(suite.CASES)
+    for case, by_size in report['results'].items():
+        entry = by_size['64']
+        assert entry['seconds'] > 0, case
+        assert entry['tracemalloc_peak_mb'] >= 0, case
+    json.dumps(report)
+
+
+def test_scaling_exponent(suite):
+    sizes = [128, 256, 512, 1024]
+    assert suite.scaling_exponent(sizes, [1e-6 * n**2.5 for n in sizes]) == pytest.approx(2.5)
+    assert math.isnan(suite.scaling_exponent([128], [1.0]))
+
+
+def test_budget_skips_predicted_sizes(suite, monkeypatch):
+    monkeypatch.setattr(suite, 'measure', lambda case, n, repeats, warm: {
+        'seconds': (n / 100) ** 2, 'tracemalloc_peak_mb': 0.0, 'rss_peak_mb': 0.0})
+    log = []
+    report = suite.run_suite(['tikhonov'], [100, 200, 400, 800], budget=20.0,
+                             isolate=False, log=log.append)
+    # 1 s, 4 s, then 16 s fits the budget and 64 s is skipped
+    assert list(report['results']['tikhonov']) == ['100', '200', '400']
+    assert any('n=800' in line and 'skipped' in line for line in log)
+    assert report['exponents']['tikhonov'] == pytest.approx(2.0)
+
+
+def _report(seconds):
+    return {'results': {'tikhonov': {str(n): {'seconds': s} for n, s in seconds.items()}}}
+
+
+def test_compare_flags_regressions(suite, tmp_path):
+    baseline = _report({128: 1.0, 256: 2.0, 512: 4.0})
+    current = _report({128: 1.1, 256: 3.0, 1024: 9.0})
+    rows = suite.compare_reports(baseline, current, threshold=0.25)
+    assert [(r['n'], r['regression']) for r in rows] == [(128, False), (256, True)]
+
+    paths = {}
+    for name, report in (('baseline', baseline), ('current', current), ('same', baseline)):
+        paths[name] = tmp_path / f'{name}.json'
+        paths[name].write_text(json.dumps(report))
+    assert suite.main(['compare', str(paths['baseline']), str(paths['current'])]) == 1
+    assert suite.main(['compare', str(paths['baseline']), str(paths['same'])]) == 0
@@ -0,0 +1,39 @@
+"""CGLS Tikhonov paths agree with the SVD solution and report unconverged λ."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix
+from reconstruction import tikhonov
+from reconstruction.cgls import tikhonov_path
+
+
+@pytest.fixture(scope='module')
+def problem():
+    A = blur_matrix(128, 2.0)
+    t = np.linspace(0, 1, 128)
+    y = A @ (np.sin(2 * np.pi * t) + (t > 0.5)) + 1e-3 * np.random.default_rng(0).standard_normal(128)
+    return A, y
+
+
+@pytest.mark.parametrize('method', ['warm', 'multishift'])
+def test_path_matches_svd(problem, method):
+    A, y = problem
+    lams = np.geomspace(1.0, 1e-2, 6)
+    X, info = tikhonov_path(A, y, lams, method=method, tol=1e-10, max_iter=2000)
+    assert info['converged'].all()
+    expected = tikhonov.reconstruct_path(A, y, info['lambdas'])
+    np.testing.assert_allclose(X, expected, atol=1e-6 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize('method', ['warm', 'multishift'])
+def test_iteration_cap_is_reported(problem, method):
+    A, y = problem
+    _, info = tikhonov_path(A, y, np.geomspace(10.0, 1e-4, 6), method=method, tol=1e-4, max_iter=5)
+    assert info['converged'][0]
+    assert not info['converged'][-1]
+
+
+def test_empty_lambdas_rejected(problem):
+    A, y = problem
+    with pytest.raises(ValueError, match='at least one'):
+        tikhonov_path(A, y, [])
@@ -0,0 +1,87 @@
+"""compare_methods on the grid runner matches a plain loop over the methods."""
+
+import numpy as np
+import pytest
+from evaluation.comparison import compare_methods, compare_methods_extended
+from evaluation.error_metrics import mse, psnr, relative_error
+from evaluation.grid import execute_grid
+from forward_models.blur_operator import blur_matrix
+from reconstruction import pseudoinverse, tikhonov, tsvd
+from reconstruction.nsit import nsit_with_morozov
+
+LAMS = [1.0, 0.1, 0.01]
+KS = [5, 10, 20]
+STRATEGIES = ['sqrt', 'exp']
+
+
+@pytest.fixture(scope='module')
+def problem():
+    A = blur_matrix(48, 1.5)
+    t = np.linspace(0, 1, 48)
+    x_true = np.sin(2 * np.pi * t) + (t > 0.5)
+    y = A @ x_true + 0.01 * np.random.default_rng(0).standard_normal(48)
+    return A, y, x_true
+
+
+def _metrics(x_true, x_hat):
+    return {'mse': mse(x_true, x_hat), 'psnr': psnr(x_true, x_hat),
+            'rel_error': relative_error(x_true, x_hat)}
+
+
+def _loop(A, y, x_true, noise_level, max_iter):
+    """One reconstruct call per grid point, as compare_methods used to run."""
+    return {
+        'pseudoinverse': _metrics(x_true, pseudoinverse.reconstruct(A, y)),
+        'tikhonov': [_metrics(x_true, tikhonov.reconstruct(A, y, lam)) for lam in LAMS],
+        'tsvd': [_metrics(x_true, tsvd.reconstruct(A, y, k)) for k in KS],
+        'nsit': [nsit_with_morozov(A, y, noise_level, schedule_type=s, max_iter=max_iter)
+                 for s in STRATEGIES],
+    }
+
+
+def _assert_metrics(entry, expected):
+    for name in ('mse', 'psnr', 'rel_error'):
+        assert entry[name] == pytest.approx(expected[name], rel=1e-8)
+
+
+def test_compare_methods_matches_loop(problem):
+    A, y, x_true = problem
+    results = compare_methods(A, y, x_true, LAMS, KS, STRATEGIES, nsit_max_iters=30,
+                              noise_level=0.01)
+    expected = _loop(A, y, x_true, 0.01, 30)
+    _assert_metrics(results['pseudoinverse'], expected['pseudoinverse'])
+    for method, key, values in (('tikhonov', 'lambda', LAMS), ('tsvd', 'k', KS)):
+        assert [e[key] for e in results[method]] == values
+        for entry, ref in zip(results[method], expected[method]):
+            _assert_metrics(entry, ref)
+    for entry, strategy, (x_hat, history) in zip(results['nsit'], STRATEGIES, expected['nsit']):
+        assert entry['strategy'] == strategy
+        _assert_metrics(entry, _metrics(x_true, x_hat))
+        assert entry['iterations'] == history['stopping_iter'] + 1
+        assert entry['final_residual'] == pytest.approx(history['residuals'][-1])
+        assert entry['final_alpha'] == pytest.approx(history['alphas'][-1])
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_executors_agree(problem, executor):
+    A, y, x_true = problem
+    serial = compare_methods_extended(A, y, x_true, LAMS, KS, [None, 5.0], STRATEGIES,
+                                      nsit_max_iters=20, return_solutions=True)
+    pooled = compare_methods_extended(A, y, x_true, LAMS, KS, [None, 5.0], STRATEGIES,
+                                      nsit_max_iters=20, return_solutions=True,
+                                      executor=executor, max_workers=2)
+    for method in ('tikhonov', 'tsvd', 'nsit'):
+        for a, b in zip(serial[method], pooled[method]):
+            np.testing.assert_allclose(a['solution'], b['solution'])
+            assert a['rel_error'] == pytest.approx(b['rel_error'])
+    assert len(serial['nsit']) == 4
+
+
+def test_noisy_tasks_do_not_depend_on_workers(problem):
+    A, y, x_true = problem
+    tasks = [{'method': 'tikhonov', 'lambda': lam, 'noise_sigma': 0.05} for lam in LAMS * 3]
+    serial = execute_grid(A, y, x_true, tasks, seed=7)
+    threaded = execute_grid(A, y, x_true, tasks, executor='thread', max_workers=3, seed=7)
+    assert [r['mse'] for r in serial] == pytest.approx([r['mse'] for r in threaded])
+    # Repeated λ draw different noise
+    assert serial[0]['mse'] != serial[len(LAMS)]['mse']
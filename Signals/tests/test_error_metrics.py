@@ -0,0 +1,71 @@
+"""Fused batch metrics agree with the scalar metrics and a direct SSIM."""
+
+import numpy as np
+import pytest
+from evaluation.error_metrics import (batch_metrics, frame_metrics, mse, psnr, relative_error,
+                                      ssim)
+
+
+def _direct_ssim(x, y, window_size=11, sigma=1.5):
+    """Gaussian-window SSIM by an explicit loop over window positions."""
+    L = np.ptp(x)
+    C1, C2 = (0.01 * L) ** 2, (0.03 * L) ** 2
+    idx = np.arange(window_size) - window_size // 2
+    w = np.exp(-0.5 * (idx / sigma) ** 2)
+    w = np.outer(w, w) / w.sum() ** 2
+    values = []
+    for i in range(x.shape[0] - window_size + 1):
+        for j in range(x.shape[1] - window_size + 1):
+            a = x[i:i + window_size, j:j + window_size]
+            b = y[i:i + window_size, j:j + window_size]
+            mu_a, mu_b = (w * a).sum(), (w * b).sum()
+            var_a = (w * a * a).sum() - mu_a ** 2
+            var_b = (w * b * b).sum() - mu_b ** 2
+            cov = (w * a * b).sum() - mu_a * mu_b
+            values.append((2 * mu_a * mu_b + C1) * (2 * cov + C2)
+                          / ((mu_a ** 2 + mu_b ** 2 + C1) * (var_a + var_b + C2)))
+    return np.mean(values)
+
+
+@pytest.mark.parametrize('shape', [(50,), (16, 14)], ids=['vector', 'image'])
+def test_batch_matches_scalar_metrics(shape):
+    rng = np.random.default_rng(0)
+    x_true = rng.standard_normal(shape)
+    scale = np.geomspace(1e-3, 1.0, 7).reshape((7,) + (1,) * len(shape))
+    X = x_true + scale * rng.standard_normal((7,) + shape)
+    table = batch_metrics(x_true, X, chunk_size=3)
+    assert table.shape == (7,)
+    assert ('ssim' in table.dtype.names) == (len(shape) == 2)
+    for b in range(7):
+        assert table['mse'][b] == pytest.approx(mse(x_true, X[b]))
+        assert table['psnr'][b] == pytest.approx(psnr(x_true, X[b]))
+        assert table['rel_error'][b] == pytest.approx(relative_error(x_true, X[b]))
+
+
+def test_ssim_matches_direct_window_sum():
+    rng = np.random.default_rng(1)
+    x = np.add.outer(np.sin(np.linspace(0, 3, 16)), np.linspace(0, 1, 15))
+    Y = x + 0.1 * rng.standard_normal((3, 16, 15))
+    values = ssim(x, Y)
+    for b in range(3):
+        assert values[b] == pytest.approx(_direct_ssim(x, Y[b]), rel=1e-10)
+    assert ssim(x, x) == pytest.approx(1.0)
+    np.testing.assert_allclose(batch_metrics(x, Y, chunk_size=2)['ssim'], values)
+
+
+def test_frame_metrics_match_per_row():
+    rng = np.random.default_rng(2)
+    X_true = rng.standard_normal((4, 30))
+    X_est = X_true + 0.1 * rng.standard_normal((4, 30))
+    table = frame_metrics(X_true, X_est)
+    for i in range(4):
+        assert table['mse'][i] == pytest.approx(mse(X_true[i], X_est[i]))
+        assert table['psnr'][i] == pytest.approx(psnr(X_true[i], X_est[i]))
+        assert table['rel_error'][i] == pytest.approx(relative_error(X_true[i], X_est[i]))
+
+
+def test_mismatched_stack_rejected():
+    with pytest.raises(ValueError):
+        batch_metrics(np.zeros(10), np.zeros((3, 11)))
+    with pytest.raises(ValueError):
+        batch_metrics(np.zeros(10), np.zeros((3, 10)), with_ssim=True)
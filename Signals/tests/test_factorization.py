@@ -0,0 +1,116 @@
+"""The process-wide SVD cache factors each operator once and never mixes up operators."""
+
+import gc
+
+import numpy as np
+import pytest
+from diagnostics.l_curve import l_curve
+from diagnostics.picard_plot import picard_data
+from forward_models.linear_operator import LinearOperator
+from reconstruction import pseudoinverse, tikhonov, tsvd
+from reconstruction.factorization import FactorizationCache, fingerprint, get_cache
+from reconstruction.nsit import nsit_with_morozov
+
+
+class Scaled(LinearOperator):
+    """User subclass without a fingerprint of its own."""
+
+    def __init__(self, A):
+        self.A = A
+        self.shape = A.shape
+        self.dtype = A.dtype
+
+    def matvec(self, x):
+        return self.A @ x
+
+    def rmatvec(self, y):
+        return self.A.T @ y
+
+
+def test_identity_keys_are_not_reused():
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(20)
+    for scale in range(1, 11):
+        dense = scale * np.tril(np.ones((20, 20)))
+        A = Scaled(dense)
+        x = tikhonov.reconstruct(A, y, 1e-3)
+        np.testing.assert_allclose(x, tikhonov.reconstruct(dense, y, 1e-3), atol=1e-10)
+        # The next operator is typically allocated at the same address
+        del A
+        gc.collect()
+
+
+def test_entries_of_collected_operators_are_dropped():
+    cache = FactorizationCache()
+    A = Scaled(np.eye(4) * 2.0)
+    cache.svd(A)
+    assert cache.info()['entries'] == 1
+    del A
+    gc.collect()
+    assert cache.info() == {**cache.info(), 'entries': 0, 'nbytes': 0}
+
+
+def test_content_keys_outlive_their_operator():
+    cache = get_cache()
+    A = np.diag([3.0, 2.0, 1.0])
+    cache.svd(A.copy())
+    gc.collect()
+    before = cache.info()['hits']
+    cache.svd(A)
+    assert cache.info()['hits'] == before + 1
+
+
+def test_contains_leaves_stats_alone():
+    cache = FactorizationCache()
+    A = np.diag([3.0, 2.0, 1.0])
+    assert not cache.contains(fingerprint(A))
+    cache.svd(A)
+    before = cache.info()
+    assert cache.contains(fingerprint(A))
+    assert cache.info() == before
+
+
+def test_factors_match_numpy_and_are_read_only():
+    A = np.random.default_rng(1).standard_normal((12, 8))
+    U, s, Vt = FactorizationCache().svd(A)
+    np.testing.assert_allclose(s, np.linalg.svd(A, compute_uv=False))
+    np.testing.assert_allclose((U * s) @ Vt, A, atol=1e-12)
+    with pytest.raises(ValueError):
+        s[0] = 0.0
+
+
+def test_reconstructors_and_diagnostics_share_one_factorization():
+    cache = get_cache()
+    A = np.random.default_rng(2).standard_normal((30, 30))
+    y = np.ones(30)
+    before = cache.info()
+    tikhonov.reconstruct(A, y, 0.1)
+    tsvd.reconstruct(A, y, 10)
+    pseudoinverse.reconstruct(A, y)
+    nsit_with_morozov(A, y, 0.01, max_iter=3, method='solve')
+    picard_data(A, y)
+    l_curve(A, y, np.geomspace(1.0, 1e-3, 5))
+    after = cache.info()
+    assert after['misses'] == before['misses'] + 1
+    assert after['hits'] >= before['hits'] + 5
+
+
+def test_least_recently_used_entries_are_evicted():
+    rng = np.random.default_rng(3)
+    A, B, C = (rng.standard_normal((10, 10)) for _ in range(3))
+    entry = 2 * 10 * 10 * 8 + 10 * 8
+    cache = FactorizationCache(max_bytes=2 * entry)
+    cache.svd(A)
+    cache.svd(B)
+    cache.svd(A)
+    cache.svd(C)
+    assert cache.contains(fingerprint(A))
+    assert not cache.contains(fingerprint(B))
+    assert cache.info()['nbytes'] == 2 * entry
+
+
+def test_factorization_over_budget_is_not_stored():
+    cache = FactorizationCache(max_bytes=100)
+    U, s, Vt = cache.svd(np.eye(10))
+    np.testing.assert_allclose(s, 1.0)
+    assert cache.info()['entries'] == 0
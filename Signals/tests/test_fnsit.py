@@ -0,0 +1,37 @@
+"""FNSIT reports every iteration, including the Morozov stop, to its callback."""
+
+import numpy as np
+from forward_models.blur_operator import blur_matrix
+from reconstruction.fnsit import fnsit_reconstruct
+from reconstruction.telemetry import Recorder
+
+
+def _problem(n=48, seed=0):
+    A = blur_matrix(n, sigma=1.5)
+    x = np.sin(2 * np.pi * np.linspace(0, 1, n))
+    y = A @ x
+    noise = np.random.default_rng(seed).standard_normal(n)
+    return A, y + 0.01 * np.linalg.norm(y) / np.sqrt(n) * noise
+
+
+def test_recorder_sees_morozov_stop():
+    A, y = _problem()
+    recorder = Recorder()
+    _, history = fnsit_reconstruct(A, y, alpha0=1.0, q=0.7, max_iter=100, tau=1.0, delta=0.01,
+                                   inner_solver='cg', callback=recorder)
+    stop = history['final_iteration']
+    assert stop < 99
+    records = recorder.records
+    np.testing.assert_array_equal(records['iteration'], np.arange(stop + 1))
+    assert records['residual'][-1] <= 0.01 * np.linalg.norm(y)
+    np.testing.assert_allclose(records['residual'][:-1], history['residuals'])
+    assert records['inner_iterations'][-1] == 0
+
+
+def test_recorder_sees_every_iteration_without_stop():
+    A, y = _problem()
+    recorder = Recorder()
+    _, history = fnsit_reconstruct(A, y, alpha0=1.0, q=0.9, max_iter=5, tau=1.0, delta=1e-9,
+                                   callback=recorder)
+    assert history['final_iteration'] == 4
+    np.testing.assert_array_equal(recorder.records['iteration'], np.arange(5))
@@ -0,0 +1,55 @@
+"""The FFT path for circulant operators reproduces the dense blur matrix."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix, circulant_blur
+from reconstruction import pseudoinverse, tikhonov, tsvd
+from reconstruction.nsit import nsit_with_morozov
+
+N = 40
+
+
+@pytest.fixture
+def problem():
+    t = np.linspace(0, 1, N)
+    x = np.sin(2 * np.pi * t) + (t > 0.5)
+    A = blur_matrix(N, 1.5)
+    y = A @ x + 1e-3 * np.random.default_rng(0).standard_normal(N)
+    return circulant_blur(N, 1.5), A, y
+
+
+def test_operator_matches_dense_blur(problem):
+    C, A, y = problem
+    np.testing.assert_allclose(C.to_dense(), A, atol=1e-15)
+    Y = np.stack([y, y[::-1]], axis=1)
+    np.testing.assert_allclose(C @ y, A @ y, atol=1e-12)
+    np.testing.assert_allclose(C.T @ Y, A.T @ Y, atol=1e-12)
+    np.testing.assert_allclose(C.T.to_dense(), A.T, atol=1e-15)
+
+
+def test_tikhonov_and_pseudoinverse_match_dense(problem):
+    C, A, y = problem
+    for lam in (1.0, 0.05):
+        np.testing.assert_allclose(tikhonov.reconstruct(C, y, lam),
+                                   tikhonov.reconstruct(A, y, lam), atol=1e-10)
+    np.testing.assert_allclose(pseudoinverse.reconstruct(C, y), pseudoinverse.reconstruct(A, y),
+                               rtol=1e-6)
+
+
+# Singular values of a real circulant come in pairs |λ_k| = |λ_{n-k}|; these
+# levels keep whole pairs, so the truncation is the same in either basis
+@pytest.mark.parametrize('k', [1, 3, 7, N])
+def test_tsvd_matches_dense(problem, k):
+    C, A, y = problem
+    expected = tsvd.reconstruct(A, y, k)
+    np.testing.assert_allclose(tsvd.reconstruct(C, y, k), expected,
+                               atol=1e-8 * np.abs(expected).max())
+
+
+def test_nsit_matches_dense(problem):
+    C, A, y = problem
+    x_c, h_c = nsit_with_morozov(C, y, 0.005, schedule_type='exp', max_iter=30)
+    x_d, h_d = nsit_with_morozov(A, y, 0.005, schedule_type='exp', max_iter=30, method='solve')
+    assert h_c['stopping_iter'] == h_d['stopping_iter'] < 29
+    np.testing.assert_allclose(h_c['residuals'], h_d['residuals'], rtol=1e-6)
+    np.testing.assert_allclose(x_c, x_d, atol=1e-8)
@@ -0,0 +1,26 @@
+"""Import-time regression test: hot modules stay light for worker startup."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SUITE = Path(__file__).resolve().parent.parent / 'benchmarks' / 'benchmark_suite.py'
+
+
+@pytest.fixture(scope='module')
+def suite():
+    spec = importlib.util.spec_from_file_location('benchmark_suite', SUITE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hot_imports_within_budget(suite):
+    results = suite.import_times(repeats=3)
+    assert set(results) == set(suite.HOT_IMPORTS)
+    heavy = {module: entry['heavy'] for module, entry in results.items() if entry['heavy']}
+    assert not heavy, f"hot imports pull in heavy modules: {heavy}"
+    slow = {module: round(entry['ms'], 1) for module, entry in results.items()
+            if entry['ms'] > suite.IMPORT_BUDGET_MS}
+    assert not slow, f"imports over {suite.IMPORT_BUDGET_MS:.0f} ms: {slow}"
@@ -0,0 +1,89 @@
+"""The learned Tikhonov risk is the empirical error of its reconstructions."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix, circulant_blur, separable_blur
+from forward_models.test_problems import factored_operator
+from reconstruction import tikhonov
+from reconstruction.learned import LearnedTikhonov
+
+N, B = 32, 200
+
+
+def _signals(shape, rng):
+    """Smooth random signals (or images) with a few jumps, one per row."""
+    X = np.cumsum(rng.standard_normal((B,) + shape), axis=1) / np.sqrt(shape[0])
+    return X + (rng.random((B,) + shape) > 0.97)
+
+
+def _pairs(A, shape, seed=0):
+    rng = np.random.default_rng(seed)
+    X = _signals(shape, rng)
+    if len(shape) == 2:
+        Y0 = np.stack([A @ x for x in X])
+    else:
+        Y0 = (A @ X.T).T
+    return X, Y0 + 0.02 * rng.standard_normal(Y0.shape)
+
+
+OPERATORS = {
+    'dense': (lambda: blur_matrix(N, 1.5), (N,)),
+    'circulant': (lambda: circulant_blur(N, 1.5), (N,)),
+    'factored': (lambda: factored_operator(np.geomspace(1.0, 1e-3, N), seed=0), (N,)),
+    'separable': (lambda: separable_blur((12, 10), 1.2), (12, 10)),
+}
+
+
+def _empirical(A, X, Y, solve):
+    if X.ndim == 3:
+        return np.mean([np.sum((solve(y) - x) ** 2) for x, y in zip(X, Y)])
+    return np.mean(np.sum((solve(Y.T).T - X) ** 2, axis=1))
+
+
+@pytest.mark.parametrize('kind', OPERATORS)
+def test_risk_matches_empirical_error(kind):
+    build, shape = OPERATORS[kind]
+    A = build()
+    X, Y = _pairs(A, shape)
+    model = LearnedTikhonov(A).fit(X, Y, batch_size=64)
+    assert model.risk() == pytest.approx(_empirical(A, X, Y, model.reconstruct), rel=1e-8)
+
+    lam, scalar_risk = model.best_scalar()
+    assert scalar_risk == pytest.approx(
+        _empirical(A, X, Y, lambda y: tikhonov.reconstruct(A, y, lam)), rel=1e-8)
+    # The per-value filter is optimal on the training set, so it beats any scalar λ
+    assert model.risk() <= scalar_risk
+
+
+def test_matrix_mode_matches_closed_form():
+    A = blur_matrix(N, 1.5)
+    X, Y = _pairs(A, (N,))
+    model = LearnedTikhonov(A, mode='matrix').fit(X, Y, batch_size=64)
+    mu = X.mean(axis=0)
+    cov = np.cov(X, rowvar=False, bias=True)
+    sigma2 = np.mean((Y - X @ A.T) ** 2)
+    y = Y[0]
+    expected = mu + cov @ A.T @ np.linalg.solve(A @ cov @ A.T + sigma2 * np.eye(N), y - A @ mu)
+    np.testing.assert_allclose(model.reconstruct(y), expected, rtol=1e-8, atol=1e-10)
+    assert model.noise_variance == pytest.approx(sigma2)
+
+
+@pytest.mark.parametrize('mode', ['filter', 'matrix'])
+def test_save_load_round_trip(tmp_path, mode):
+    A = blur_matrix(N, 1.5)
+    X, Y = _pairs(A, (N,))
+    full = LearnedTikhonov(A, mode).fit(X, Y)
+
+    # Save halfway, reload and resume: same model as one pass over everything
+    half = LearnedTikhonov(A, mode).fit(X[:B // 2], Y[:B // 2])
+    half.save(tmp_path / 'model.npz')
+    resumed = LearnedTikhonov.load(tmp_path / 'model.npz', A).fit(X[B // 2:], Y[B // 2:])
+    assert resumed.mode == mode
+    assert resumed.count == full.count == B
+    np.testing.assert_allclose(resumed.reconstruct(Y.T), full.reconstruct(Y.T), rtol=1e-8, atol=1e-10)
+
+    full.save(tmp_path / 'full.npz')
+    loaded = LearnedTikhonov.load(tmp_path / 'full.npz', A)
+    np.testing.assert_array_equal(loaded.reconstruct(Y.T), full.reconstruct(Y.T))
+    if mode == 'filter':
+        assert loaded.risk() == full.risk()
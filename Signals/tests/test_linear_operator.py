@@ -0,0 +1,60 @@
+"""Matrix-free operators agree with their dense matrices, also through the SVD cache."""
+
+import numpy as np
+import pytest
+from forward_models.linear_operator import KernelOperator, ToeplitzOperator
+from forward_models.test_problems import PROBLEMS
+from reconstruction import tikhonov
+
+
+def _grid(n):
+    h = 1.0 / n
+    return (np.arange(n) + 0.5) * h, h
+
+
+def test_kernel_sweep_is_not_served_a_stale_svd():
+    t, h = _grid(64)
+    for depth in (0.1, 0.25, 0.5):
+        A = KernelOperator(lambda s, u: depth * (depth ** 2 + (s - u) ** 2) ** -1.5, t, t, h)
+        dense = A.to_dense()
+        y = dense @ np.sin(np.pi * t)
+        x = tikhonov.reconstruct(A, y, 1e-6)
+        x_dense = tikhonov.reconstruct(dense, y, 1e-6)
+        np.testing.assert_allclose(x, x_dense, atol=1e-8 * np.abs(x_dense).max())
+
+
+def test_kernels_differing_off_any_sample_grid():
+    # Same values on rows and columns 0, 7, 15, 23 and 31; different elsewhere
+    t, h = _grid(32)
+    grid = t[[0, 7, 15, 23, 31]]
+
+    def base(s, u):
+        return np.exp(-(s - u) ** 2 / 0.02)
+
+    def bumped(s, u):
+        off = ~np.isin(s, grid) & ~np.isin(u, grid)
+        return base(s, u) + 0.5 * off * np.exp(-(s + u - 1.0) ** 2 / 0.01)
+
+    y = base(t[:, None], t[None, :]) @ np.sin(np.pi * t) * h
+    for kernel in (base, bumped):
+        A = KernelOperator(kernel, t, t, h)
+        x = tikhonov.reconstruct(A, y, 1e-3)
+        np.testing.assert_allclose(x, tikhonov.reconstruct(A.to_dense(), y, 1e-3), rtol=1e-8, atol=1e-10)
+
+
+@pytest.mark.parametrize('name', sorted(PROBLEMS))
+def test_classic_problems_match_dense(name):
+    A, x = PROBLEMS[name](48)
+    dense = PROBLEMS[name](48, dense=True)[0]
+    X = np.random.default_rng(0).standard_normal((48, 3))
+    np.testing.assert_allclose(A @ X, dense @ X, atol=1e-12 * np.abs(dense).max() * 48)
+    np.testing.assert_allclose(A.T @ X, dense.T @ X, atol=1e-12 * np.abs(dense).max() * 48)
+
+
+def test_toeplitz_matches_dense():
+    rng = np.random.default_rng(1)
+    A = ToeplitzOperator(rng.standard_normal(7), rng.standard_normal(5))
+    dense = A.to_dense()
+    x = rng.standard_normal(5)
+    np.testing.assert_allclose(A @ x, dense @ x, atol=1e-12)
+    np.testing.assert_allclose(A.T @ (A @ x), dense.T @ (dense @ x), atol=1e-12)
@@ -0,0 +1,68 @@
+"""Batched reconstruction matches solving each column on its own."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix
+from reconstruction import pseudoinverse, tikhonov, tsvd
+from reconstruction.fnsit import fnsit_reconstruct, fnsit_reconstruct_batch
+from reconstruction.inner_solvers import conjugate_gradient
+from reconstruction.nsit import nsit_with_morozov, nsit_with_morozov_batch
+
+N, B = 40, 5
+
+
+@pytest.fixture
+def problem():
+    A = blur_matrix(N, 1.5)
+    t = np.linspace(0, 1, N)
+    X = np.sin(2 * np.pi * np.outer(t, 1 + np.arange(B)))
+    rng = np.random.default_rng(0)
+    # Different noise per column, so the columns stop at different iterations
+    Y = A @ X + rng.standard_normal((N, B)) * np.geomspace(1e-3, 3e-2, B)
+    return A, Y
+
+
+def test_direct_methods_match_per_column(problem):
+    A, Y = problem
+    for solve in (lambda y: tikhonov.reconstruct(A, y, 0.05),
+                  lambda y: tsvd.reconstruct(A, y, 15),
+                  lambda y: pseudoinverse.reconstruct(A, y)):
+        X = solve(Y)
+        for b in range(B):
+            np.testing.assert_allclose(X[:, b], solve(Y[:, b]), rtol=1e-8, atol=1e-10)
+
+
+@pytest.mark.parametrize('method', ['spectral', 'solve'])
+def test_nsit_batch_matches_per_column(problem, method):
+    A, Y = problem
+    X, history = nsit_with_morozov_batch(A, Y, 0.02, schedule_type='exp', max_iter=40, method=method)
+    assert len(set(history['stopping_iter'])) > 1
+    for b in range(B):
+        x, h = nsit_with_morozov(A, Y[:, b], 0.02, schedule_type='exp', max_iter=40, method=method)
+        assert history['stopping_iter'][b] == h['stopping_iter']
+        np.testing.assert_allclose(X[:, b], x, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize('inner_solver', ['gd', 'cg'])
+def test_fnsit_batch_matches_per_column(problem, inner_solver):
+    A, Y = problem
+    kwargs = dict(alpha0=1.0, q=0.7, max_iter=60, tau=1.0, delta=0.02,
+                  step_size=None, inner_solver=inner_solver)
+    X, history = fnsit_reconstruct_batch(A, Y, **kwargs)
+    assert len(set(history['final_iteration'])) > 1
+    for b in range(B):
+        x, h = fnsit_reconstruct(A, Y[:, b], **kwargs)
+        assert history['final_iteration'][b] == h['final_iteration']
+        np.testing.assert_allclose(X[:, b], x, rtol=1e-6, atol=1e-8)
+
+
+def test_block_cg_matches_per_column():
+    rng = np.random.default_rng(1)
+    M = rng.standard_normal((20, 20))
+    M = M @ M.T + 20 * np.eye(20)
+    R = rng.standard_normal((20, 3)) * [1.0, 1e-3, 1e3]
+    Z, _ = conjugate_gradient(lambda z: M @ z, R, tol=1e-12)
+    for b in range(3):
+        z, _ = conjugate_gradient(lambda z: M @ z, R[:, b], tol=1e-12)
+        np.testing.assert_allclose(Z[:, b], z, rtol=1e-8)
+        np.testing.assert_allclose(M @ Z[:, b], R[:, b], rtol=1e-9)
@@ -0,0 +1,31 @@
+"""The spectral Monte-Carlo study matches reconstructing each realization."""
+
+import numpy as np
+from forward_models.blur_operator import blur_matrix
+from evaluation.noise_sensitivity import noise_sensitivity
+from noise_models.noise import noise_streams
+from reconstruction import nsit, tikhonov
+
+
+def test_matches_direct_reconstruction():
+    n, levels, seed = 64, [0.01, 0.05], 3
+    A = blur_matrix(n, 2.0)
+    t = np.linspace(0, 1, n)
+    x = np.sin(2 * np.pi * t) + (t > 0.5)
+    results = noise_sensitivity(A, x, levels, 1, tikh_lambdas=[0.05], nsit_schedules=['sqrt'],
+                                nsit_max_iter=200, seed=seed)
+
+    y_clean = A @ x
+    for li, (delta, rng) in enumerate(zip(levels, noise_streams(len(levels), seed))):
+        sigma = delta * np.linalg.norm(y_clean) / np.sqrt(n)
+        assert results['sigmas'][li] == sigma
+        y = y_clean + sigma * rng.standard_normal((1, n))[0]
+
+        x_tikh = tikhonov.reconstruct(A, y, 0.05)
+        expected = np.linalg.norm(x_tikh - x) / np.linalg.norm(x)
+        assert np.isclose(results['tikhonov']['rel_error']['mean'][li, 0], expected)
+
+        x_nsit, history = nsit.nsit_with_morozov(A, y, delta, max_iter=200, store_every=None)
+        expected = np.linalg.norm(x_nsit - x) / np.linalg.norm(x)
+        assert results['nsit']['iterations']['mean'][li, 0] == history['stopping_iter'] + 1
+        assert np.isclose(results['nsit']['rel_error']['mean'][li, 0], expected)
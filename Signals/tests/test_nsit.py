@@ -0,0 +1,56 @@
+"""Spectral NSIT agrees with the per-iteration solve, across scan blocks."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix
+from reconstruction import nsit
+from reconstruction.nsit import nsit_with_morozov, nsit_with_morozov_batch
+
+
+def _problem(n=40, batch=None, seed=0):
+    A = blur_matrix(n, sigma=2.0)
+    t = np.linspace(0, 1, n)
+    rng = np.random.default_rng(seed)
+    X = np.sin(2 * np.pi * np.outer(t, 1 + np.arange(batch or 1)))
+    Y = A @ X + 1e-3 * rng.standard_normal(X.shape)
+    return A, (Y[:, 0] if batch is None else Y)
+
+
+@pytest.mark.parametrize('block', [3, 64], ids=['small-blocks', 'one-block'])
+@pytest.mark.parametrize('noise_level', [0.005, 1e-9], ids=['morozov', 'max-iter'])
+def test_spectral_matches_solve(monkeypatch, block, noise_level):
+    monkeypatch.setattr(nsit, '_BLOCK', block)
+    A, y = _problem()
+    kwargs = dict(schedule_type='exp', max_iter=20, store_every=3)
+    x_s, h_s = nsit_with_morozov(A, y, noise_level, method='spectral', **kwargs)
+    x_d, h_d = nsit_with_morozov(A, y, noise_level, method='solve', **kwargs)
+    assert h_s['stopping_iter'] == h_d['stopping_iter']
+    np.testing.assert_allclose(h_s['residuals'], h_d['residuals'], rtol=1e-6)
+    np.testing.assert_allclose(h_s['alphas'], h_d['alphas'])
+    np.testing.assert_allclose(x_s, x_d, rtol=1e-6, atol=1e-8)
+    assert len(h_s['x']) == len(h_d['x'])
+    for a, b in zip(h_s['x'], h_d['x']):
+        np.testing.assert_allclose(a, b, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize('block', [3, 64], ids=['small-blocks', 'one-block'])
+def test_spectral_batch_matches_solve(monkeypatch, block):
+    monkeypatch.setattr(nsit, '_BLOCK', block)
+    A, Y = _problem(batch=4)
+    kwargs = dict(schedule_type='exp', max_iter=20)
+    X_s, h_s = nsit_with_morozov_batch(A, Y, 0.005, method='spectral', **kwargs)
+    X_d, h_d = nsit_with_morozov_batch(A, Y, 0.005, method='solve', **kwargs)
+    np.testing.assert_array_equal(h_s['stopping_iter'], h_d['stopping_iter'])
+    assert len(set(h_s['stopping_iter'])) > 1
+    np.testing.assert_allclose(h_s['residuals'], h_d['residuals'], rtol=1e-6)
+    np.testing.assert_allclose(X_s, X_d, rtol=1e-6, atol=1e-8)
+
+
+def test_decay_blocks_match_cumulative_product():
+    s2 = np.linspace(0.01, 4, 7)
+    alphas = 2.0 ** -np.arange(10)
+    dense = np.ones((7, 11))
+    np.cumprod(alphas / (s2[:, None] + alphas), axis=1, out=dense[:, 1:])
+    scanned = np.concatenate([D for _, D in nsit._decay_blocks(s2, alphas, block=4)], axis=1)
+    np.testing.assert_allclose(scanned, dense)
+    np.testing.assert_allclose(nsit._decay_columns(s2, alphas, [0, 5, 10]), dense[:, [0, 5, 10]])
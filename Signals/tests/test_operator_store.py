@@ -0,0 +1,25 @@
+"""On-disk operator store: entries are reused and broken ones repaired."""
+
+import numpy as np
+from forward_models.blur_operator import blur_matrix
+from reconstruction.operator_store import OperatorStore
+
+
+def test_svd_roundtrip(tmp_path):
+    store = OperatorStore(tmp_path)
+    U, s, Vt = store.svd('blur_matrix', n=32, sigma=2.0)
+    np.testing.assert_allclose((U * s) @ Vt, blur_matrix(32, 2.0), atol=1e-12)
+    assert OperatorStore(tmp_path).info()['entries'] == 1
+
+
+def test_invalid_entry_is_replaced(tmp_path):
+    store = OperatorStore(tmp_path)
+    entry = tmp_path / store.key('blur_matrix', n=32, sigma=2.0)
+    entry.mkdir()
+    (entry / 'operator.npy').write_bytes(b'partial')
+    (entry / 'meta.json').write_text('{not json')
+
+    A = store.operator('blur_matrix', n=32, sigma=2.0)
+    assert isinstance(A, np.memmap)
+    np.testing.assert_array_equal(A, blur_matrix(32, 2.0))
+    assert store.info()['entries'] == 1
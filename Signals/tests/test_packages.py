@@ -0,0 +1,18 @@
+"""Every module of a package is reachable through its lazy ``__getattr__``."""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+PACKAGES = ('forward_models', 'noise_models', 'signal_generation', 'reconstruction',
+            'evaluation', 'pipeline')
+
+
+@pytest.mark.parametrize('name', PACKAGES)
+def test_submodules_listed(name):
+    package = importlib.import_module(name)
+    modules = {path.stem for path in Path(package.__file__).parent.glob('*.py')} - {'__init__'}
+    assert modules <= set(package._SUBMODULES)
+    for module in modules:
+        assert getattr(package, module).__name__ == f'{name}.{module}'
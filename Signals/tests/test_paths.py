@@ -0,0 +1,64 @@
+"""Regularization paths agree with one solve per parameter."""
+
+import numpy as np
+import pytest
+from evaluation.error_metrics import mse, path_metrics, psnr, relative_error
+from forward_models.blur_operator import blur_matrix, circulant_blur
+from forward_models.test_problems import factored_operator
+from reconstruction import tikhonov, tsvd
+
+N = 32
+
+
+def _operator(kind):
+    if kind == 'dense':
+        return blur_matrix(N, 1.5)
+    if kind == 'circulant':
+        return circulant_blur(N, 1.5)
+    return factored_operator(np.geomspace(1.0, 1e-4, N), seed=0)
+
+
+@pytest.fixture
+def y():
+    t = np.linspace(0, 1, N)
+    return np.sin(2 * np.pi * t) + 0.01 * np.random.default_rng(0).standard_normal(N)
+
+
+@pytest.mark.parametrize('kind', ['dense', 'circulant', 'factored'])
+def test_tikhonov_path_matches_per_lambda(kind, y):
+    A = _operator(kind)
+    lams = [1.0, 0.1, 1e-3]
+    X = tikhonov.reconstruct_path(A, y, lams)
+    assert X.shape == (N, len(lams))
+    for j, lam in enumerate(lams):
+        np.testing.assert_allclose(X[:, j], tikhonov.reconstruct(A, y, lam), atol=1e-10)
+
+
+def test_tikhonov_path_matches_normal_equations(y):
+    A = blur_matrix(N, 1.5)
+    lams = [1.0, 0.1, 1e-2]
+    X = tikhonov.reconstruct_path(A, y, lams)
+    for j, lam in enumerate(lams):
+        expected = np.linalg.solve(A.T @ A + lam**2 * np.eye(N), A.T @ y)
+        np.testing.assert_allclose(X[:, j], expected, atol=1e-8)
+
+
+@pytest.mark.parametrize('kind', ['dense', 'circulant', 'factored'])
+def test_tsvd_path_matches_per_k(kind, y):
+    A = _operator(kind)
+    ks = [0, 1, 5, 17, N]
+    X = tsvd.reconstruct_path(A, y, ks)
+    assert X.shape == (N, len(ks))
+    for j, k in enumerate(ks):
+        expected = tsvd.reconstruct(A, y, k) if k else np.zeros(N)
+        np.testing.assert_allclose(X[:, j], expected, atol=1e-8 * np.abs(expected).max(initial=1.0))
+
+
+def test_path_metrics_match_scalar_metrics(y):
+    x_true = np.cos(np.linspace(0, 3, N))
+    X = x_true[:, None] + np.outer(y, [0.0, 0.1, 1.0])
+    metrics = path_metrics(x_true, X)
+    for j in range(X.shape[1]):
+        assert metrics['mse'][j] == pytest.approx(mse(x_true, X[:, j]))
+        assert metrics['rel_error'][j] == pytest.approx(relative_error(x_true, X[:, j]))
+        assert metrics['psnr'][j] == pytest.approx(psnr(x_true, X[:, j]))
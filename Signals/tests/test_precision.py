@@ -0,0 +1,60 @@
+"""float32 storage propagates through the solvers and tracks the float64 result."""
+
+import numpy as np
+import pytest
+from evaluation.precision_report import compare_precision, format_precision_report
+from forward_models.blur_operator import blur_matrix, circulant_blur
+from reconstruction import tikhonov, tsvd
+from reconstruction.fnsit import fnsit_reconstruct
+from reconstruction.nsit import nsit_with_morozov
+from reconstruction.precision import norm, storage_dtype
+
+N = 64
+
+
+def _signal():
+    t = np.linspace(0, 1, N)
+    return np.sin(2 * np.pi * t) + (t > 0.5)
+
+
+def test_storage_dtype_and_norm():
+    a32, a64 = np.ones(3, np.float32), np.ones(3)
+    assert storage_dtype(a32, a32) == np.float32
+    assert storage_dtype(a32, a64) == np.float64
+    assert storage_dtype(np.ones(3, int)) == np.float64
+    big = np.full(10, 1e30, dtype=np.float32)
+    assert norm(big).dtype == np.float64
+    assert norm(big) == pytest.approx(np.sqrt(10) * 1e30, rel=1e-6)
+
+
+SOLVERS = {
+    'tikhonov': lambda A, y: tikhonov.reconstruct(A, y, 0.05),
+    'tsvd': lambda A, y: tsvd.reconstruct(A, y, 20),
+    'nsit': lambda A, y: nsit_with_morozov(A, y, 0.01, max_iter=30, store_every=None)[0],
+    'nsit-solve': lambda A, y: nsit_with_morozov(A, y, 0.01, max_iter=30, method='solve')[0],
+    'fnsit': lambda A, y: fnsit_reconstruct(A, y, 1.0, 0.8, 30, 1.0, 0.01, step_size=None)[0],
+}
+
+
+@pytest.mark.parametrize('build', [blur_matrix, circulant_blur], ids=['dense', 'circulant'])
+@pytest.mark.parametrize('solver', SOLVERS, ids=str)
+def test_float32_solutions_stay_float32(build, solver):
+    x = _signal()
+    A64, A32 = build(N, 1.5), build(N, 1.5, dtype=np.float32)
+    y64 = A64 @ x + 0.01 * np.random.default_rng(0).standard_normal(N)
+    x64 = SOLVERS[solver](A64, y64)
+    x32 = SOLVERS[solver](A32, y64.astype(np.float32))
+    assert x64.dtype == np.float64
+    assert x32.dtype == np.float32
+    assert np.linalg.norm(x32 - x64) / np.linalg.norm(x64) < 1e-3
+
+
+def test_precision_report():
+    rows = compare_precision(lambda dt: blur_matrix(N, 1.5, dtype=dt), _signal(), 0.01, lam=0.05)
+    assert [row['method'] for row in rows] == ['tikhonov', 'tsvd', 'nsit']
+    for row in rows:
+        assert row['rel_diff'] < 0.01 * row['rel_error_float64']
+        assert row['operator_bytes_float32'] * 2 == row['operator_bytes_float64']
+    nsit = rows[-1]
+    assert nsit['stopping_iter_float32'] == nsit['stopping_iter_float64']
+    assert 'tikhonov' in format_precision_report(rows)
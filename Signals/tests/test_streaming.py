@@ -0,0 +1,78 @@
+"""Streaming reconstruction matches the in-memory solve and shuts down cleanly."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix
+from pipeline.streaming import prefetch, reconstruct_file, stream_reconstruct
+from reconstruction import tikhonov
+
+
+@pytest.fixture
+def files(tmp_path):
+    A = blur_matrix(32, 2.0)
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((40, 32))
+    Y = X @ A.T + 1e-3 * rng.standard_normal((40, 32))
+    np.save(tmp_path / 'x.npy', X)
+    np.save(tmp_path / 'y.npy', Y)
+    return A, Y, str(tmp_path / 'y.npy'), str(tmp_path / 'x.npy'), str(tmp_path / 'out.npy')
+
+
+@pytest.mark.parametrize('depth', [0, 1, 3])
+def test_matches_block_solve(files, depth):
+    A, Y, y_path, x_path, out_path = files
+    summary = reconstruct_file(y_path, out_path, lambda B: tikhonov.reconstruct(A, B, 0.05),
+                               chunk_size=7, truth_path=x_path, prefetch_depth=depth)
+    assert summary['frames'] == 40 and 'mean_rel_error' in summary
+    np.testing.assert_allclose(np.load(out_path), tikhonov.reconstruct(A, Y.T, 0.05).T, atol=1e-12)
+
+
+def test_early_close_does_not_hang(files):
+    A, _, y_path, _, out_path = files
+    stage = stream_reconstruct(y_path, out_path, lambda B: tikhonov.reconstruct(A, B, 0.05),
+                               chunk_size=20, prefetch_depth=1)
+    next(stage)
+    # The reader has queued the last chunk and is waiting to hand over the end
+    time.sleep(0.3)
+    closer = threading.Thread(target=stage.close, daemon=True)
+    closer.start()
+    closer.join(5)
+    assert not closer.is_alive()
+
+
+def test_error_in_last_chunk_does_not_hang(files):
+    A, _, y_path, _, out_path = files
+    calls = []
+
+    def failing(B):
+        calls.append(B.shape[1])
+        if len(calls) == 3:
+            time.sleep(0.3)
+            raise RuntimeError('reconstructor failed')
+        return tikhonov.reconstruct(A, B, 0.05)
+
+    outcome = []
+
+    def run():
+        try:
+            reconstruct_file(y_path, out_path, failing, chunk_size=10, prefetch_depth=1)
+        except RuntimeError as exc:
+            outcome.append(exc)
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert outcome and 'failed' in str(outcome[0])
+
+
+def test_prefetch_forwards_source_errors():
+    def source():
+        yield 1
+        raise ValueError('bad chunk')
+
+    with pytest.raises(ValueError, match='bad chunk'):
+        list(prefetch(source(), depth=2))
@@ -0,0 +1,75 @@
+"""Telemetry callbacks see every NSIT/FNSIT iteration and can stop it."""
+
+import numpy as np
+import pytest
+from forward_models.blur_operator import blur_matrix, circulant_blur
+from reconstruction.fnsit import fnsit_reconstruct
+from reconstruction.nsit import nsit_with_morozov
+from reconstruction.telemetry import Budget, Profiler, Recorder, chain
+
+N = 48
+
+
+def _problem(circulant=False):
+    t = np.linspace(0, 1, N)
+    A = blur_matrix(N, 1.5)
+    y = A @ (np.sin(2 * np.pi * t) + (t > 0.5)) + 0.01 * np.random.default_rng(0).standard_normal(N)
+    return (circulant_blur(N, 1.5) if circulant else A), y
+
+
+RUNS = {
+    'spectral': lambda cb, **kw: nsit_with_morozov(*_problem(), 0.01, callback=cb, **kw),
+    'solve': lambda cb, **kw: nsit_with_morozov(*_problem(), 0.01, method='solve', callback=cb, **kw),
+    'circulant': lambda cb, **kw: nsit_with_morozov(*_problem(True), 0.01, callback=cb, **kw),
+}
+
+
+@pytest.mark.parametrize('run', RUNS)
+def test_recorder_matches_history(run):
+    recorder = Recorder(capacity=2)
+    x, history = RUNS[run](recorder, max_iter=60)
+    x_plain, _ = RUNS[run](None, max_iter=60)
+    records = recorder.records
+    np.testing.assert_array_equal(records['iteration'], np.arange(history['stopping_iter'] + 1))
+    np.testing.assert_allclose(records['residual'], history['residuals'])
+    np.testing.assert_allclose(records['alpha'], history['alphas'])
+    assert np.all(np.diff(records['elapsed']) >= 0)
+    np.testing.assert_array_equal(x, x_plain)
+
+
+@pytest.mark.parametrize('run', RUNS)
+def test_callback_stop_keeps_that_iterate(run):
+    x, history = RUNS[run](lambda k, *_: k == 2, max_iter=60)
+    assert history['stopping_iter'] == 2
+    assert len(history['residuals']) == 3
+    x_short, _ = RUNS[run](None, max_iter=3, tau=0.0)
+    np.testing.assert_allclose(x, x_short, rtol=1e-10, atol=1e-12)
+
+
+def test_matvec_budget_stops_solve_path():
+    A, y = _problem()
+    recorder = Recorder()
+    _, history = nsit_with_morozov(A, y, 1e-9, method='solve', max_iter=50,
+                                   callback=chain(recorder, Budget(matvecs=10)))
+    matvecs = recorder.records['matvecs']
+    assert matvecs[-1] >= 10 > matvecs[-2]
+    assert history['stopping_iter'] == recorder.count - 1 < 49
+
+
+def test_chain_calls_every_callback():
+    calls = []
+    combined = chain(lambda *a: calls.append('a') or True, lambda *a: calls.append('b'))
+    assert combined(0, 1.0, 1.0, 0, 0, 0.0)
+    assert calls == ['a', 'b']
+
+
+def test_profiler_on_fnsit():
+    A, y = _problem()
+    profiler = Profiler()
+    _, history = fnsit_reconstruct(A, y, 1.0, 0.8, 20, 1.0, 1e-9, inner_solver='cg',
+                                   callback=profiler)
+    summary = profiler.summary()
+    assert summary['iterations'] == history['final_iteration'] + 1 == 20
+    assert summary['matvecs'] > 0
+    assert summary['inner_iterations'] > 0
+    assert len(profiler.iteration_times()) == 20